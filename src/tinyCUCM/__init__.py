@@ -1,4 +1,7 @@
+from .async_client import AsyncCucmClient
 from .client import CucmClient
-from .decorators import cucm_logging
+from .decorators import cucm_logging, cucm_sql_cache
 from .logger import logger
+from .manager import CucmClusterManager
+from .records import CucmSqlRecords
 from .settings import CucmSettings
@@ -0,0 +1,245 @@
+import re
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from .exceptions import CucmBadRequestError, CucmObjNotFoundError
+
+
+""" ######################################################### """
+""" *************** TINY CUCM NUMBER ALLOCATOR ************** """
+""" ######################################################### """
+
+
+CUCM_NUMBER_PATTERN = re.compile(r"^(\D*)(\d+)$")
+
+
+class CucmNumberAllocator:
+
+    """
+        tinyCUCM Number Allocator. Free Directory Numbers Of The Range & Partition.
+
+        * Used numbers (lines mapped to a device or a line group) are kept in a bitmap: one bit per number,
+          a 10k DID block takes 1.25 KB.
+        * Allocated numbers are reserved locally until `reservation_ttl` expires or they're released, concurrent
+          callers never get the same number.
+        * Candidates are checked against the publisher before they're handed out, numbers used since the last
+          refresh are marked & skipped.
+        """
+
+    def __init__(
+        self,
+        start: str,
+        end: str,
+        partition: Optional[str],
+        fetch: Callable[[str], Iterable[dict]],
+        refresh_interval: float = 300,
+        reservation_ttl: float = 600
+    ):
+
+        """
+        :param start:               First Number Of The Range (`1000`, `\\+4930100000`)
+        :param end:                 Last Number Of The Range, Same Prefix & Length As The First Number
+        :param partition:           Route Partition Name, None For Lines Without Partition
+        :param fetch:               Remote Rows Getter: `fetch(sql_query) -> Iterable[dict]`
+        :param refresh_interval:    The Bitmap Is Rebuilt On Allocation If It's Older (Seconds)
+        :param reservation_ttl:     Reservation Lifetime (Seconds)
+        """
+
+        start_match, end_match = CUCM_NUMBER_PATTERN.match(start), CUCM_NUMBER_PATTERN.match(end)
+        if not start_match or not end_match or start_match[1] != end_match[1] \
+                or len(start_match[2]) != len(end_match[2]) or int(start_match[2]) > int(end_match[2]):
+            raise CucmBadRequestError(
+                f"BadRequest error occurred. Invalid number range: {repr(start)} - {repr(end)}."
+            )
+
+        self.__prefix = start_match[1]
+        self.__width = len(start_match[2])
+        self.__first = int(start_match[2])
+        self.__size = int(end_match[2]) - self.__first + 1
+        self.__start = start
+        self.__end = end
+        self.__partition = partition
+        self.__fetch = fetch
+        self.__refresh_interval = refresh_interval
+        self.__reservation_ttl = reservation_ttl
+
+        self.__lock = threading.RLock()
+        self.__used = bytearray((self.__size + 7) // 8)
+        self.__reserved: dict[int, float] = {}      # {index: expires_at}
+        self.__refreshed_at = 0.0
+
+    @property
+    def size(self) -> int:
+
+        """
+        Range Size Property.
+        :return:
+        """
+
+        return self.__size
+
+    @property
+    def free_count(self) -> int:
+
+        """
+        Number Of Free (Not Used & Not Reserved) Numbers Property.
+        :return:
+        """
+
+        with self.__lock:
+            self.__cucm_reservations_expire()
+            used = sum(bin(byte).count("1") for byte in self.__used)
+            reserved = sum(1 for index in self.__reserved if not self.__cucm_bit_get(index))
+            return self.__size - used - reserved
+
+    def __cucm_bit_get(self, index: int) -> bool:
+        return bool(self.__used[index >> 3] & (1 << (index & 7)))
+
+    def __cucm_bit_set(self, index: int, is_used: bool):
+        if is_used:
+            self.__used[index >> 3] |= 1 << (index & 7)
+        else:
+            self.__used[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __cucm_number(self, index: int) -> str:
+        return f"{self.__prefix}{self.__first + index:0{self.__width}d}"
+
+    def __cucm_index(self, number: str) -> Optional[int]:
+        match = CUCM_NUMBER_PATTERN.match(number or "")
+        if not match or match[1] != self.__prefix or len(match[2]) != self.__width:
+            return None
+        index = int(match[2]) - self.__first
+        return index if 0 <= index < self.__size else None
+
+    def __cucm_reservations_expire(self):
+        now = time.time()
+        for index in [index for index, expires_at in self.__reserved.items() if expires_at <= now]:
+            del self.__reserved[index]
+
+    def __cucm_used_query(self, condition: str) -> str:
+
+        """
+        Used Numbers SQL Query: Lines Of The Partition Mapped To A Device or A Line Group.
+        :param condition:   Numbers Condition
+        :return:
+        """
+
+        partition = "np.fkroutepartition IS NULL" if self.__partition is None \
+            else "rp.name = '{}'".format(self.__partition.replace("'", "''"))
+        return """SELECT np.dnorpattern
+                    FROM numplan np
+               LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition
+                   WHERE {con}
+                     AND {par}
+                     AND np.tkpatternusage = '2'
+                     AND (EXISTS (SELECT 1 FROM devicenumplanmap dnmp WHERE dnmp.fknumplan = np.pkid)
+                          OR EXISTS (SELECT 1 FROM linegroupnumplanmap lgnmp WHERE lgnmp.fknumplan = np.pkid))
+                ORDER BY np.dnorpattern""".format(con=condition, par=partition)
+
+    def refresh(self, numbers: Optional[Iterable[str]] = None):
+
+        """
+        Refresh The Used Numbers Bitmap.
+        :param numbers:     Numbers To Re-Check (Incremental Refresh), The Whole Range If None
+        :return:
+        """
+
+        if numbers is None:
+            rows = self.__fetch(self.__cucm_used_query(
+                "np.dnorpattern BETWEEN '{start}' AND '{end}'".format(
+                    start=self.__start.replace("'", "''"), end=self.__end.replace("'", "''")
+                )
+            ))
+            used = bytearray((self.__size + 7) // 8)
+            for row in rows:
+                index = self.__cucm_index(row["dnorpattern"])
+                if index is not None:
+                    used[index >> 3] |= 1 << (index & 7)
+            with self.__lock:
+                self.__used = used
+                self.__refreshed_at = time.time()
+            return
+
+        indexes = {
+            index: self.__cucm_number(index)
+            for index in (self.__cucm_index(number) for number in numbers) if index is not None
+        }
+        if not indexes:
+            return
+        rows = self.__fetch(self.__cucm_used_query(
+            "np.dnorpattern IN ({})".format(
+                ", ".join("'{}'".format(number.replace("'", "''")) for number in indexes.values())
+            )
+        ))
+        used = {self.__cucm_index(row["dnorpattern"]) for row in rows}
+        with self.__lock:
+            for index in indexes:
+                self.__cucm_bit_set(index, index in used)
+
+    def __cucm_candidates(self, count: int, is_contiguous: bool) -> list[int]:
+
+        """
+        Find & Reserve Free Numbers.
+        :param count:           Number Of Numbers
+        :param is_contiguous:   Numbers Must Be Consecutive
+        :return:
+        """
+
+        candidates = []
+        for byte_index, byte in enumerate(self.__used):
+            if byte == 0xFF and not is_contiguous:
+                continue
+            for index in range(byte_index << 3, min((byte_index + 1) << 3, self.__size)):
+                if self.__cucm_bit_get(index) or index in self.__reserved:
+                    if is_contiguous:
+                        candidates.clear()
+                    continue
+                candidates.append(index)
+                if len(candidates) == count:
+                    expires_at = time.time() + self.__reservation_ttl
+                    self.__reserved.update(dict.fromkeys(candidates, expires_at))
+                    return candidates
+        return []
+
+    def allocate(self, count: int = 1, is_contiguous: bool = False) -> tuple[str, ...]:
+
+        """
+        Allocate Free Numbers Atomically. The Numbers Stay Reserved Until The TTL Expires or They're Released.
+        :param count:           Number Of Numbers
+        :param is_contiguous:   Numbers Must Be Consecutive
+        :return:                Allocated Numbers
+        """
+
+        if time.time() - self.__refreshed_at > self.__refresh_interval:
+            self.refresh()
+
+        while True:
+            with self.__lock:
+                self.__cucm_reservations_expire()
+                candidates = self.__cucm_candidates(count, is_contiguous)
+            if not candidates:
+                raise CucmObjNotFoundError(
+                    f"NotFound error occurred. No {count} free number(s) in the range "
+                    f"{repr(self.__start)} - {repr(self.__end)}, partition {repr(self.__partition)}."
+                )
+
+            # Candidates Used Since The Last Refresh Are Marked & Replaced
+            self.refresh(numbers=[self.__cucm_number(index) for index in candidates])
+            with self.__lock:
+                if not any(self.__cucm_bit_get(index) for index in candidates):
+                    return tuple(self.__cucm_number(index) for index in candidates)
+                for index in candidates:
+                    self.__reserved.pop(index, None)
+
+    def release(self, numbers: Iterable[str]):
+
+        """
+        Release The Reservations (For Example If The Provisioning Failed).
+        :param numbers:     Allocated Numbers
+        :return:
+        """
+
+        with self.__lock:
+            for number in numbers:
+                self.__reserved.pop(self.__cucm_index(number), None)
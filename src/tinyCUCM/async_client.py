@@ -0,0 +1,880 @@
+import asyncio
+import re
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from functools import wraps
+from itertools import chain
+from typing import Any, Dict, Optional, Tuple, Union
+from zeep.helpers import serialize_object
+
+from .cache import CucmSqlCache, cucm_sql_cache_key
+from .ccs_models import CucmCcsDoControlModel, CucmCcsDoDeploymentModel
+from .client import (
+    CUCM_SQL_PAGE_TOTAL_CACHE_SIZE,
+    CUCM_SQL_PAGE_TOTAL_TTL,
+    CUCM_SQL_SEARCH_METHODS,
+    CUCM_SQL_STREAM_CHUNK_SIZE,
+    CucmClient,
+    cucm_ris_phone_resp_normalizing,
+    cucm_sql_list_batch_split,
+    cucm_sql_response_to_tuple,
+    cucm_sql_search_aggregate_resp,
+    cucm_sql_search_page_query,
+    cucm_sql_search_page_resp,
+    cucm_sql_search_prepare,
+)
+from .coercion import cucm_sql_coerce
+from .decorators import cucm_async_logging
+from .exceptions import CucmBadRequestError, CucmConnectionError
+from .logger import logger
+from .records import CucmSqlRecords
+from .replica import CucmSqlReplica
+from .ris_models import CucmRisGetCtiModel
+from .settings import CucmSettings
+from .sql_models import CucmSqlBaseSearchModel
+from .sql_queries import CUCM_SQL_LIST_QUERIES, CucmSqlSearchQuery, cucm_sql_list_union, cucm_sql_skip_first
+
+
+""" ######################################################### """
+""" **************** TINY CUCM ASYNCIO CLIENT *************** """
+""" ######################################################### """
+
+
+# AXL Coroutine Methods: {method_name: (AXL operation, response path)}, The Raw Response If The Path Is None
+CUCM_ASYNC_AXL_OPERATIONS = {
+    "axlAddCallPickupGroup": ("addCallPickupGroup", None),
+    "axlAddDeviceProfile": ("addDeviceProfile", None),
+    "axlAddLine": ("addLine", None),
+    "axlAddLineGroup": ("addLineGroup", None),
+    "axlAddPhone": ("addPhone", None),
+    "axlAddRemoteDestinationProfile": ("addRemoteDestinationProfile", None),
+    "axlAddTranslationPattern": ("addTransPattern", None),
+    "axlAddUser": ("addUser", None),
+    "axlDoAuthenticateUser": ("doAuthenticateUser", None),
+    "axlDoDeviceLogin": ("doDeviceLogin", None),
+    "axlDoDeviceLogout": ("doDeviceLogout", None),
+    "axlDoLdapSync": ("doLdapSync", None),
+    "axlGetCallPickupGroup": ("getCallPickupGroup", ("return", "callPickupGroup")),
+    "axlGetDeviceProfile": ("getDeviceProfile", ("return", "deviceProfile")),
+    "axlGetLine": ("getLine", ("return", "line")),
+    "axlGetLineGroup": ("getLineGroup", ("return", "lineGroup")),
+    "axlGetPhone": ("getPhone", ("return", "phone")),
+    "axlGetRemoteDestination": ("getRemoteDestination", ("return", "remoteDestination")),
+    "axlGetRemoteDestinationProfile": ("getRemoteDestinationProfile", ("return", "remoteDestinationProfile")),
+    "axlGetTranslationPattern": ("getTransPattern", ("return", "transPattern")),
+    "axlGetUser": ("getUser", ("return", "user")),
+    "axlListChange": ("listChange", ("return",)),
+    "axlRemoveCallPickupGroup": ("removeCallPickupGroup", None),
+    "axlRemoveDeviceProfile": ("removeDeviceProfile", None),
+    "axlRemoveLine": ("removeLine", None),
+    "axlRemoveLineGroup": ("removeLineGroup", None),
+    "axlRemovePhone": ("removePhone", None),
+    "axlRemoveRemoteDestination": ("removeRemoteDestination", None),
+    "axlRemoveRemoteDestinationProfile": ("removeRemoteDestinationProfile", None),
+    "axlRemoveTranslationPattern": ("removeTransPattern", None),
+    "axlRemoveUser": ("removeUser", None),
+    "axlResetPhone": ("resetPhone", None),
+    "axlRestartPhone": ("restartPhone", None),
+    "axlUpdateCallPickupGroup": ("updateCallPickupGroup", None),
+    "axlUpdateDeviceProfile": ("updateDeviceProfile", None),
+    "axlUpdateLine": ("updateLine", None),
+    "axlUpdateLineGroup": ("updateLineGroup", None),
+    "axlUpdatePhone": ("updatePhone", None),
+    "axlUpdateRemoteDestination": ("updateRemoteDestination", None),
+    "axlUpdateRemoteDestinationProfile": ("updateRemoteDestinationProfile", None),
+    "axlUpdateTranslationPattern": ("updateTransPattern", None),
+    "axlUpdateUser": ("updateUser", None),
+}
+
+# RIS `selectCmDeviceExt` Max Returned Devices Per Request
+CUCM_ASYNC_RIS_DEVICES_LIMIT = 1000
+
+# Search Methods Response: Rows (Tuple or CucmSqlRecords), Rows Async Iterator (`is_stream_resp`), Page (`page_size`)
+# or Counts Per Group (`group_by`)
+CucmAsyncSqlSearchResp = Union[tuple[dict, ...], CucmSqlRecords, AsyncIterator[dict], dict[str, Any], None]
+
+
+def cucm_async_timeout(cucm_method):
+
+    """
+    Call Timeout Decorator Of The Coroutine Methods. The `call_timeout` Keyword (Seconds) Overrides The Client
+    `call_timeout`. A Timed Out Call Is Cancelled (The HTTP Request Is Aborted) & `CucmConnectionError` Is Raised.
+    :param cucm_method: CUCM Coroutine Method
+    :return:
+    """
+
+    @wraps(cucm_method)
+    async def wrapper(self, *args, call_timeout: Optional[float] = None, **kwargs):
+
+        timeout = call_timeout if call_timeout is not None else self._cucm_call_timeout
+        try:
+            return await asyncio.wait_for(cucm_method(self, *args, **kwargs), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise CucmConnectionError(
+                f"Connection has been failed. {repr(cucm_method.__name__)} call timeout ({timeout}s)."
+            )
+
+    return wrapper
+
+
+class AsyncCucmClient(CucmSettings):
+
+    """
+        tinyCUCM Asyncio Client. Cisco Unified Call Manager API Methods Collection For asyncio Applications.
+
+        * Requests are sent by zeep `AsyncClient` over one pooled `httpx.AsyncClient` (`pip install tinyCUCM[async]`),
+          no worker threads: concurrent calls share the event loop & the connection pool (`session_pool_maxsize`).
+        * The `axl*`, `ccs*` & `ris*` methods, the `sqlSearch*` search methods, the `sqlList*` & `sqlListBatch`
+          methods & the `sqlExecuteQuery`, `sqlExecuteQueryChunked` & `sqlUpdateQuery` methods of the `CucmClient`
+          are coroutine methods with the same arguments. The search queries, conditions & responses are shared with
+          the `CucmClient`, the streamed search (`is_stream_resp`) returns an async iterator (`async for`).
+        * The replica (`sql_replica_path`) & the reference data cache (`sql_cache`) are used like by the `CucmClient`,
+          replica queries run in a worker thread. The predefined `sqlGet*` & `sqlValidate*` queries, the replica
+          refresh & sync & the export are available with the `CucmClient` only.
+        * `call_timeout` (seconds) limits the call, set it per call as a keyword argument or per client.
+          A timed out or cancelled call aborts its HTTP request. Search methods apply it to each request.
+        * WSDL files are parsed on first use of the service, synchronously (`wsdl_snapshot` makes it fast).
+        """
+
+    def __init__(self, call_timeout: Optional[float] = None, **kwargs):
+        super(AsyncCucmClient, self).__init__(**kwargs)
+        self._cucm_call_timeout = call_timeout
+
+        # Total Counts Of The Paged Searches: {count_query: total}
+        self.__cucm_sql_page_totals = CucmSqlCache(maxsize=CUCM_SQL_PAGE_TOTAL_CACHE_SIZE)
+
+    async def __aenter__(self) -> "AsyncCucmClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+
+        """
+        Close The Pooled Connections.
+        :return:
+        """
+
+        await self._cucm_async_close()
+
+    async def _cucm_axl_operation(self, operation: str, path: Optional[tuple], **kwargs) -> Any:
+
+        """
+        AXL Operation Request.
+        :param operation:   AXL Operation Name
+        :param path:        Response Path (Serialized To Dictionary), The Raw Response If None
+        :param kwargs:      AXL Operation Arguments
+        :return:
+        """
+
+        resp_raw = await getattr(self._axl_async, operation)(**kwargs)
+        if path is None:
+            return resp_raw
+        for key in path:
+            resp_raw = resp_raw[key]
+        return serialize_object(resp_raw, dict)
+
+    async def __cucm_sql_execute(
+        self,
+        sql_query: str,
+        is_compact_resp: bool = False
+    ) -> Union[tuple[dict, ...], CucmSqlRecords, None]:
+
+        """
+        Base AXL SQL Execute Method For Request To The Cisco UCM DB Informix.
+        The Query Is Recorded By The SQL Profiler If It's Enabled.
+        :param sql_query:       SQL Query Expression
+        :param is_compact_resp: Return The Compact Container (CucmSqlRecords)
+        :return:
+        """
+
+        profiler = self._cucm_sql_profiler
+        response = resp_result = None
+        is_error = True
+        started_at = time.perf_counter()
+        try:
+            response = await self._axl_sql_async.executeSQLQuery(sql=sql_query)
+            resp_result = cucm_sql_response_to_tuple(
+                response, is_compact_resp=is_compact_resp, history=self._cucm_history_received
+            )
+            is_error = False
+            return resp_result
+        finally:
+            if profiler is not None:
+                profiler.record(
+                    sql_query=sql_query,
+                    elapsed=time.perf_counter() - started_at,
+                    response_bytes=len(response.content) if response is not None else 0,
+                    rows=len(resp_result or ()),
+                    is_error=is_error
+                )
+
+    def __cucm_sql_search_replica(self, validated_data: CucmSqlBaseSearchModel) -> Union[CucmSqlReplica, None]:
+
+        """
+        Local Replica Of The Search, None If The Publisher Is Requested.
+        :param validated_data:  Validated Search Model
+        :return:
+        """
+
+        replica = self._cucm_sql_replica
+        if validated_data.is_replica and replica is not None and replica.is_fresh:
+            return replica
+        return None
+
+    async def __cucm_sql_search_chunks(
+        self,
+        sql_query: str,
+        chunk_size: int,
+        replica: Union[CucmSqlReplica, None],
+        is_compact_resp: bool = False,
+        call_timeout: Optional[float] = None
+    ) -> AsyncIterator[Union[tuple[dict, ...], CucmSqlRecords]]:
+
+        """
+        Search Rows In Chunks: Publisher Requests Paged By `SKIP` & `FIRST` or Replica Pages (Worker Thread).
+        :param sql_query:       SQL `SELECT` Query Expression With The `ORDER BY` Clause
+        :param chunk_size:      Rows Per Chunk
+        :param replica:         Local Replica, The Publisher Is Requested If None
+        :param is_compact_resp: Publisher Chunks Are Compact Containers (CucmSqlRecords)
+        :param call_timeout:    Timeout Of Each Request In Seconds, Client `call_timeout` If None
+        :return:
+        """
+
+        skip = 0
+        while True:
+            if replica is not None:
+                chunk = await asyncio.to_thread(replica.execute_page, sql_query=sql_query, size=chunk_size, offset=skip)
+            else:
+                chunk = await self.sqlExecuteQuery(
+                    cucm_sql_skip_first(sql_query=sql_query, skip=skip, first=chunk_size),
+                    is_compact_resp=is_compact_resp,
+                    call_timeout=call_timeout
+                )
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < chunk_size:
+                return
+            skip += chunk_size
+
+    async def __cucm_sql_search_stream(
+        self,
+        sql_query: str,
+        validated_data: CucmSqlBaseSearchModel,
+        schema: dict[str, str],
+        call_timeout: Optional[float] = None
+    ) -> AsyncIterator[dict]:
+
+        """
+        SQL Search Stream Method. Rows Are Fetched In Chunks On Iteration (From The Replica If It's Built),
+        Only One Chunk Is Held In Memory.
+        :param sql_query:       SQL `SELECT` Query Expression
+        :param validated_data:  Validated Search Model
+        :param schema:          Result Column Types Of The Search Query
+        :param call_timeout:    Timeout Of Each Request In Seconds, Client `call_timeout` If None
+        :return:
+        """
+
+        chunks = self.__cucm_sql_search_chunks(
+            sql_query=sql_query,
+            chunk_size=validated_data.chunk_size or CUCM_SQL_STREAM_CHUNK_SIZE,
+            replica=self.__cucm_sql_search_replica(validated_data),
+            call_timeout=call_timeout
+        )
+        async for chunk in chunks:
+            for row in cucm_sql_coerce(chunk, schema) if validated_data.is_typed_resp else chunk:
+                yield row
+
+    async def __cucm_sql_search_total(
+        self,
+        sql_query: str,
+        replica: Union[CucmSqlReplica, None],
+        call_timeout: Optional[float] = None
+    ) -> int:
+
+        """
+        Total Count Of The Search, Cached Per Count Query.
+        :param sql_query:       SQL Count Query Expression (`SELECT COUNT(*) AS total ...`)
+        :param replica:         Local Replica, The Publisher Is Requested If None
+        :param call_timeout:    Timeout Of The Request In Seconds, Client `call_timeout` If None
+        :return:
+        """
+
+        key = f"{'replica' if replica is not None else 'publisher'}:{sql_query}"
+        is_hit, total = self.__cucm_sql_page_totals.get(key)
+        if is_hit:
+            return total
+
+        if replica is not None:
+            rows = await asyncio.to_thread(replica.execute, sql_query=sql_query)
+        else:
+            rows = await self.sqlExecuteQuery(sql_query, call_timeout=call_timeout)
+        total = int(rows[0]["total"]) if rows else 0
+        self.__cucm_sql_page_totals.set(key, total, ttl=CUCM_SQL_PAGE_TOTAL_TTL)
+        return total
+
+    async def __cucm_sql_search_page(
+        self,
+        query: CucmSqlSearchQuery,
+        condition: str,
+        validated_data: CucmSqlBaseSearchModel,
+        call_timeout: Optional[float] = None
+    ) -> dict[str, Any]:
+
+        """
+        SQL Search Page Method (See `CucmClient`). The Page & The Total Count Are Requested Concurrently.
+        :param query:           Search Query
+        :param condition:       Search Condition (`WHERE` Expression)
+        :param validated_data:  Validated Search Model
+        :param call_timeout:    Timeout Of Each Request In Seconds, Client `call_timeout` If None
+        :return:                `{"rows": rows or None, "total": int, "next_cursor": str or None}`
+        """
+
+        page_query, sql_query = cucm_sql_search_page_query(
+            query=query, condition=condition, validated_data=validated_data
+        )
+
+        # One More Row Tells If The Next Page Exists
+        page_size = validated_data.page_size
+        replica = self.__cucm_sql_search_replica(validated_data)
+        if replica is not None:
+            rows_request = asyncio.to_thread(
+                replica.execute_page, sql_query=sql_query, size=page_size + 1, offset=validated_data.page_offset
+            )
+        else:
+            rows_request = self.sqlExecuteQuery(
+                cucm_sql_skip_first(sql_query=sql_query, skip=validated_data.page_offset, first=page_size + 1),
+                call_timeout=call_timeout
+            )
+        rows, total = await asyncio.gather(
+            rows_request,
+            self.__cucm_sql_search_total(
+                sql_query=query.render_count(condition=condition, fields=validated_data.fields),
+                replica=replica,
+                call_timeout=call_timeout
+            )
+        )
+
+        resp_result, next_cursor = cucm_sql_search_page_resp(
+            rows=rows, page_query=page_query, validated_data=validated_data, schema=query.schema
+        )
+        return {"rows": resp_result, "total": total, "next_cursor": next_cursor}
+
+    async def _cucm_sql_search(
+        self,
+        method_name: str,
+        call_timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> CucmAsyncSqlSearchResp:
+
+        """
+        Search Method Of The `CUCM_SQL_SEARCH_METHODS`: The Kwargs Are Validated By The Search Model, The Query Runs
+        Against The Local Replica If It's Built. One Page Is Returned If The `page_size` Is Set, The Counts Per Group
+        If The `group_by` Is Set, The Rows Async Iterator If The `is_stream_resp` Is Set.
+        :param method_name:     Search Method Name
+        :param call_timeout:    Timeout Of Each Request In Seconds, Client `call_timeout` If None
+        :param kwargs:          Search Method Kwargs
+        :return:
+        """
+
+        query, condition, validated_data = cucm_sql_search_prepare(method_name, **kwargs)
+        if validated_data.page_size:
+            return await self.__cucm_sql_search_page(
+                query=query, condition=condition, validated_data=validated_data, call_timeout=call_timeout
+            )
+
+        replica = self.__cucm_sql_search_replica(validated_data)
+        if validated_data.group_by is not None:
+            sql_query = query.render_aggregate(condition=condition, group_by=validated_data.group_by)
+            if replica is not None:
+                rows = await asyncio.to_thread(replica.execute, sql_query=sql_query)
+            else:
+                rows = await self.sqlExecuteQuery(sql_query, call_timeout=call_timeout)
+            return cucm_sql_search_aggregate_resp(rows=rows, group_by=validated_data.group_by)
+
+        sql_query = query.render(condition=condition, fields=validated_data.fields)
+        if validated_data.is_stream_resp:
+            return self.__cucm_sql_search_stream(
+                sql_query=sql_query, validated_data=validated_data, schema=query.schema, call_timeout=call_timeout
+            )
+
+        is_compact_resp = validated_data.is_compact_resp
+        if replica is not None:
+            resp_result = await asyncio.to_thread(
+                replica.execute, sql_query=sql_query, is_compact_resp=is_compact_resp
+            )
+        elif validated_data.chunk_size:
+            chunks = [
+                chunk async for chunk in self.__cucm_sql_search_chunks(
+                    sql_query=sql_query,
+                    chunk_size=validated_data.chunk_size,
+                    replica=None,
+                    is_compact_resp=is_compact_resp,
+                    call_timeout=call_timeout
+                )
+            ]
+            if is_compact_resp:
+                resp_result = CucmSqlRecords.concat(chunks) or None
+            else:
+                resp_result = tuple(chain.from_iterable(chunks)) or None
+        else:
+            resp_result = await self.sqlExecuteQuery(
+                sql_query, is_compact_resp=is_compact_resp, call_timeout=call_timeout
+            )
+        return cucm_sql_coerce(resp_result, query.schema) if validated_data.is_typed_resp else resp_result
+
+    async def _cucm_sql_list(self, method_name: str, call_timeout: Optional[float] = None) -> Any:
+
+        """
+        List Method Of The `CUCM_SQL_LIST_QUERIES`, Served From The Reference Data Cache If It's Enabled.
+        :param method_name:     List Method Name
+        :param call_timeout:    Timeout Of The Request In Seconds, Client `call_timeout` If None
+        :return:
+        """
+
+        cache = self._cucm_sql_cache
+        key = cucm_sql_cache_key(method_name, (), {})
+        if cache is not None:
+            is_hit, resp = cache.get(key)
+            if is_hit:
+                logger.debug(f"@ CUCM {repr(method_name)} Method @ - Cache Hit.")
+                return resp
+
+        resp = await self.sqlExecuteQuery(CUCM_SQL_LIST_QUERIES[method_name].render(), call_timeout=call_timeout)
+        if cache is not None:
+            cache.set(key, resp, ttl=self.__cucm_sql_list_ttl(method_name))
+        return resp
+
+    def __cucm_sql_list_ttl(self, method_name: str) -> float:
+
+        """
+        Reference Data Cache TTL Of The List Method (The `CucmClient` Method Default or The `sql_cache_ttl`).
+        :param method_name: List Method Name
+        :return:
+        """
+
+        return self._cucm_sql_cache_ttl(method_name, getattr(CucmClient, method_name).cucm_sql_cache_ttl)
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def axlAllMethods(self) -> tuple[str, ...]:
+
+        """
+        AXL All Methods Collection.
+        :return:
+        """
+
+        return tuple(sorted([str(method[0]) for method in self._axl_async]))
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def ccsAllMethods(self) -> tuple[str, ...]:
+
+        """
+        CCS (Control Center Services) All Methods Collection.
+        :return:
+        """
+
+        return tuple(sorted([str(method[0]) for method in self._cucm_ccs_async_custom_node_service(None)]))
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def risAllMethods(self) -> tuple[str, ...]:
+
+        """
+        RIS (Real-time Information Server) All Methods Collection.
+        :return:
+        """
+
+        return tuple(sorted([str(method[0]) for method in self._ris_async.service]))
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def axlAddRemoteDestination(self, **kwargs: dict) -> dict:
+
+        """
+        AXL Add Object Method (See `CucmClient.axlAddRemoteDestination`).
+        :param kwargs:      Required Fields:
+                            `kwargs = {"remoteDestination": {...}}`
+        :return:
+        """
+
+        # Due to an issue with the AXL schema vs. implementation (11.5/12.5 - CSCvq98025)
+        # we have to remove the nil <dualModeDeviceName> element Zeep creates
+        req = self._axl_async_client.create_message(self._axl_async, "addRemoteDestination", **kwargs)
+        for element in req.xpath("//dualModeDeviceName"):
+            element.getparent().remove(element)
+        return await self._cucm_async_transport.post_xml(
+            f"https://{self._cucm_publisher_property}:8443/axl/",
+            envelope=req,
+            headers=None
+        )
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def axlGetAny(self, method: str, **kwargs: dict):
+
+        """
+        AXL Get Any Object Method.
+        :param method:      AXL Get Method Name
+        :param kwargs:      Required Fields:
+                            `kwargs = {"uuid": "uuid.UUID"}`
+                            or
+                            `kwargs = {"name": "str"}`
+                            or any other key for get method
+        :return:
+        """
+
+        if "get" not in method:
+            raise AttributeError(f"Method {repr(method)} is not in allowed get methods.")
+        return await self._cucm_axl_operation(method, ("return",), **kwargs)
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def ccsDoControlServices(self, control_command: str, service_names: list, node_fqdn: str = None):
+
+        """
+        CCS (Control Center Services) Do Control Services Method.
+        :param control_command: Control Command: `Start`, `Stop`, `Restart`
+        :param service_names:   Service Names Collection
+        :param node_fqdn:       Cluster Node FQDN or IP Address, Control the Pub If the Node isn't Specified
+        :return:
+        """
+
+        client = self._cucm_ccs_async_custom_node_service(node_fqdn=node_fqdn)
+        validated_data = CucmCcsDoControlModel(**{
+            "ControlType": control_command,
+            "ServiceList": {"item": service_names}
+        }).model_dump()
+        return tuple(
+            serialize_object(await client.soapDoControlServices(validated_data), dict)["ServiceInfoList"]["item"]
+        )
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def ccsDoServiceDeployment(
+        self,
+        deploy_command: str,
+        service_names: list,
+        node_fqdn: str = None
+    ) -> tuple[dict]:
+
+        """
+        CCS (Control Center Services) Do Service Deployment Method.
+        :param deploy_command:  Deploy Command: `Deploy`, `UnDeploy`
+        :param service_names:   Service Names Collection
+        :param node_fqdn:       Cluster Node FQDN or IP Address, Deploy on the Pub If the Node isn't Specified
+        :return:
+        """
+
+        client = self._cucm_ccs_async_custom_node_service(node_fqdn=node_fqdn)
+        validated_data = CucmCcsDoDeploymentModel(**{
+            "DeployType": deploy_command,
+            "ServiceList": {"item": service_names}
+        }).model_dump()
+        return tuple(
+            serialize_object(await client.soapDoServiceDeployment(validated_data), dict)["ServiceInfoList"]["item"]
+        )
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def ccsGetProductInfoList(self, node_fqdn: str = None) -> tuple[dict]:
+
+        """
+        CCS (Control Center Services) Get Product Information Method.
+        :param node_fqdn:       Cluster Node FQDN or IP Address, Return Status From the Pub If the Node isn't Specified
+        :return:
+        """
+
+        client = self._cucm_ccs_async_custom_node_service(node_fqdn=node_fqdn)
+        return await client.getProductInformationList("")
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def ccsGetServiceStatus(self, service_name: str = "", node_fqdn: str = None) -> tuple[dict]:
+
+        """
+        CCS (Control Center Services) Get Service Status Method.
+        :param service_name:    Service Name, Return All Services if None
+        :param node_fqdn:       Cluster Node FQDN or IP Address, Return Status From the Pub If the Node isn't Specified
+        :return:
+        """
+
+        client = self._cucm_ccs_async_custom_node_service(node_fqdn=node_fqdn)
+        return tuple(
+            serialize_object(await client.soapGetServiceStatus(service_name), dict)["ServiceInfoList"]["item"]
+        )
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def ccsGetStaticServiceList(self, node_fqdn: str = None) -> tuple[dict]:
+
+        """
+        CCS (Control Center Services) Get Static Service Method.
+        :param node_fqdn:       Cluster Node FQDN or IP Address, Return Status From the Pub If the Node isn't Specified
+        :return:
+        """
+
+        client = self._cucm_ccs_async_custom_node_service(node_fqdn=node_fqdn)
+        return tuple(serialize_object(await client.soapGetStaticServiceList(""), dict)["item"])
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def risGetCti(self, **kwargs: Union[dict, ...]) -> dict:
+
+        """
+        RIS (Real-time Information Server) Get CTI Method (See `CucmClient.risGetCti`).
+        :param kwargs:  `kwargs = {"cti_mgr_class": "str", "collection_name": "str", "items_collection": [...]}`
+        :return:
+        """
+
+        validated_data = CucmRisGetCtiModel(**kwargs).model_dump()
+        criteria = {
+            "MaxReturnedItems": 1000,
+            "CtiMgrClass": validated_data["cti_mgr_class"].value,
+            "NodeName": None,
+            "AppItems": {"item": []},
+            "DevNames": {"item": []},
+            "DirNumbers": {"item": []},
+            validated_data["collection_name"]: {"item": validated_data["items_collection"]}
+        }
+        return await self._ris_async.service.selectCtiItem("", self._ris_async_factory.CtiSelectionCriteria(**criteria))
+
+    async def __cucm_ris_select_phones(self, phone_names: list[str]) -> dict:
+
+        """
+        RIS (Real-time Information Server) Select Phones Request, Up To `CUCM_ASYNC_RIS_DEVICES_LIMIT` Phones.
+        :param phone_names: Phone Names
+        :return:
+        """
+
+        criteria = self._ris_async_factory.CmSelectionCriteria(
+            MaxReturnedDevices=CUCM_ASYNC_RIS_DEVICES_LIMIT,
+            DeviceClass="Phone",
+            Model=255,
+            Status="Any",
+            NodeName=None,
+            SelectBy="Name",
+            SelectItems={"item": [{"Item": name} for name in phone_names]},
+            Protocol="Any",
+            DownloadStatus="Any"
+        )
+        return await self._ris_async.service.selectCmDeviceExt("", criteria)
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def risGetPhone(self, phone_name: str, is_raw_resp: bool = False) -> dict:
+
+        """
+        RIS (Real-time Information Server) Get Phone Method.
+        :param phone_name:  Phone Name
+        :param is_raw_resp: Return The Raw RIS Response
+        :return:
+        """
+
+        resp_raw = await self.__cucm_ris_select_phones([phone_name])
+        if is_raw_resp:
+            return resp_raw
+        return cucm_ris_phone_resp_normalizing(resp_raw=resp_raw)[0]
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def risGetPhones(
+        self,
+        devices_collection: Iterable[dict, ...],
+        is_raw_resp: bool = False
+    ) -> tuple[dict, ...]:
+
+        """
+        RIS (Real-time Information Server) Get Phones Method. The Requests Of 1000 Phones Run Concurrently.
+        :param devices_collection:  Devices Collection: `({"name": "str", ...}, ...)`, The `ris` Key Is Added
+        :param is_raw_resp:         Return The Raw RIS Responses
+        :return:
+        """
+
+        names = [device["name"] for device in devices_collection]
+        resp_raw_collection = await asyncio.gather(*(
+            self.__cucm_ris_select_phones(names[item:item + CUCM_ASYNC_RIS_DEVICES_LIMIT])
+            for item in range(0, len(names), CUCM_ASYNC_RIS_DEVICES_LIMIT)
+        ))
+        if is_raw_resp:
+            return tuple(resp_raw_collection)
+
+        temp_norm_collection = {
+            item["DeviceName"]: item
+            for resp_raw in resp_raw_collection
+            for item in cucm_ris_phone_resp_normalizing(resp_raw=resp_raw)
+        }
+        for device in devices_collection:
+            # Device not found (Not exist, Off-line, Unsupported Class or Type (RDP, UDP and ect.))
+            device["ris"] = temp_norm_collection.get(device["name"]) or {
+                "DeviceName": None,
+                "Status": None,
+                "Model": None,
+                "Product": None,
+                "IP": None,
+                "NodeName": None,
+                "ActiveLoadID": None,
+                "InactiveLoadID": None,
+            }
+        return tuple(devices_collection)
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def sqlUpdateQuery(self, sql_query: str):
+
+        """
+        SQL Update Request to the Cisco UCM DB Informix.
+        :param sql_query:   SQL `UPDATE` Query Expression
+        :return:
+        """
+
+        return await self._axl_async.executeSQLUpdate(sql=sql_query)
+
+    @cucm_async_timeout
+    @cucm_async_logging
+    async def sqlExecuteQuery(
+        self,
+        sql_query: str,
+        is_compact_resp: bool = False,
+        schema: Optional[dict[str, str]] = None
+    ) -> Union[tuple[dict, ...], CucmSqlRecords, None]:
+
+        """
+        SQL Select Request to the Cisco UCM DB Informix.
+        :param sql_query:       SQL `SELECT` Query Expression
+        :param is_compact_resp: Return The Compact Container (CucmSqlRecords) Instead Of The Tuple Of Dictionaries
+        :param schema:          Column Types `{"column": "type"}` (`bool`, `datetime`, `int`, `uuid`), Strings If None
+        :return:
+        """
+
+        return cucm_sql_coerce(
+            await self.__cucm_sql_execute(sql_query=sql_query, is_compact_resp=is_compact_resp), schema
+        )
+
+    async def sqlExecuteQueryChunked(
+        self,
+        sql_query: str,
+        chunk_size: int = 5000,
+        call_timeout: Optional[float] = None
+    ) -> AsyncIterator[dict]:
+
+        """
+        SQL Select Request to the Cisco UCM DB Informix, Rows Are Fetched In Chunks & Yielded One By One
+        (`async for`). The query must have an `ORDER BY` clause giving a stable (total) order of the rows.
+        :param sql_query:       SQL `SELECT` Query Expression
+        :param chunk_size:      Rows Per Request
+        :param call_timeout:    Timeout Of Each Chunk Request In Seconds, Client `call_timeout` If None
+        :return:
+        """
+
+        if not re.match(r"\s*SELECT\s", sql_query, flags=re.IGNORECASE) \
+                or re.search(r"\bUNION\b", sql_query, flags=re.IGNORECASE):
+            raise CucmBadRequestError("BadRequest error occurred. Only a single `SELECT` query can be chunked.")
+
+        skip = 0
+        while True:
+            chunk = await self.sqlExecuteQuery(
+                cucm_sql_skip_first(sql_query=sql_query, skip=skip, first=chunk_size),
+                call_timeout=call_timeout
+            )
+            if not chunk:
+                return
+            for row in chunk:
+                yield row
+            if len(chunk) < chunk_size:
+                return
+            skip += chunk_size
+
+    async def sqlListBatch(
+        self,
+        *method_names: str,
+        call_timeout: Optional[float] = None
+    ) -> Dict[str, Optional[Tuple[Dict[str, Any]]]]:
+
+        """
+        Batch Of The `sqlList*` Reads In One Request (See `CucmClient.sqlListBatch`).
+        :param method_names:    List Method Names: `sqlListDevicePool`, `sqlListRoutePartition`, ...
+        :param call_timeout:    Timeout Of The Request In Seconds, Client `call_timeout` If None
+        :return:                `{method_name: rows or None}`
+        """
+
+        unknown = [method_name for method_name in method_names if method_name not in CUCM_SQL_LIST_QUERIES]
+        if unknown:
+            raise CucmBadRequestError(
+                f"BadRequest error occurred. Invalid list methods: {unknown}. "
+                f"Available: {tuple(CUCM_SQL_LIST_QUERIES)}."
+            )
+
+        method_names = list(dict.fromkeys(method_names))
+        cache = self._cucm_sql_cache
+        resp_result = {}
+        pending = []
+        for method_name in method_names:
+            if cache is not None:
+                is_hit, resp = cache.get(cucm_sql_cache_key(method_name, (), {}))
+                if is_hit:
+                    resp_result[method_name] = resp
+                    continue
+            pending.append(method_name)
+
+        if pending:
+            queries = [CUCM_SQL_LIST_QUERIES[method_name] for method_name in pending]
+            rows = await self.sqlExecuteQuery(cucm_sql_list_union(queries), call_timeout=call_timeout)
+            for method_name, resp in zip(pending, cucm_sql_list_batch_split(queries=queries, rows=rows)):
+                resp_result[method_name] = resp
+                if cache is not None:
+                    cache.set(cucm_sql_cache_key(method_name, (), {}), resp, ttl=self.__cucm_sql_list_ttl(method_name))
+        return {method_name: resp_result[method_name] for method_name in method_names}
+
+
+def _cucm_async_axl_method(method_name: str, operation: str, path: Optional[tuple]) -> Callable:
+
+    async def wrapper(self: AsyncCucmClient, **kwargs: Union[dict, ...]) -> Optional[Dict[str, Any]]:
+        return await self._cucm_axl_operation(operation, path, **kwargs)
+
+    wrapper.__name__ = method_name
+    wrapper.__qualname__ = f"AsyncCucmClient.{method_name}"
+    wrapper.__doc__ = f"""
+        AXL `{operation}` Method. The Arguments Are The Same As Of The `CucmClient.{method_name}`.
+        :return:
+        """
+    return cucm_async_timeout(cucm_async_logging(wrapper))
+
+
+def _cucm_async_sql_search_method(method_name: str) -> Callable:
+
+    async def wrapper(self: AsyncCucmClient, call_timeout: Optional[float] = None, **kwargs: Any):
+        return await self._cucm_sql_search(method_name, call_timeout=call_timeout, **kwargs)
+
+    wrapper.__name__ = method_name
+    wrapper.__qualname__ = f"AsyncCucmClient.{method_name}"
+    wrapper.__doc__ = getattr(CucmClient, method_name).__doc__
+    return wrapper
+
+
+def _cucm_async_sql_list_method(method_name: str) -> Callable:
+
+    async def wrapper(self: AsyncCucmClient, call_timeout: Optional[float] = None) -> Optional[Tuple[Dict[str, Any]]]:
+        return await self._cucm_sql_list(method_name, call_timeout=call_timeout)
+
+    wrapper.__name__ = method_name
+    wrapper.__qualname__ = f"AsyncCucmClient.{method_name}"
+    wrapper.__doc__ = f"""
+        SQL List Object(s) Method, Served From The Reference Data Cache If It's Enabled.
+        See `CucmClient.{method_name}`.
+        :return:
+        """
+    return wrapper
+
+
+for _method_name, (_operation, _path) in CUCM_ASYNC_AXL_OPERATIONS.items():
+    setattr(AsyncCucmClient, _method_name, _cucm_async_axl_method(_method_name, _operation, _path))
+
+for _method_name in CUCM_SQL_SEARCH_METHODS:
+    setattr(AsyncCucmClient, _method_name, _cucm_async_sql_search_method(_method_name))
+
+for _method_name in CUCM_SQL_LIST_QUERIES:
+    setattr(AsyncCucmClient, _method_name, _cucm_async_sql_list_method(_method_name))
@@ -0,0 +1,185 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .logger import logger
+
+
+""" ######################################################### """
+""" **************** TINY CUCM SQL LIST CACHE *************** """
+""" ######################################################### """
+
+
+def cucm_sql_cache_key(method_name: str, args: tuple, kwargs: dict) -> str:
+
+    """
+    Cache Key Of The Method Call: `method_name` or `method_name:[args, kwargs]`.
+    :param method_name: CucmClient Method Name
+    :param args:        Method Args
+    :param kwargs:      Method Kwargs
+    :return:
+    """
+
+    if not args and not kwargs:
+        return method_name
+    return f"{method_name}:{json.dumps([args, kwargs], sort_keys=True, default=str)}"
+
+
+def _cucm_sql_cache_copy(resp: Any) -> Any:
+
+    """
+    Copy Of The Cached Rows, Callers May Modify Their Rows.
+    :param resp:    Method Response: `tuple[dict, ...]`, `dict` or None
+    :return:
+    """
+
+    if isinstance(resp, (tuple, list)):
+        return tuple(dict(row) if isinstance(row, dict) else row for row in resp)
+    if isinstance(resp, dict):
+        return dict(resp)
+    return resp
+
+
+class CucmSqlCache:
+
+    """
+        tinyCUCM SQL Cache. Time-To-Live & Least-Recently-Used Cache Of The Reference Data (`sqlList*`) Methods.
+
+        * Every entry expires after the TTL of its method.
+        * The least recently used entry is evicted when the cache is full (`maxsize` entries).
+        * With `persist_path` the entries are stored in a JSON file and loaded by the next processes until they
+          expire. The file is bound to the publisher, entries of other clusters are ignored.
+        """
+
+    def __init__(self, maxsize: int = 128, persist_path: Optional[str] = None, persist_key: Optional[str] = None):
+
+        """
+        :param maxsize:         Max Number Of Entries
+        :param persist_path:    JSON File Path, Persistence Is Disabled If None
+        :param persist_key:     Owner Of The Persisted Entries (Publisher FQDN)
+        """
+
+        self.__entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()    # {key: (expires_at, resp)}
+        self.__lock = threading.RLock()
+        self.__maxsize = maxsize
+        self.__persist_path = persist_path
+        self.__persist_key = persist_key
+
+        if self.__persist_path:
+            self.__cucm_cache_load()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+
+        """
+        Get The Cached Response.
+        :param key: Cache Key
+        :return:    `(is_hit, resp)`
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, resp = entry
+            if expires_at <= time.time():
+                del self.__entries[key]
+                return False, None
+            self.__entries.move_to_end(key)
+        return True, _cucm_sql_cache_copy(resp)
+
+    def set(self, key: str, resp: Any, ttl: float):
+
+        """
+        Cache The Response.
+        :param key:     Cache Key
+        :param resp:    Method Response
+        :param ttl:     Time-To-Live In Seconds
+        :return:
+        """
+
+        if ttl <= 0:
+            return
+        with self.__lock:
+            self.__entries[key] = (time.time() + ttl, _cucm_sql_cache_copy(resp))
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+            if self.__persist_path:
+                self.__cucm_cache_save()
+
+    def invalidate(self, *method_names: str) -> int:
+
+        """
+        Drop The Entries Of The Methods.
+        :param method_names:    CucmClient Method Names, All Entries If Empty
+        :return:                Number Of Dropped Entries
+        """
+
+        with self.__lock:
+            if method_names:
+                keys = [
+                    key for key in self.__entries
+                    if key in method_names or key.split(":", 1)[0] in method_names
+                ]
+            else:
+                keys = list(self.__entries)
+            for key in keys:
+                del self.__entries[key]
+            if keys and self.__persist_path:
+                self.__cucm_cache_save()
+        return len(keys)
+
+    def __cucm_cache_load(self):
+
+        """
+        Load The Persisted Entries, Expired, Foreign or Broken Entries Are Ignored.
+        :return:
+        """
+
+        log_message = "@ CUCM SQL Cache @ - {message}"
+
+        if not os.path.isfile(self.__persist_path):
+            return
+        try:
+            with open(self.__persist_path, "r", encoding="utf-8") as file:
+                content = json.load(file)
+        except (OSError, ValueError) as err:
+            logger.warning(log_message.format(message=f"{repr(self.__persist_path)}, cache is broken: {repr(err)}."))
+            return
+
+        if content.get("key") != self.__persist_key:
+            logger.info(log_message.format(message=f"{repr(self.__persist_path)}, cache of another publisher."))
+            return
+
+        now = time.time()
+        # Entries Are Stored From The Least To The Most Recently Used
+        for key, (expires_at, resp) in content.get("entries", {}).items():
+            if expires_at > now:
+                self.__entries[key] = (expires_at, tuple(resp) if isinstance(resp, list) else resp)
+        while len(self.__entries) > self.__maxsize:
+            self.__entries.popitem(last=False)
+
+    def __cucm_cache_save(self):
+
+        """
+        Save The Entries. The File Is Replaced Atomically, Concurrent Writers Don't Corrupt It.
+        :return:
+        """
+
+        log_message = "@ CUCM SQL Cache @ - {message}"
+
+        temp_path = f"{self.__persist_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"key": self.__persist_key, "entries": self.__entries}, file, default=str)
+            os.replace(temp_path, self.__persist_path)
+        except (OSError, TypeError, ValueError) as err:
+            logger.warning(log_message.format(message=f"{repr(self.__persist_path)}, cache isn't saved: {repr(err)}."))
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
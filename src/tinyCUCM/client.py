@@ -1,16 +1,34 @@
-from collections.abc import Iterable
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+from itertools import chain
+from os import PathLike
+from lxml import etree
 from random import choice
-from typing import Any, Dict, Optional, Tuple, Union
+from requests import Response
+from typing import IO, Any, Dict, Optional, Tuple, Union
 from typing_extensions import Unpack, deprecated
 from uuid import UUID
+from zeep.exceptions import Fault, TransportError
 from zeep.helpers import serialize_object
 
+from .allocator import CucmNumberAllocator
+from .cache import CucmSqlCache, cucm_sql_cache_key
 from .ccs_models import CucmCcsDoControlModel, CucmCcsDoDeploymentModel
-from .decorators import cucm_logging
-from .settings import CucmSettings
+from .coercion import cucm_sql_coerce
+from .decorators import cucm_logging, cucm_sql_cache
+from .exceptions import CucmBadRequestError, CucmBaseError
+from .export import cucm_sql_export
+from .forward_index import CUCM_FORWARD_DESTINATIONS, CucmForwardIndex, cucm_forward_types
+from .logger import logger
+from .profiler import CucmSqlProfiler
+from .records import CucmSqlRecords
+from .replica import CUCM_SQL_REPLICA_CHANGE_TABLES
 from .ris_models import CucmRisGetCtiModel
+from .settings import CucmSettings
 from .sql_models import (
+    CucmSqlBaseSearchModel,
     CucmSqlSearchCallPickupGroupsModel,
     CucmSqlSearchDevicesModel,
     CucmSqlSearchEndUsersModel,
@@ -23,6 +41,27 @@ from .sql_models import (
     CucmSqlSearchRemoteDestinationsModel,
     CucmSqlSearchTranslationPatternsModel,
 )
+from .sql_queries import (
+    CUCM_SQL_GROUP_KEY_PREFIX,
+    CUCM_SQL_LIST_QUERIES,
+    CUCM_SQL_PAGE_KEY_PREFIX,
+    CUCM_SQL_SEARCH_CALL_PICKUP_GROUPS_QUERY,
+    CUCM_SQL_SEARCH_DEVICES_QUERY,
+    CUCM_SQL_SEARCH_END_USERS_QUERY,
+    CUCM_SQL_SEARCH_LINE_FORWARDS_QUERY,
+    CUCM_SQL_SEARCH_LINE_GROUPS_QUERY,
+    CUCM_SQL_SEARCH_LINE_NUMBERS_QUERY,
+    CUCM_SQL_SEARCH_PATTERNS_QUERY,
+    CUCM_SQL_SEARCH_REMOTE_DESTINATIONS_QUERY,
+    CUCM_SQL_SEARCH_TRANSLATION_PATTERNS_QUERY,
+    CUCM_SQL_SEARCH_UNASSIGNED_NUMBERS_QUERY,
+    CucmSqlListQuery,
+    CucmSqlSearchQuery,
+    cucm_sql_list_union,
+    cucm_sql_page_cursor,
+    cucm_sql_page_cursor_keys,
+    cucm_sql_skip_first,
+)
 # TODO: Deprecated -> Remove
 from .sql_models_old import (
     CucmSqlSearchCallPickupGroupModel,
@@ -40,6 +79,353 @@ from .sql_models_old import (
 """ ######################################################### """
 
 
+CUCM_SQL_RESPONSE_NAMESPACES = {"soap-env": "http://schemas.xmlsoap.org/soap/envelope/"}
+CUCM_SQL_RESPONSE_PARSER = etree.XMLParser(resolve_entities=False, huge_tree=True)
+
+# Max Number Of Keys In The `IN (...)` List Of One Bulk Request (SQL Request & Response Size Limits)
+CUCM_SQL_BULK_CHUNK_SIZE = 200
+
+# Rows Per Request Of The Streamed Search Results (If The `chunk_size` Isn't Set)
+CUCM_SQL_STREAM_CHUNK_SIZE = 5000
+
+# Search Methods Response: Rows (Tuple or CucmSqlRecords), Rows Iterator (`is_stream_resp`), Page (`page_size`)
+# or Counts Per Group (`group_by`)
+CucmSqlSearchResp = Union[tuple[dict, ...], CucmSqlRecords, Iterator[dict], dict[str, Any], None]
+
+# Search Methods: {method_name: (search model, search query, criteria compared by `IS NULL` for the None value)},
+# The Other Criteria Are Compared By `= ''`. Shared By The CucmClient & The AsyncCucmClient
+CUCM_SQL_SEARCH_METHODS = {
+    "sqlSearchCallPickupGroups": (
+        CucmSqlSearchCallPickupGroupsModel,
+        CUCM_SQL_SEARCH_CALL_PICKUP_GROUPS_QUERY,
+        ("npm.dnorpattern", "npm.description")
+    ),
+    # Search Device Without Line, Userid, Device Pool
+    "sqlSearchDevices": (
+        CucmSqlSearchDevicesModel, CUCM_SQL_SEARCH_DEVICES_QUERY, ("np.dnorpattern", "eu.userid", "dp.name")
+    ),
+    "sqlSearchEndUsers": (CucmSqlSearchEndUsersModel, CUCM_SQL_SEARCH_END_USERS_QUERY, ()),
+    "sqlSearchLineForwards": (CucmSqlSearchLineForwardsModel, CUCM_SQL_SEARCH_LINE_FORWARDS_QUERY, ()),
+    "sqlSearchLineGroups": (
+        CucmSqlSearchLineGroupsModel, CUCM_SQL_SEARCH_LINE_GROUPS_QUERY, ("np.dnorpattern", "np.description")
+    ),
+    "sqlSearchLineNumbers": (
+        CucmSqlSearchLineNumbersModel, CUCM_SQL_SEARCH_LINE_NUMBERS_QUERY, ("rp.name", "css.name")
+    ),
+    "sqlSearchPatterns": (CucmSqlSearchPatternsModel, CUCM_SQL_SEARCH_PATTERNS_QUERY, ("rp.name", "css.name")),
+    "sqlSearchRemoteDestinations": (
+        CucmSqlSearchRemoteDestinationsModel, CUCM_SQL_SEARCH_REMOTE_DESTINATIONS_QUERY, ()
+    ),
+    "sqlSearchTranslationPatterns": (
+        CucmSqlSearchTranslationPatternsModel, CUCM_SQL_SEARCH_TRANSLATION_PATTERNS_QUERY, ("rp.name", "css.name")
+    ),
+    "sqlSearchUnassignedNumbers": (
+        CucmSqlSearchLineNumbersModel, CUCM_SQL_SEARCH_UNASSIGNED_NUMBERS_QUERY, ("rp.name", "css.name")
+    ),
+}
+
+# Search Methods Supporting The Streamed Export
+CUCM_SQL_EXPORT_SEARCH_METHODS = tuple(CUCM_SQL_SEARCH_METHODS)
+
+# Total Counts Of The Paged Searches: TTL (Seconds) & Max Number Of The Cached Searches
+CUCM_SQL_PAGE_TOTAL_TTL = 300
+CUCM_SQL_PAGE_TOTAL_CACHE_SIZE = 256
+
+# Reference Data Cache TTLs (Seconds): Configuration Objects & Enum Type Tables (Changed By Upgrades Only)
+CUCM_SQL_CACHE_TTL = 3600
+CUCM_SQL_CACHE_TTL_TYPES = 86400
+
+
+def cucm_sql_response_to_tuple(
+    response: Response,
+    is_compact_resp: bool = False,
+    history: Optional[Callable[[etree._Element, dict], None]] = None
+) -> Union[tuple[dict, ...], CucmSqlRecords, None]:
+
+    """
+    Parse The Raw SQL Response (SOAP Envelope) Straight To The Tuple Of Dictionaries.
+
+    The `executeSQLQuery` response isn't deserialized by zeep: `<row>` elements are read from the SOAP body
+    directly, cells are unqualified elements `<column_name>value</column_name>`.
+
+    :param response:        SQL Query Raw HTTP Response
+    :param is_compact_resp: Return The Compact Container (CucmSqlRecords) Instead Of The Tuple Of Dictionaries
+    :param history:         Client History Callback For The Faults `(envelope, http_headers)`
+    :return:
+    """
+
+    try:
+        envelope = etree.fromstring(response.content, parser=CUCM_SQL_RESPONSE_PARSER)
+    except etree.XMLSyntaxError as err:
+        # Not SOAP Response (HTTP Status 401, 503, ...)
+        raise TransportError(
+            f"Server returned response ({response.status_code}) with invalid XML: {err}.",
+            status_code=response.status_code,
+            content=response.content
+        )
+
+    body = envelope.find("soap-env:Body", namespaces=CUCM_SQL_RESPONSE_NAMESPACES)
+    fault = body.find("soap-env:Fault", namespaces=CUCM_SQL_RESPONSE_NAMESPACES)
+    if fault is not None:
+        # History Is Used For The Error Classification (AXL Codes)
+        if history is not None:
+            history(envelope, response.headers)
+        raise Fault(
+            message=fault.findtext("faultstring"),
+            code=fault.findtext("faultcode"),
+            detail=fault.find("detail")
+        )
+
+    if is_compact_resp:
+        resp_result = CucmSqlRecords.from_items(
+            ((item.tag, item.text) for item in row)
+            for row in body.iterfind("*/return/row")
+        )
+    else:
+        resp_result = tuple(
+            {item.tag: item.text for item in row}
+            for row in body.iterfind("*/return/row")
+        )
+    # No SQL Tuples -> None
+    return resp_result or None
+
+
+def cucm_ris_phone_resp_normalizing(resp_raw: dict) -> tuple[dict, ...]:
+
+    """
+    Normalizing RIS (Real-time Information Server) Phone(s) Response Dictionary.
+    :param resp_raw:    RIS Raw Response Dictionary
+    :return:
+    """
+
+    resp_result = []
+    if resp_raw["SelectCmDeviceResult"]["TotalDevicesFound"] > 0:
+        # Devices can be Registered, UnRegistered, Rejected, PartiallyRegistered, Unknown
+        for item in resp_raw["SelectCmDeviceResult"]["CmNodes"]["item"]:
+            if item["ReturnCode"] == "Ok":
+                for device in item["CmDevices"]["item"]:
+                    # CTI Remote Device (Type Model d.tkmodel = "635") no IPAddress
+                    resp_result.append(
+                        {
+                            "DeviceName": device["Name"],
+                            "Status": device["Status"],
+                            "Model": device["Model"],
+                            "Product": device["Product"],
+                            "IP": device["IPAddress"]["item"][0]["IP"] if device["IPAddress"] else None,
+                            "NodeName": item["Name"],
+                            "ActiveLoadID": device["ActiveLoadID"],
+                            "InactiveLoadID": device["InactiveLoadID"]
+                        }
+                    )
+    else:
+        # For 'risGetPhone' - Device not found (Not exist, Off-line, Unsupported Class or Type (RDP, UDP and ect.))
+        resp_result.append(
+            {
+                "DeviceName": None,
+                "Status": None,
+                "Model": None,
+                "Product": None,
+                "IP": None,
+                "NodeName": None,
+                "ActiveLoadID": None,
+                "InactiveLoadID": None
+            })
+    return tuple(resp_result)
+
+
+def cucm_sql_search_none_value_normalizing(
+    sql_criterion: str,
+    criterion_collection: tuple[str, ...] = ("rp.name", "css.name")
+) -> str:
+
+    """
+    Normalizing SQL Search Condition For 'None' Value.
+    :param sql_criterion:           Search By Field Name
+    :param criterion_collection:    Criterion Collection Of Field Names For 'IS NULL' Value
+    :return:
+    """
+
+    # Search Objs Without Partition, Calling Search Space or Any Other
+    return "IS NULL" if sql_criterion in criterion_collection else "= ''"
+
+
+def cucm_sql_forward_dst_conditions(validated_data: CucmSqlBaseSearchModel) -> str:
+
+    """
+    Normalizing Line Forward Destination Search Conditions.
+    :param validated_data:  Validated Search Model (`value`, `match` & `is_case_sensitive`)
+    :return:
+    """
+
+    columns = CUCM_FORWARD_DESTINATIONS.values()
+
+    separator = " OR "
+    if validated_data.value is None:
+        separator = " AND "
+
+    return separator.join(validated_data.sql_condition(col, condition_for_none="IS NULL") for col in columns)
+
+
+def cucm_sql_search_item_condition(item: CucmSqlBaseSearchModel, criterion_collection: tuple[str, ...]) -> str:
+
+    """
+    Condition Of One Search Item (Model With `criterion`, `value`, `match`, ...).
+    :param item:                    Search Item
+    :param criterion_collection:    Criterion Collection Of Field Names For 'IS NULL' Value
+    :return:
+    """
+
+    if isinstance(item, CucmSqlSearchLineForwardsModel) \
+            and item.criterion == CucmSqlSearchLineForwardsEnum.forward_destination:
+        return cucm_sql_forward_dst_conditions(validated_data=item)
+    if isinstance(item, CucmSqlSearchPatternsModel) and item.criterion == CucmSqlSearchPatternsEnum.pattern_usage:
+        # Pattern Usage Enum Value - Wildcard matching may not be used with non-character types
+        # Pattern Usage Enum Value - Not None & Not Empty String
+        return f"{item.sql_criterion} = '{item.value}'"
+    return item.sql_condition(
+        item.sql_criterion,
+        condition_for_none=cucm_sql_search_none_value_normalizing(
+            item.sql_criterion, criterion_collection=criterion_collection
+        )
+    )
+
+
+def cucm_sql_search_conditions(
+    validated_data: CucmSqlBaseSearchModel,
+    condition: Callable[[CucmSqlBaseSearchModel], str]
+) -> str:
+
+    """
+    Compound Search Condition: The Conditions Of The Criterion & The `conditions` Joined By The `operator`.
+    :param validated_data:  Validated Search Model
+    :param condition:       Condition Of One Search Item (Model With `criterion`, `value`, `match`, ...)
+    :return:
+    """
+
+    conditions = [condition(item) for item in validated_data.search_items]
+    if len(conditions) == 1:
+        return conditions[0]
+    return f" {validated_data.operator.value} ".join(f"({item})" for item in conditions)
+
+
+def cucm_sql_search_prepare(
+    method_name: str,
+    **kwargs: Any
+) -> tuple[CucmSqlSearchQuery, str, CucmSqlBaseSearchModel]:
+
+    """
+    Validate The Search Method Kwargs & Build The Search Condition.
+    :param method_name: Search Method Name (`CUCM_SQL_SEARCH_METHODS`)
+    :param kwargs:      Search Method Kwargs
+    :return:            `(query, condition, validated_data)`
+    """
+
+    model, query, criterion_collection = CUCM_SQL_SEARCH_METHODS[method_name]
+    validated_data = model(**kwargs)
+    condition = cucm_sql_search_conditions(
+        validated_data, lambda item: cucm_sql_search_item_condition(item, criterion_collection=criterion_collection)
+    )
+    return query, condition, validated_data
+
+
+def cucm_sql_search_page_query(
+    query: CucmSqlSearchQuery,
+    condition: str,
+    validated_data: CucmSqlBaseSearchModel
+) -> tuple[str, str]:
+
+    """
+    Page Queries Of The Search: The First Page Query (The Cursor Is Bound To It) & The Requested Page Query.
+    :param query:           Search Query
+    :param condition:       Search Condition (`WHERE` Expression)
+    :param validated_data:  Validated Search Model
+    :return:                `(page_query, sql_query)`
+    """
+
+    fields = validated_data.fields
+    page_query = query.render_page(condition=condition, fields=fields)
+    if not validated_data.page_cursor:
+        return page_query, page_query
+    after = cucm_sql_page_cursor_keys(page_query=page_query, cursor=validated_data.page_cursor)
+    return page_query, query.render_page(condition=condition, fields=fields, after=after)
+
+
+def cucm_sql_search_page_resp(
+    rows: Union[tuple[dict, ...], None],
+    page_query: str,
+    validated_data: CucmSqlBaseSearchModel,
+    schema: dict[str, str]
+) -> tuple[Union[tuple[dict, ...], CucmSqlRecords, None], Optional[str]]:
+
+    """
+    Page Rows & The Next Page Cursor. The Order Keys Columns Are Removed From The Rows.
+    :param rows:            Page Rows, `page_size` + 1 Rows Tell If The Next Page Exists
+    :param page_query:      Page Query Of The First Page
+    :param validated_data:  Validated Search Model
+    :param schema:          Result Column Types Of The Search Query
+    :return:                `(rows or None, next_cursor or None)`
+    """
+
+    rows = rows or ()
+    page_size = validated_data.page_size
+
+    keys = []
+    key_columns = [column for column in rows[0] if column.startswith(CUCM_SQL_PAGE_KEY_PREFIX)] if rows else []
+    for row in rows[:page_size]:
+        keys = [row.pop(column) for column in key_columns]
+    next_cursor = None
+    if len(rows) > page_size:
+        next_cursor = cucm_sql_page_cursor(page_query=page_query, keys=keys)
+
+    resp_result = rows[:page_size]
+    if resp_result and validated_data.is_compact_resp:
+        resp_result = CucmSqlRecords.from_items(row.items() for row in resp_result)
+    if validated_data.is_typed_resp:
+        resp_result = cucm_sql_coerce(resp_result, schema)
+    return resp_result or None, next_cursor
+
+
+def cucm_sql_search_aggregate_resp(
+    rows: Union[tuple[dict, ...], None],
+    group_by: list[str]
+) -> Optional[Tuple[Dict[str, Any]]]:
+
+    """
+    Counts Per Group Of The Aggregate Query Rows.
+    :param rows:        Aggregate Query Rows (`group_N` & `total` Columns)
+    :param group_by:    Groups: Search Criteria or Result Columns Aliases
+    :return:            `({"Device Pool": "...", "model": "...", "total": int}, ...)`
+    """
+
+    resp_result = tuple(
+        {
+            **{item: row[f"{CUCM_SQL_GROUP_KEY_PREFIX}{index}"] for index, item in enumerate(group_by)},
+            "total": int(row["total"]),
+        }
+        for row in rows or ()
+    )
+    return resp_result or None
+
+
+def cucm_sql_list_batch_split(
+    queries: list[CucmSqlListQuery],
+    rows: Union[tuple[dict, ...], None]
+) -> list[Optional[Tuple[Dict[str, Any]]]]:
+
+    """
+    Split The Rows Of The `UNION ALL` List Batch Back Per List (`list_index` Discriminator) & Sort Them.
+    :param queries: List Queries Of The Batch
+    :param rows:    Batch Query Rows
+    :return:        Rows or None Per List Query
+    """
+
+    lists = {index: [] for index in range(len(queries))}
+    for row in rows or ():
+        index = int(row["list_index"])
+        lists[index].append({alias: row[alias] for alias in queries[index].columns})
+    return [query.sort(lists[index]) or None for index, query in enumerate(queries)]
+
+
 class CucmClient(CucmSettings):
 
     """
@@ -49,10 +435,18 @@ class CucmClient(CucmSettings):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+        # Defined on first use, requires the AXL Service
         self.__cucm_get_collection = None
         self.__cucm_list_collection = None
 
-        self.__cucm_define_methods_collections()
+        # Number Allocators: {(start, end, partition): CucmNumberAllocator}
+        self.__cucm_number_allocators = {}
+
+        # Forward Destinations Index, Built On First Use
+        self.__cucm_forward_index = None
+
+        # Total Counts Of The Paged Searches: {count_query: total}
+        self.__cucm_sql_page_totals = CucmSqlCache(maxsize=CUCM_SQL_PAGE_TOTAL_CACHE_SIZE)
 
     @property
     def cucm_get_collection(self) -> Tuple[str]:
@@ -62,6 +456,10 @@ class CucmClient(CucmSettings):
         :return:
         """
 
+        if self.__cucm_get_collection is None:
+            with self._cucm_lock:
+                if self.__cucm_get_collection is None:
+                    self.__cucm_define_methods_collections()
         return tuple(self.__cucm_get_collection)
 
     @property
@@ -72,147 +470,320 @@ class CucmClient(CucmSettings):
         :return:
         """
 
+        if self.__cucm_list_collection is None:
+            with self._cucm_lock:
+                if self.__cucm_list_collection is None:
+                    self.__cucm_define_methods_collections()
         return tuple(self.__cucm_list_collection)
 
-    @staticmethod
-    def __cucm_sql_forward_dst_conditions(value: Optional[str]) -> str:
+    def __cucm_define_methods_collections(self):
 
         """
-        Normalizing Line Forward Destination Search Conditions.
+        Define AXL Method Collections.
         :return:
         """
 
-        columns = (
-            "cfd.cfadestination",
-            "np.cfbdestination",
-            "np.cfbintdestination",
-            "np.cfnadestination",
-            "np.cfnaintdestination",
-            "np.cfurdestination",
-            "np.cfurintdestination",
-        )
+        get_collection = []
+        list_collection = []
+        for method_name in self.axlAllMethods():
+            if "get" in method_name:
+                get_collection.append(method_name)
+            elif "list" in method_name:
+                list_collection.append(method_name)
+        self.__cucm_get_collection = get_collection
+        self.__cucm_list_collection = list_collection
+
+    @cucm_logging
+    def __cucm_sql_execute(
+        self,
+        sql_query: str,
+        is_compact_resp: bool = False
+    ) -> Union[tuple[dict, ...], CucmSqlRecords, None]:
+
+        """
+        Base AXL SQL Execute Method For Request To The Cisco UCM DB Informix.
+        The Query Is Recorded By The SQL Profiler If It's Enabled.
+        :param sql_query:       SQL Query Expression
+        :param is_compact_resp: Return The Compact Container (CucmSqlRecords)
+        :return:
+        """
 
-        condition = f"LIKE '%{value}%'"
-        separator = " OR "
-        if value is None:
-            condition = "IS NULL"
-            separator = " AND "
+        profiler = self._cucm_sql_profiler
+        if profiler is None:
+            with self._axl_client.settings(raw_response=True):
+                response = self._axl.executeSQLQuery(sql=sql_query)
+            return cucm_sql_response_to_tuple(
+                response, is_compact_resp=is_compact_resp, history=self._cucm_history_received
+            )
 
-        return separator.join(f"{col} {condition}" for col in columns)
+        response = resp_result = None
+        is_error = True
+        started_at = time.perf_counter()
+        try:
+            with self._axl_client.settings(raw_response=True):
+                response = self._axl.executeSQLQuery(sql=sql_query)
+            resp_result = cucm_sql_response_to_tuple(
+                response, is_compact_resp=is_compact_resp, history=self._cucm_history_received
+            )
+            is_error = False
+            return resp_result
+        finally:
+            profiler.record(
+                sql_query=sql_query,
+                elapsed=time.perf_counter() - started_at,
+                response_bytes=len(response.content) if response is not None else 0,
+                rows=len(resp_result or ()),
+                is_error=is_error
+            )
 
-    @staticmethod
-    def __cucm_element_list_to_tuple_of_dicts(elements: Iterable) -> tuple[dict, ...]:
+    def __cucm_sql_execute_chunks(
+        self,
+        sql_query: str,
+        chunk_size: int,
+        is_compact_resp: bool = False
+    ) -> Iterator[Union[tuple[dict, ...], CucmSqlRecords]]:
 
         """
-        Normalizing `lxml.etree` Items.
-        :param elements:    Collection of `lxml.etree` Items
+        Chunked AXL SQL Execute Method. The Query Is Paged Server-Side With Informix `SKIP` & `FIRST`.
+
+        * Each chunk is a separate `executeSQLQuery` request, so the response never exceeds the AXL limit.
+        * The query must have an `ORDER BY` clause giving a stable (total) order of the rows.
+
+        :param sql_query:       SQL `SELECT` Query Expression
+        :param chunk_size:      Rows Per Request
+        :param is_compact_resp: Chunks Are Compact Containers (CucmSqlRecords)
         :return:
         """
 
-        return tuple([{item.tag: item.text for item in row} for row in elements])
+        if not re.match(r"\s*SELECT\s", sql_query, flags=re.IGNORECASE) \
+                or re.search(r"\bUNION\b", sql_query, flags=re.IGNORECASE):
+            raise CucmBadRequestError("BadRequest error occurred. Only a single `SELECT` query can be chunked.")
+
+        skip = 0
+        while True:
+            chunk_query = cucm_sql_skip_first(sql_query=sql_query, skip=skip, first=chunk_size)
+            chunk = self.__cucm_sql_execute(sql_query=chunk_query, is_compact_resp=is_compact_resp)
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < chunk_size:
+                return
+            skip += chunk_size
 
-    @staticmethod
-    def __cucm_ris_phone_resp_normalizing(resp_raw: dict) -> tuple[dict, ...]:
+    def __cucm_sql_search_execute(
+        self,
+        sql_query: str,
+        validated_data: CucmSqlBaseSearchModel,
+        schema: Optional[dict[str, str]] = None
+    ) -> Union[tuple[dict, ...], CucmSqlRecords, None]:
 
         """
-        Normalizing RIS (Real-time Information Server) Phone(s) Response Dictionary.
-        :param resp_raw:    RIS Raw Response Dictionary
+        SQL Search Execute Method. Large Results Are Fetched In Chunks If The `chunk_size` Is Set.
+        The Query Runs Against The Local Replica If It's Built (The Publisher Isn't Requested).
+        The Compact Container (CucmSqlRecords) Is Returned If The `is_compact_resp` Is Set.
+        The Columns Are Converted By The Schema If The `is_typed_resp` Is Set.
+        The Rows Iterator Is Returned If The `is_stream_resp` Is Set.
+        :param sql_query:       SQL `SELECT` Query Expression
+        :param validated_data:  Validated Search Model
+        :param schema:          Result Column Types Of The Search Query
         :return:
         """
 
-        resp_result = []
-        if resp_raw["SelectCmDeviceResult"]["TotalDevicesFound"] > 0:
-            # Devices can be Registered, UnRegistered, Rejected, PartiallyRegistered, Unknown
-            for item in resp_raw["SelectCmDeviceResult"]["CmNodes"]["item"]:
-                if item["ReturnCode"] == "Ok":
-                    for device in item["CmDevices"]["item"]:
-                        # CTI Remote Device (Type Model d.tkmodel = "635") no IPAddress
-                        resp_result.append(
-                            {
-                                "DeviceName": device["Name"],
-                                "Status": device["Status"],
-                                "Model": device["Model"],
-                                "Product": device["Product"],
-                                "IP": device["IPAddress"]["item"][0]["IP"] if device["IPAddress"] else None,
-                                "NodeName": item["Name"],
-                                "ActiveLoadID": device["ActiveLoadID"],
-                                "InactiveLoadID": device["InactiveLoadID"]
-                            }
-                        )
+        if validated_data.is_stream_resp:
+            return self.__cucm_sql_search_stream(sql_query=sql_query, validated_data=validated_data, schema=schema)
+
+        is_compact_resp = validated_data.is_compact_resp
+        replica = self._cucm_sql_replica
+        if validated_data.is_replica and replica is not None and replica.is_fresh:
+            resp_result = replica.execute(sql_query=sql_query, is_compact_resp=is_compact_resp)
+        elif validated_data.chunk_size:
+            chunks = self.__cucm_sql_execute_chunks(
+                sql_query=sql_query, chunk_size=validated_data.chunk_size, is_compact_resp=is_compact_resp
+            )
+            if is_compact_resp:
+                resp_result = CucmSqlRecords.concat(chunks) or None
+            else:
+                resp_result = tuple(chain.from_iterable(chunks)) or None
         else:
-            # For 'risGetPhone' - Device not found (Not exist, Off-line, Unsupported Class or Type (RDP, UDP and ect.))
-            resp_result.append(
-                {
-                    "DeviceName": None,
-                    "Status": None,
-                    "Model": None,
-                    "Product": None,
-                    "IP": None,
-                    "NodeName": None,
-                    "ActiveLoadID": None,
-                    "InactiveLoadID": None
-                })
-        return tuple(resp_result)
+            resp_result = self.__cucm_sql_execute(sql_query=sql_query, is_compact_resp=is_compact_resp)
+        return cucm_sql_coerce(resp_result, schema) if validated_data.is_typed_resp else resp_result
 
-    @staticmethod
-    def __cucm_sql_search_none_value_normalizing(
-        sql_criterion: str,
-        criterion_collection: Tuple = ("rp.name", "css.name")
-    ) -> str:
+    def __cucm_sql_search_query_execute(
+        self,
+        query: CucmSqlSearchQuery,
+        condition: str,
+        validated_data: CucmSqlBaseSearchModel
+    ) -> CucmSqlSearchResp:
 
         """
-        Normalizing SQL Search Condition For 'None' Value.
-        :param sql_criterion:           Search By Field Name
-        :param criterion_collection:    Criterion Collection Of Field Names For 'IS NULL' Value
+        Render & Execute The Search Query. One Page Is Returned If The `page_size` Is Set, The Counts Per Group If
+        The `group_by` Is Set.
+        :param query:           Search Query
+        :param condition:       Search Condition (`WHERE` Expression)
+        :param validated_data:  Validated Search Model
         :return:
         """
 
-        # Search Objs Without Partition, Calling Search Space or Any Other
-        return "IS NULL" if sql_criterion in criterion_collection else "= ''"
+        if validated_data.group_by is not None:
+            return self.__cucm_sql_search_aggregate(query=query, condition=condition, validated_data=validated_data)
+        if validated_data.page_size:
+            return self.__cucm_sql_search_page(query=query, condition=condition, validated_data=validated_data)
+        sql_query = query.render(condition=condition, fields=validated_data.fields)
+        return self.__cucm_sql_search_execute(sql_query=sql_query, validated_data=validated_data, schema=query.schema)
 
-    def __cucm_define_methods_collections(self):
+    def __cucm_sql_search_page(
+        self,
+        query: CucmSqlSearchQuery,
+        condition: str,
+        validated_data: CucmSqlBaseSearchModel
+    ) -> dict[str, Any]:
 
         """
-        Define AXL Method Collections.
-        :return:
+        SQL Search Page Method. Keyset Pagination On The `ORDER BY` Expressions: The Page Starts After The Last Row
+        Of The Previous Page (`page_cursor`), Only `page_size` (+1) Rows Are Fetched. The Total Count Is Cached
+        Per Search For `CUCM_SQL_PAGE_TOTAL_TTL` Seconds.
+        :param query:           Search Query
+        :param condition:       Search Condition (`WHERE` Expression)
+        :param validated_data:  Validated Search Model
+        :return:                `{"rows": rows or None, "total": int, "next_cursor": str or None}`
         """
 
-        self.__cucm_get_collection = []
-        self.__cucm_list_collection = []
-        for method_name in self.axlAllMethods():
-            if "get" in method_name:
-                self.__cucm_get_collection.append(method_name)
-            elif "list" in method_name:
-                self.__cucm_list_collection.append(method_name)
+        page_query, sql_query = cucm_sql_search_page_query(
+            query=query, condition=condition, validated_data=validated_data
+        )
+
+        # One More Row Tells If The Next Page Exists
+        page_size = validated_data.page_size
+        replica = self._cucm_sql_replica
+        is_replica = validated_data.is_replica and replica is not None and replica.is_fresh
+        if is_replica:
+            rows = replica.execute_page(sql_query=sql_query, size=page_size + 1, offset=validated_data.page_offset)
+        else:
+            rows = self.__cucm_sql_execute(
+                sql_query=cucm_sql_skip_first(
+                    sql_query=sql_query, skip=validated_data.page_offset, first=page_size + 1
+                )
+            )
+
+        resp_result, next_cursor = cucm_sql_search_page_resp(
+            rows=rows, page_query=page_query, validated_data=validated_data, schema=query.schema
+        )
+        return {
+            "rows": resp_result,
+            "total": self.__cucm_sql_search_total(
+                sql_query=query.render_count(condition=condition, fields=validated_data.fields), is_replica=is_replica
+            ),
+            "next_cursor": next_cursor,
+        }
+
+    def __cucm_sql_search_aggregate(
+        self,
+        query: CucmSqlSearchQuery,
+        condition: str,
+        validated_data: CucmSqlBaseSearchModel
+    ) -> Optional[Tuple[Dict[str, Any]]]:
+
+        """
+        SQL Search Aggregate Method. The Objects Are Counted Server-Side (`COUNT(DISTINCT pkid)` & `GROUP BY`),
+        Only The Counts Are Transferred.
+        :param query:           Search Query
+        :param condition:       Search Condition (`WHERE` Expression)
+        :param validated_data:  Validated Search Model
+        :return:                `({"Device Pool": "...", "model": "...", "total": int}, ...)`
+        """
+
+        group_by = validated_data.group_by
+        sql_query = query.render_aggregate(condition=condition, group_by=group_by)
+        replica = self._cucm_sql_replica
+        if validated_data.is_replica and replica is not None and replica.is_fresh:
+            rows = replica.execute(sql_query=sql_query)
+        else:
+            rows = self.__cucm_sql_execute(sql_query=sql_query)
+        return cucm_sql_search_aggregate_resp(rows=rows, group_by=group_by)
 
-    def __cucm_sql_serialize_to_tuple(self, resp_raw) -> Union[tuple[dict, ...], None]:
+    def __cucm_sql_search_total(self, sql_query: str, is_replica: bool) -> int:
 
         """
-        Serialize Collection Of `lxml.etree` Items From The SQL Response To The Tuple Of dictionaries.
-        :param resp_raw:    SQL Query Response (class `zeep.objects.ExecuteSQLQueryRes`)
+        Total Count Of The Search, Cached Per Count Query.
+        :param sql_query:   SQL Count Query Expression (`SELECT COUNT(*) AS total ...`)
+        :param is_replica:  Run Against The Local Replica
         :return:
         """
 
-        try:
-            resp_result = self.__cucm_element_list_to_tuple_of_dicts(serialize_object(resp_raw["return"]["rows"]))
-        except KeyError:
-            # Single Tuple Response
-            resp_result = self.__cucm_element_list_to_tuple_of_dicts(serialize_object(resp_raw["return"]["row"]))
-        except TypeError:
-            # No SQL Tuples: {'return': None, 'sequence': None} -> None
-            resp_result = serialize_object(resp_raw["return"])
-        return resp_result
+        key = f"{'replica' if is_replica else 'publisher'}:{sql_query}"
+        is_hit, total = self.__cucm_sql_page_totals.get(key)
+        if is_hit:
+            return total
 
-    @cucm_logging
-    def __cucm_sql_execute(self, sql_query: str) -> Union[tuple[dict, ...], None]:
+        rows = self._cucm_sql_replica.execute(sql_query=sql_query) if is_replica \
+            else self.__cucm_sql_execute(sql_query=sql_query)
+        total = int(rows[0]["total"]) if rows else 0
+        self.__cucm_sql_page_totals.set(key, total, ttl=CUCM_SQL_PAGE_TOTAL_TTL)
+        return total
+
+    def __cucm_sql_search_stream(
+        self,
+        sql_query: str,
+        validated_data: CucmSqlBaseSearchModel,
+        schema: Optional[dict[str, str]] = None
+    ) -> Iterator[dict]:
 
         """
-        Base AXL SQL Execute Method For Request To The Cisco UCM DB Informix.
-        :param sql_query:   SQL Query Expression
+        SQL Search Stream Method. Rows Are Fetched In Chunks On Iteration (From The Replica If It's Built),
+        Only One Chunk Is Held In Memory.
+        :param sql_query:       SQL `SELECT` Query Expression
+        :param validated_data:  Validated Search Model
+        :param schema:          Result Column Types Of The Search Query
         :return:
         """
 
-        return self.__cucm_sql_serialize_to_tuple(self._axl.executeSQLQuery(sql=sql_query))
+        chunk_size = validated_data.chunk_size or CUCM_SQL_STREAM_CHUNK_SIZE
+        replica = self._cucm_sql_replica
+        if validated_data.is_replica and replica is not None and replica.is_fresh:
+            chunks = replica.execute_chunks(sql_query=sql_query, chunk_size=chunk_size)
+        else:
+            chunks = self.__cucm_sql_execute_chunks(sql_query=sql_query, chunk_size=chunk_size)
+        for chunk in chunks:
+            yield from cucm_sql_coerce(chunk, schema) if validated_data.is_typed_resp else chunk
+
+    def __cucm_sql_bulk_execute(
+        self,
+        sql_query: str,
+        objs: Iterable[Union[str, UUID]],
+        key_columns: tuple[str, ...],
+        chunk_size: int,
+        is_key_columns_dropped: bool = False
+    ) -> Dict[Union[str, UUID], Optional[Tuple[Dict[str, Any]]]]:
+
+        """
+        SQL Bulk Execute Method. Objects Are Requested By `IN (...)` Lists Of `chunk_size` Keys.
+        :param sql_query:               SQL `SELECT` Query Expression With The `{val}` Placeholder For The Keys List
+        :param objs:                    Objects PKIDs or Names
+        :param key_columns:             Result Columns Matched Against The Keys (PKID & Name)
+        :param chunk_size:              Keys Per Request
+        :param is_key_columns_dropped:  Key Columns Are Selected For Matching Only & Removed From The Rows
+        :return:                        Rows Grouped By Object: `{obj: rows or None}`
+        """
+
+        # {normalized_key: [obj, ...]}
+        keys = {}
+        for obj in dict.fromkeys(objs):
+            keys.setdefault(str(obj).lower(), []).append(obj)
+
+        resp_result = {obj: [] for objs_group in keys.values() for obj in objs_group}
+        normalized_keys = list(keys)
+        for index in range(0, len(normalized_keys), chunk_size):
+            in_list = ", ".join(
+                "'{}'".format(key.replace("'", "''")) for key in normalized_keys[index:index + chunk_size]
+            )
+            for row in self.__cucm_sql_execute(sql_query=sql_query.format(val=in_list)) or ():
+                matched = {str(row[column]).lower() for column in key_columns if row.get(column) is not None}
+                if is_key_columns_dropped:
+                    row = {column: value for column, value in row.items() if column not in key_columns}
+                for key in matched & keys.keys():
+                    for obj in keys[key]:
+                        resp_result[obj].append(row)
+        return {obj: tuple(rows) or None for obj, rows in resp_result.items()}
 
     @cucm_logging
     def axlAllMethods(self) -> tuple[str, ...]:
@@ -579,7 +1150,7 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        if not method in self.__cucm_get_collection:
+        if not method in self.cucm_get_collection:
             raise AttributeError(f"Method {repr(method)} is not in allowed get methods.")
 
         get_method = getattr(self._axl, method, None)
@@ -731,6 +1302,21 @@ class CucmClient(CucmSettings):
 
         return serialize_object(self._axl.getUser(**kwargs)["return"]["user"], dict)
 
+    @cucm_logging
+    def axlListChange(self, **kwargs: Union[dict, ...]) -> Dict[str, Any]:
+
+        """
+        AXL List Change Notifications Method.
+        :param kwargs:      Optional Fields (Without Fields The Response Has The Queue Position Only):
+                            `kwargs = {
+                                "startChangeId": {"queueId": "str", "_value_1": "int"},
+                                "objectList": {"object": ["Phone", "Line", ...]},
+                            }`
+        :return:            `{"queueInfo": {"queueId": ..., "nextStartChangeId": ...}, "changes": {"change": [...]}}`
+        """
+
+        return serialize_object(self._axl.listChange(**kwargs)["return"], dict)
+
     @cucm_logging
     def axlRemoveCallPickupGroup(self, **kwargs: Union[dict, ...]) -> Optional[Dict[str, Any]]:
 
@@ -1187,7 +1773,7 @@ class CucmClient(CucmSettings):
         resp_raw = self._ris.service.selectCmDeviceExt(state_info, criteria)
         if is_raw_resp:
             return resp_raw
-        return self.__cucm_ris_phone_resp_normalizing(resp_raw=resp_raw)[0]
+        return cucm_ris_phone_resp_normalizing(resp_raw=resp_raw)[0]
 
     @cucm_logging
     def risGetPhones(self, devices_collection: Iterable[dict, ...], is_raw_resp: bool = False) -> tuple[dict, ...]:
@@ -1226,7 +1812,7 @@ class CucmClient(CucmSettings):
             if is_raw_resp:
                 resp_raw_collection.append(resp_raw)
             else:
-                for item in self.__cucm_ris_phone_resp_normalizing(resp_raw=resp_raw):
+                for item in cucm_ris_phone_resp_normalizing(resp_raw=resp_raw):
                     temp_norm_collection[item["DeviceName"]] = item
 
         if is_raw_resp:
@@ -1259,15 +1845,257 @@ class CucmClient(CucmSettings):
 
         return self._axl.executeSQLUpdate(sql=sql_query)
 
-    def sqlExecuteQuery(self, sql_query: str) -> Union[tuple[dict, ...], None]:
+    def sqlExecuteQuery(
+        self,
+        sql_query: str,
+        is_compact_resp: bool = False,
+        schema: Optional[dict[str, str]] = None
+    ) -> Union[tuple[dict, ...], CucmSqlRecords, None]:
 
         """
         SQL Select Request to the Cisco UCM DB Informix.
+        :param sql_query:       SQL `SELECT` Query Expression
+        :param is_compact_resp: Return The Compact Container (CucmSqlRecords) Instead Of The Tuple Of Dictionaries
+        :param schema:          Column Types `{"column": "type"}` (`bool`, `datetime`, `int`, `uuid`), Strings If None
+        :return:
+        """
+
+        return cucm_sql_coerce(
+            self.__cucm_sql_execute(sql_query=sql_query, is_compact_resp=is_compact_resp), schema
+        )
+
+    def sqlExecuteQueryChunked(self, sql_query: str, chunk_size: int = 5000) -> Iterator[dict]:
+
+        """
+        SQL Select Request to the Cisco UCM DB Informix, Rows Are Fetched In Chunks & Yielded One By One.
+
+        The query must have an `ORDER BY` clause giving a stable (total) order of the rows, for example
+        `ORDER BY d.name, d.pkid`. Memory is bounded by the chunk size, not by the result size.
+
         :param sql_query:   SQL `SELECT` Query Expression
+        :param chunk_size:  Rows Per Request
         :return:
         """
 
-        return self.__cucm_sql_execute(sql_query=sql_query)
+        for chunk in self.__cucm_sql_execute_chunks(sql_query=sql_query, chunk_size=chunk_size):
+            yield from chunk
+
+    def sqlExportQuery(
+        self,
+        sql_query: str,
+        sink: Union[str, PathLike, IO[str]],
+        export_format: str = "jsonl",
+        chunk_size: int = 5000,
+        columns: Optional[Iterable[str]] = None
+    ) -> int:
+
+        """
+        Stream The Query Result To The File As CSV or JSONL. Rows Are Written While The Next Chunks Are Fetched,
+        The Memory Is Bounded By The Chunk Size. The Query Must Have A Stable `ORDER BY` (See sqlExecuteQueryChunked).
+        :param sql_query:       SQL `SELECT` Query Expression
+        :param sink:            File Path or Text File-Like Object
+        :param export_format:   `csv` or `jsonl`
+        :param chunk_size:      Rows Per Request
+        :param columns:         CSV Columns (Header), The Columns Of The First Row If None
+        :return:                Number Of Exported Rows
+        """
+
+        return cucm_sql_export(
+            rows=self.sqlExecuteQueryChunked(sql_query=sql_query, chunk_size=chunk_size),
+            sink=sink,
+            export_format=export_format,
+            columns=columns
+        )
+
+    def sqlExportSearch(
+        self,
+        method_name: str,
+        sink: Union[str, PathLike, IO[str]],
+        export_format: str = "jsonl",
+        columns: Optional[Iterable[str]] = None,
+        **kwargs: Any
+    ) -> int:
+
+        """
+        Stream The Result Of The `sqlSearch*` Method To The File As CSV or JSONL.
+        :param method_name:     Search Method Name: `sqlSearchDevices`, `sqlSearchEndUsers`, ...
+        :param sink:            File Path or Text File-Like Object
+        :param export_format:   `csv` or `jsonl`
+        :param columns:         CSV Columns (Header), The `fields` or The Columns Of The First Row If None
+        :param kwargs:          Search Method Kwargs (`criterion`, `value`, `fields`, `chunk_size`, ...)
+        :return:                Number Of Exported Rows
+
+        Example:
+            cucm.sqlExportSearch("sqlSearchDevices", "devices.csv", "csv", criterion="Name", value="")
+        """
+
+        if method_name not in CUCM_SQL_EXPORT_SEARCH_METHODS:
+            raise CucmBadRequestError(
+                f"BadRequest error occurred. Invalid search method: {repr(method_name)}. "
+                f"Available: {CUCM_SQL_EXPORT_SEARCH_METHODS}."
+            )
+        rows = getattr(self, method_name)(**kwargs, is_stream_resp=True)
+        return cucm_sql_export(
+            rows=rows,
+            sink=sink,
+            export_format=export_format,
+            columns=columns or kwargs.get("fields")
+        )
+
+    @property
+    def __cucm_profiler(self) -> CucmSqlProfiler:
+
+        """
+        SQL Profiler Property.
+        :return:
+        """
+
+        if self._cucm_sql_profiler is None:
+            raise CucmBadRequestError("BadRequest error occurred. The `sql_profiler` setting isn't enabled.")
+        return self._cucm_sql_profiler
+
+    def sqlProfilerStats(self) -> tuple[dict[str, Any], ...]:
+
+        """
+        SQL Profiler Aggregates Per Query Fingerprint, The Most Expensive (Total Wall Time) First:
+        `fingerprint_id`, `fingerprint`, `methods`, `count`, `errors`, `slow`, `total_time`, `mean_time`, `max_time`,
+        `p50_time`, `p95_time`, `p99_time`, `bytes`, `rows`.
+        :return:
+        """
+
+        return self.__cucm_profiler.stats()
+
+    def sqlProfilerSlowQueries(self) -> tuple[dict[str, Any], ...]:
+
+        """
+        SQL Profiler Slow-Query Log: `timestamp`, `fingerprint_id`, `method`, `origin`, `elapsed`, `bytes`, `rows`,
+        `sql_query`.
+        :return:
+        """
+
+        return self.__cucm_profiler.slow_queries()
+
+    def sqlProfilerExport(
+        self,
+        sink: Union[str, PathLike, IO[str]],
+        export_format: str = "csv",
+        is_slow_queries: bool = False
+    ) -> int:
+
+        """
+        Export The SQL Profiler Aggregates (or The Slow-Query Log) As CSV or JSONL.
+        :param sink:            File Path or Text File-Like Object
+        :param export_format:   `csv` or `jsonl`
+        :param is_slow_queries: Export The Slow-Query Log Instead Of The Aggregates
+        :return:                Number Of Exported Rows
+        """
+
+        rows = self.sqlProfilerSlowQueries() if is_slow_queries else self.sqlProfilerStats()
+        return cucm_sql_export(rows=rows, sink=sink, export_format=export_format, is_prefetch=False)
+
+    def sqlProfilerReset(self):
+
+        """
+        Drop The SQL Profiler Statistics & The Slow-Query Log.
+        :return:
+        """
+
+        self.__cucm_profiler.reset()
+
+    def sqlCacheInvalidate(self, *method_names: str) -> int:
+
+        """
+        Drop The Cached Reference Data, For Example After A Change Of The Device Pools.
+        :param method_names:    Cached Method Names (`sqlListDevicePool`, ...), All Methods If Empty
+        :return:                Number Of Dropped Entries
+        """
+
+        if self._cucm_sql_cache is None:
+            return 0
+        return self._cucm_sql_cache.invalidate(*method_names)
+
+    def sqlReplicaRefresh(self, chunk_size: int = 5000) -> dict[str, int]:
+
+        """
+        Rebuild The Local Replica (`sql_replica_path`) From The Publisher Tables Used By The `sqlSearch*` Methods.
+        :param chunk_size:  Rows Per Request
+        :return:            Rows Per Table
+        """
+
+        if self._cucm_sql_replica is None:
+            raise CucmBadRequestError("BadRequest error occurred. The `sql_replica_path` setting isn't defined.")
+
+        # Change Notification Position Before The Extraction: Changes Made During It Are Applied By The Next Sync
+        meta = {"pub_fqdn": self._cucm_publisher_property}
+        try:
+            queue_info = self.axlListChange()["queueInfo"]
+            meta.update(queue_id=queue_info["queueId"], next_change_id=queue_info["nextStartChangeId"])
+        except CucmBaseError as err:
+            logger.warning(f"@ CUCM SQL Replica @ - Change notifications aren't supported: {repr(err)}.")
+
+        return self._cucm_sql_replica.build(
+            fetch=lambda sql_query: self.sqlExecuteQueryChunked(sql_query=sql_query, chunk_size=chunk_size),
+            meta=meta
+        )
+
+    def sqlReplicaSync(self, chunk_size: int = 5000) -> dict[str, int]:
+
+        """
+        Refresh The Local Replica Incrementally By The AXL Change Notifications (`listChange`).
+
+        * Only added, updated & removed objects are refreshed (by pkid), the position is checkpointed in the replica,
+          so the sync is resumed after restarts.
+        * The replica is rebuilt if it isn't tracked yet, the change queue was reset or changes were lost.
+
+        :param chunk_size:  Rows Per Request
+        :return:            Refreshed Rows Per Table
+        """
+
+        log_message = "@ CUCM SQL Replica @ - {message}"
+
+        replica = self._cucm_sql_replica
+        if replica is None:
+            raise CucmBadRequestError("BadRequest error occurred. The `sql_replica_path` setting isn't defined.")
+
+        checkpoint = replica.checkpoint() if replica.is_ready else None
+        if checkpoint is None:
+            logger.info(log_message.format(message="Replica isn't tracked, full refresh."))
+            return self.sqlReplicaRefresh(chunk_size=chunk_size)
+
+        resp_result = {}
+        while True:
+            queue_id, next_change_id = checkpoint
+            resp = self.axlListChange(
+                startChangeId={"queueId": queue_id, "_value_1": next_change_id},
+                objectList={"object": list(CUCM_SQL_REPLICA_CHANGE_TABLES)}
+            )
+            queue_info = resp["queueInfo"]
+            if queue_info["queueId"] != queue_id or int(queue_info["firstChangeId"] or 0) > next_change_id:
+                logger.warning(log_message.format(message="Change queue was reset or changes were lost, full refresh."))
+                return self.sqlReplicaRefresh(chunk_size=chunk_size)
+
+            changes = (resp.get("changes") or {}).get("change") or []
+            checkpoint = (queue_id, int(queue_info["nextStartChangeId"]))
+            applied = replica.apply_changes(
+                changes=changes,
+                fetch=lambda sql_query: self.sqlExecuteQueryChunked(sql_query=sql_query, chunk_size=chunk_size),
+                checkpoint=checkpoint
+            )
+            for table, count in applied.items():
+                resp_result[table] = resp_result.get(table, 0) + count
+            if not changes or checkpoint[1] <= next_change_id:
+                return resp_result
+
+    def sqlReplicaInfo(self) -> Optional[Dict[str, Any]]:
+
+        """
+        Local Replica Metadata: Publisher, Build Time (Unix Time), Rows Per Table. None If It Isn't Built.
+        :return:
+        """
+
+        if self._cucm_sql_replica is None:
+            return None
+        return self._cucm_sql_replica.info()
 
     def sqlGetDeviceEndUsersRelations(self, obj: Union[str, UUID]) -> Optional[Tuple[Dict[str, Any]]]:
 
@@ -1277,6 +2105,21 @@ class CucmClient(CucmSettings):
         :return:
         """
 
+        return self.sqlGetDevicesEndUsersRelations(objs=[obj])[obj]
+
+    def sqlGetDevicesEndUsersRelations(
+        self,
+        objs: Iterable[Union[str, UUID]],
+        chunk_size: int = CUCM_SQL_BULK_CHUNK_SIZE
+    ) -> Dict[Union[str, UUID], Optional[Tuple[Dict[str, Any]]]]:
+
+        """
+        SQL Get Objects Method.
+        :param objs:        Objects PKIDs or Names
+        :param chunk_size:  Objects Per Request
+        :return:            `{obj: rows or None}`
+        """
+
         # One Device - A lot of End Users or None End Users
         sql_query = """SELECT eu.pkid AS enduser_pkid,
                               eu.userid,
@@ -1297,11 +2140,12 @@ class CucmClient(CucmSettings):
                     LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition
                     LEFT JOIN typeclass tc ON tc.enum = d.tkclass
                     LEFT JOIN typeproduct tp ON tp.enum = d.tkproduct
-                        WHERE d.pkid = '{val}'
-                           OR LOWER(d.name) = '{val}'
-                     ORDER BY eu.userid""".format(val=str(obj).lower() if isinstance(obj, UUID) else obj.lower()
+                        WHERE d.pkid IN ({val})
+                           OR LOWER(d.name) IN ({val})
+                     ORDER BY eu.userid"""
+        return self.__cucm_sql_bulk_execute(
+            sql_query=sql_query, objs=objs, key_columns=("device_pkid", "device"), chunk_size=chunk_size
         )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
     def sqlGetDeviceServicesSubscription(self, obj: Union[str, UUID]) -> Optional[Tuple[Dict[str, Any]]]:
 
@@ -1311,25 +2155,41 @@ class CucmClient(CucmSettings):
         :return:
         """
 
+        return self.sqlGetDevicesServicesSubscription(objs=[obj])[obj]
+
+    def sqlGetDevicesServicesSubscription(
+        self,
+        objs: Iterable[Union[str, UUID]],
+        chunk_size: int = CUCM_SQL_BULK_CHUNK_SIZE
+    ) -> Dict[Union[str, UUID], Optional[Tuple[Dict[str, Any]]]]:
+
+        """
+        SQL Get Objects Method.
+        :param objs:        Objects PKIDs or Names
+        :param chunk_size:  Objects Per Request
+        :return:            `{obj: rows or None}`
+        """
+
         # One Device - A lot of Services or None Services
         sql_query = """SELECT d.pkid,
                               d.name,
-                              d.description,  
+                              d.description,
                               d.allowhotelingflag AS em_enable,
                               tss.servicename AS service_name
-                         FROM device d 
+                         FROM device d
                     LEFT JOIN telecastersubscribedservice tss on tss.fkdevice = d.pkid
-                        WHERE d.pkid = '{val}'
-                           OR LOWER(d.name) = '{val}'
-                     ORDER BY d.name, tss.servicename""".format(
-            val=str(obj).lower() if isinstance(obj, UUID) else obj.lower()
+                        WHERE d.pkid IN ({val})
+                           OR LOWER(d.name) IN ({val})
+                     ORDER BY d.name, tss.servicename"""
+        return self.__cucm_sql_bulk_execute(
+            sql_query=sql_query, objs=objs, key_columns=("pkid", "name"), chunk_size=chunk_size
         )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
     def sqlGetEMSession(self, obj: Union[str, UUID]) -> Optional[Dict[str, Any]]:
 
         """
-        SQL Get Object Method.
+        SQL Get Object Method. `login_time` & `auto_logout` Are ISO Local Times (The Epoch If Logged Out: `logintime`
+        Is 0), `login_duration` Is Integer Seconds.
         :param obj:     Object PKID or Name
         :return:
         """
@@ -1359,12 +2219,13 @@ class CucmClient(CucmSettings):
                            OR LOWER(d.name) = '{val}'""".format(
             val=str(obj).lower() if isinstance(obj, UUID) else obj.lower()
         )
-        resp_result = self.sqlExecuteQuery(sql_query=sql_query)
+        resp_result = self.sqlExecuteQuery(
+            sql_query=sql_query, schema={"login_time": "int", "login_duration": "int"}
+        )
         if resp_result:
             resp_result = resp_result[0]
-            if resp_result["login_time"]:
-                resp_result["login_time"] = int(resp_result["login_time"])
-                auto_logout = resp_result["login_time"] + int(resp_result["login_duration"])
+            if isinstance(resp_result["login_time"], int):
+                auto_logout = resp_result["login_time"] + (resp_result["login_duration"] or 0)
 
                 # Local Time Zone
                 resp_result["auto_logout"] = datetime.fromtimestamp(auto_logout).isoformat()
@@ -1411,6 +2272,21 @@ class CucmClient(CucmSettings):
         :return:
         """
 
+        return self.sqlGetEndUsersDevicesRelations(objs=[obj])[obj]
+
+    def sqlGetEndUsersDevicesRelations(
+        self,
+        objs: Iterable[Union[str, UUID]],
+        chunk_size: int = CUCM_SQL_BULK_CHUNK_SIZE
+    ) -> Dict[Union[str, UUID], Optional[Tuple[Dict[str, Any]]]]:
+
+        """
+        SQL Get Objects Method.
+        :param objs:        Objects PKIDs or UserIDs
+        :param chunk_size:  Objects Per Request
+        :return:            `{obj: rows or None}`
+        """
+
         # One End User - A lot of Devices or None Devices
         sql_query = """SELECT eu.pkid AS enduser_pkid,
                               eu.userid,
@@ -1431,10 +2307,12 @@ class CucmClient(CucmSettings):
                     LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition
                     LEFT JOIN typeclass tc ON tc.enum = d.tkclass
                     LEFT JOIN typeproduct tp ON tp.enum = d.tkproduct
-                        WHERE eu.pkid = '{val}'
-                           OR LOWER(eu.userid) = '{val}'
-                     ORDER BY d.name""".format(val=str(obj).lower() if isinstance(obj, UUID) else obj.lower())
-        return self.__cucm_sql_execute(sql_query=sql_query)
+                        WHERE eu.pkid IN ({val})
+                           OR LOWER(eu.userid) IN ({val})
+                     ORDER BY d.name"""
+        return self.__cucm_sql_bulk_execute(
+            sql_query=sql_query, objs=objs, key_columns=("enduser_pkid", "userid"), chunk_size=chunk_size
+        )
 
     def sqlGetLineForwardDestinations(self, destination: str) -> Optional[Tuple[Dict[str, Any]]]:
 
@@ -1492,6 +2370,94 @@ class CucmClient(CucmSettings):
                      ORDER BY np.dnorpattern""".format(dst=destination)
         return self.sqlExecuteQuery(sql_query=sql_query)
 
+    @property
+    def __cucm_forward_destinations_index(self) -> CucmForwardIndex:
+
+        """
+        Forward Destinations Index Property. The Index is Built on First Use.
+        :return:
+        """
+
+        if self.__cucm_forward_index is None:
+            with self._cucm_lock:
+                if self.__cucm_forward_index is None:
+                    self.__cucm_forward_index = CucmForwardIndex(
+                        fetch=lambda sql_query: self.sqlExecuteQueryChunked(sql_query=sql_query)
+                    )
+        return self.__cucm_forward_index
+
+    def sqlGetLineForwardsByDestination(
+        self,
+        destination: str,
+        match: str = "exact",
+        fields: Optional[list[str]] = None
+    ) -> Optional[Tuple[Dict[str, Any]]]:
+
+        """
+        SQL Get Objects Method. Lines Forwarded To The Destination (Any Forward Type), Found By The Local Index.
+
+        Rows are the `sqlSearchLineForwards` rows with the `forward_types` key: forward types pointing to the
+        destination (`("dst_all", "dst_ext_busy", ...)`). The index is only used to find the candidate lines, the
+        forward types are checked against the fetched rows: lines which don't point to the destination anymore are
+        dropped & updated in the index. Lines forwarded to the destination after the last index refresh are found
+        after the next refresh (`sqlForwardIndexRefresh`).
+
+        :param destination: Forward Destination (Full or Part)
+        :param match:       `exact`, `prefix`, `suffix` or `contains`
+        :param fields:      Result Columns, All Columns If None
+        :return:
+        """
+
+        index = self.__cucm_forward_destinations_index
+        lines = index.lookup(destination=destination, match=match)
+        if not lines:
+            return None
+
+        # The Forward Types Columns Are Fetched To Check The Lines, Unrequested Ones Are Removed From The Rows
+        extra_fields = []
+        if fields:
+            extra_fields = [field for field in CUCM_FORWARD_DESTINATIONS if field not in fields]
+            fields = ["pkid", *(field for field in fields if field != "pkid"), *extra_fields]
+        replica = self._cucm_sql_replica
+        pkids = list(lines)
+        rows = []
+        for index_start in range(0, len(pkids), CUCM_SQL_BULK_CHUNK_SIZE):
+            sql_query = CUCM_SQL_SEARCH_LINE_FORWARDS_QUERY.render(
+                condition="np.pkid IN ({})".format(
+                    ", ".join(f"'{pkid}'" for pkid in pkids[index_start:index_start + CUCM_SQL_BULK_CHUNK_SIZE])
+                ),
+                fields=fields
+            )
+            rows.extend(
+                (replica.execute(sql_query=sql_query) if replica is not None and replica.is_fresh
+                 else self.__cucm_sql_execute(sql_query=sql_query)) or ()
+            )
+
+        # Stale Index Entries (Changed or Removed Lines) Are Corrected
+        fetched = {row["pkid"] for row in rows}
+        index.update(
+            [*rows, *({"pkid": pkid} for pkid in pkids if pkid not in fetched)]
+        )
+
+        resp_result = []
+        for row in rows:
+            forward_types = cucm_forward_types(row, destination=destination, match=match)
+            if forward_types:
+                row = {key: value for key, value in row.items() if key not in extra_fields}
+                resp_result.append({**row, "forward_types": forward_types})
+        resp_result.sort(key=lambda row: (row.get("line") or "", row["pkid"]))
+        return tuple(resp_result) or None
+
+    def sqlForwardIndexRefresh(self, pkids: Optional[Iterable[Union[str, UUID]]] = None):
+
+        """
+        Refresh The Forward Destinations Index (It's Rebuilt Hourly On Lookup).
+        :param pkids:   Changed Lines PKIDs (Incremental Refresh), The Whole Index If None
+        :return:
+        """
+
+        self.__cucm_forward_destinations_index.refresh(pkids=pkids)
+
     @deprecated(
         'The `sqlGetLineGroupStatus` method is deprecated; use `sqlGetLineGroupMemberStatuses` instead.',
         category=DeprecationWarning
@@ -1622,21 +2588,107 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        # Get Remote Destination via Remote Destination Profile
+        return self.sqlGetRemoteDestinations(objs=[obj])[obj]
+
+    def sqlGetRemoteDestinations(
+        self,
+        objs: Iterable[Union[str, UUID]],
+        chunk_size: int = CUCM_SQL_BULK_CHUNK_SIZE
+    ) -> Dict[Union[str, UUID], Optional[Tuple[Dict[str, Any]]]]:
+
+        """
+        SQL Get Objects Method.
+        :param objs:        Remote Destination Profiles PKIDs or Names
+        :param chunk_size:  Objects Per Request
+        :return:            `{obj: rows or None}`
+        """
+
+        # Get Remote Destinations via Remote Destination Profiles
         sql_query = """SELECT rd.pkid,
                               rd.name,
                               rdd.destination,
                               rdd.enablesinglenumberreach AS snr,
                               rdd.ismobilephone AS is_mobile,
                               rdd.delaybeforeringingcell AS start_delay,
-                              rdd.answertoolatetimer AS stop_ringing
+                              rdd.answertoolatetimer AS stop_ringing,
+                              d.pkid AS device_pkid,
+                              d.name AS device
                          FROM device d
                     LEFT JOIN remotedestination rd ON rd.fkdevice_remotedestinationtemplate = d.pkid
                     LEFT JOIN remotedestinationdynamic rdd ON rdd.fkremotedestination = rd.pkid
-                        WHERE d.pkid = '{val}'
-                           OR LOWER(d.name) = '{val}'
-                     ORDER BY rd.name""".format(val=str(obj).lower() if isinstance(obj, UUID) else obj.lower())
-        return self.sqlExecuteQuery(sql_query=sql_query)
+                        WHERE d.pkid IN ({val})
+                           OR LOWER(d.name) IN ({val})
+                     ORDER BY rd.name"""
+        return self.__cucm_sql_bulk_execute(
+            sql_query=sql_query,
+            objs=objs,
+            key_columns=("device_pkid", "device"),
+            chunk_size=chunk_size,
+            is_key_columns_dropped=True
+        )
+
+    def __cucm_number_allocator(self, start: str, end: str, partition: Optional[str]) -> CucmNumberAllocator:
+
+        """
+        Number Allocator Of The Range & Partition, Created On First Use.
+        :param start:       First Number Of The Range
+        :param end:         Last Number Of The Range
+        :param partition:   Route Partition Name
+        :return:
+        """
+
+        key = (start, end, partition)
+        allocator = self.__cucm_number_allocators.get(key)
+        if allocator is None:
+            with self._cucm_lock:
+                allocator = self.__cucm_number_allocators.get(key)
+                if allocator is None:
+                    allocator = CucmNumberAllocator(
+                        start=start,
+                        end=end,
+                        partition=partition,
+                        fetch=lambda sql_query: self.sqlExecuteQueryChunked(sql_query=sql_query)
+                    )
+                    self.__cucm_number_allocators[key] = allocator
+        return allocator
+
+    def sqlAllocateNumbers(
+        self,
+        start: str,
+        end: str,
+        partition: Optional[str],
+        count: int = 1,
+        is_contiguous: bool = False
+    ) -> tuple[str, ...]:
+
+        """
+        Allocate Free Directory Numbers Of The Range & Partition.
+
+        Numbers aren't mapped to a device or a line group. Allocated numbers are reserved by the client for 10 minutes
+        (or until they're released), concurrent callers get different numbers.
+
+        :param start:           First Number Of The Range (`1000`, `\\+4930100000`)
+        :param end:             Last Number Of The Range, Same Prefix & Length As The First Number
+        :param partition:       Route Partition Name, None For Lines Without Partition
+        :param count:           Number Of Numbers
+        :param is_contiguous:   Numbers Must Be Consecutive
+        :return:
+        """
+
+        return self.__cucm_number_allocator(start, end, partition).allocate(count=count, is_contiguous=is_contiguous)
+
+    def sqlReleaseNumbers(self, start: str, end: str, partition: Optional[str], numbers: Iterable[str]):
+
+        """
+        Release The Numbers Allocated By `sqlAllocateNumbers` (For Example If The Provisioning Failed).
+        :param start:       First Number Of The Range
+        :param end:         Last Number Of The Range
+        :param partition:   Route Partition Name
+        :param numbers:     Allocated Numbers
+        :return:
+        """
+
+        self.__cucm_number_allocator(start, end, partition).release(numbers=numbers)
 
     def sqlGetUnassignedPattern(self, pattern: str, patternusage: str, partition: str) -> Optional[Dict[str, Any]]:
 
@@ -1669,6 +2721,49 @@ class CucmClient(CucmSettings):
             resp_result = choice(resp_result)
         return resp_result
 
+    def sqlListBatch(self, *method_names: str) -> Dict[str, Optional[Tuple[Dict[str, Any]]]]:
+
+        """
+        Batch Of The `sqlList*` Reads In One Request: The List Queries Are Combined Into One `UNION ALL` With The
+        `list_index` Discriminator, The Rows Are Split Back & Sorted Per List. Cached Lists Aren't Requested,
+        The Requested Lists Are Cached Like The Method Calls.
+        :param method_names:    List Method Names: `sqlListDevicePool`, `sqlListRoutePartition`, ...
+        :return:                `{method_name: rows or None}`
+
+        Example:
+            cucm.sqlListBatch("sqlListDevicePool", "sqlListCallingSearchSpace", "sqlListTypeModel")
+        """
+
+        unknown = [method_name for method_name in method_names if method_name not in CUCM_SQL_LIST_QUERIES]
+        if unknown:
+            raise CucmBadRequestError(
+                f"BadRequest error occurred. Invalid list methods: {unknown}. "
+                f"Available: {tuple(CUCM_SQL_LIST_QUERIES)}."
+            )
+
+        method_names = list(dict.fromkeys(method_names))
+        cache = self._cucm_sql_cache
+        resp_result = {}
+        pending = []
+        for method_name in method_names:
+            if cache is not None:
+                is_hit, resp = cache.get(cucm_sql_cache_key(method_name, (), {}))
+                if is_hit:
+                    resp_result[method_name] = resp
+                    continue
+            pending.append(method_name)
+
+        if pending:
+            queries = [CUCM_SQL_LIST_QUERIES[method_name] for method_name in pending]
+            rows = self.__cucm_sql_execute(sql_query=cucm_sql_list_union(queries))
+            for method_name, resp in zip(pending, cucm_sql_list_batch_split(queries=queries, rows=rows)):
+                resp_result[method_name] = resp
+                if cache is not None:
+                    ttl = self._cucm_sql_cache_ttl(method_name, getattr(self.__class__, method_name).cucm_sql_cache_ttl)
+                    cache.set(cucm_sql_cache_key(method_name, (), {}), resp, ttl=ttl)
+        return {method_name: resp_result[method_name] for method_name in method_names}
+
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListCallingSearchSpace(self) -> Optional[Tuple[Dict[str, Any]]]:
 
         """
@@ -1676,10 +2771,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT css.pkid, css.name, css.description FROM callingsearchspace css ORDER BY css.name"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListCallingSearchSpace"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListCredentialPolicy(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1687,10 +2781,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT cp.pkid, cp.displayname AS name FROM credentialpolicy cp ORDER BY cp.displayname"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListCredentialPolicy"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListDevicePool(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1698,8 +2791,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(sql_query="SELECT dp.pkid, dp.name FROM devicepool dp ORDER BY dp.name")
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListDevicePool"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListDirGroup(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1707,8 +2801,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(sql_query="SELECT dg.pkid, dg.name FROM dirgroup dg ORDER BY dg.name")
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListDirGroup"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListMediaResourceGroup(self) -> Optional[Tuple[Dict[str, Any]]]:
 
         """
@@ -1716,10 +2811,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT mrg.pkid, mrg.name, mrg.description FROM mediaresourcegroup mrg ORDER BY mrg.name"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListMediaResourceGroup"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListMediaResourceList(self) -> Optional[Tuple[Dict[str, Any]]]:
 
         """
@@ -1727,10 +2821,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT mrl.pkid, mrl.name FROM mediaresourcelist mrl ORDER BY mrl.name"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListMediaResourceList"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListPhoneTemplate(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1738,8 +2831,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(sql_query="SELECT pt.pkid, pt.name FROM phonetemplate pt ORDER BY pt.name")
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListPhoneTemplate"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListProcessNode(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1747,14 +2841,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="""
-                SELECT pn.pkid, pn.name, pn.description 
-                FROM processnode pn 
-                WHERE pn.name NOT LIKE 'EnterpriseWideData'
-                ORDER BY pn.name
-            """)
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListProcessNode"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListRecordingProfile(self) -> Optional[Tuple[Dict[str, Any]]]:
 
         """
@@ -1762,8 +2851,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(sql_query="SELECT rp.pkid, rp.name FROM recordingprofile rp ORDER BY rp.name")
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListRecordingProfile"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListRegion(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1771,8 +2861,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(sql_query="SELECT r.pkid, r.name FROM region r ORDER BY r.name")
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListRegion"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListRoutePartition(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1780,10 +2871,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT rp.pkid, rp.name, rp.description FROM routepartition rp ORDER BY rp.name"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListRoutePartition"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListSoftkeyTemplate(self) ->Tuple[Dict[str, Any]]:
 
         """
@@ -1791,10 +2881,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT skt.pkid, skt.name, skt.description FROM softkeytemplate skt ORDER BY skt.name"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListSoftkeyTemplate"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListTelecasterService(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1802,10 +2891,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT ts.pkid, ts.name, ts.description FROM telecasterservice ts ORDER BY ts.name"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListTelecasterService"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL_TYPES)
     def sqlListTypeClass(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1813,8 +2901,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(sql_query="SELECT tc.enum AS pkid, tc.name FROM typeclass tc ORDER BY tc.enum")
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListTypeClass"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL_TYPES)
     def sqlListTypeCountry(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1822,8 +2911,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(sql_query="SELECT tc.enum AS pkid, tc.name FROM typecountry tc ORDER BY tc.enum")
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListTypeCountry"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL_TYPES)
     def sqlListTypeModel(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1831,8 +2921,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(sql_query="SELECT tm.enum AS pkid, tm.name FROM typemodel tm ORDER BY tm.enum")
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListTypeModel"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL_TYPES)
     def sqlListTypeUserLocale(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1840,10 +2931,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT tul.enum AS pkid, tul.name, tul.nativename FROM typeuserlocale tul ORDER BY tul.enum"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListTypeUserLocale"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListUcServiceProfile(self) -> Optional[Tuple[Dict[str, Any]]]:
 
         """
@@ -1851,10 +2941,9 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT ucsp.pkid, ucsp.name, ucsp.description FROM ucserviceprofile ucsp ORDER BY ucsp.name"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListUcServiceProfile"].render())
 
+    @cucm_sql_cache(ttl=CUCM_SQL_CACHE_TTL)
     def sqlListUcUserProfile(self) -> Tuple[Dict[str, Any]]:
 
         """
@@ -1862,9 +2951,7 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        return self.__cucm_sql_execute(
-            sql_query="SELECT ucup.pkid, ucup.name, ucup.description FROM ucuserprofile ucup ORDER BY ucup.name"
-        )
+        return self.__cucm_sql_execute(sql_query=CUCM_SQL_LIST_QUERIES["sqlListUcUserProfile"].render())
 
     ####################################################################################################################
 
@@ -2374,7 +3461,7 @@ class CucmClient(CucmSettings):
 
     def sqlSearchCallPickupGroups(
         self, **kwargs: Unpack[CucmSqlSearchCallPickupGroupsModel]
-    ) -> Optional[Tuple[Dict[str, Any]]]:
+    ) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2403,35 +3490,12 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchCallPickupGroupsModel(**kwargs)
-        value_for_none = self.__cucm_sql_search_none_value_normalizing(
-            validated_data.sql_criterion,
-            criterion_collection=("npm.dnorpattern", "npm.description")
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchCallPickupGroups', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
         )
-        sql_query = """SELECT cpg.pkid,
-                              cpg.name,
-                              npg.description,
-                              npg.dnorpattern AS pattern,
-                              rpg.name AS partition,
-                              npm.pkid AS line_pkid,
-                              npm.dnorpattern AS line_number,
-                              rpm.name AS line_partition,
-                              npm.description AS line_description
-                         FROM pickupgroup cpg
-                    LEFT JOIN numplan npg ON npg.pkid = cpg.fknumplan_pickup
-                    LEFT JOIN routepartition rpg ON rpg.pkid = npg.fkroutepartition
-                    LEFT JOIN pickupgrouplinemap pglm ON pglm.fkpickupgroup = cpg.pkid
-                    LEFT JOIN numplan npm ON npm.pkid = pglm.fknumplan_line
-                    LEFT JOIN routepartition rpm ON rpm.pkid = npm.fkroutepartition
-                        WHERE LOWER({obj}) {val}
-                          AND npg.tkpatternusage = '4'
-                     ORDER BY cpg.name""".format(
-            obj=validated_data.sql_criterion,
-            val=value_for_none if validated_data.value is None else f"LIKE '%{validated_data.value.lower()}%'"
-        )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
-    def sqlSearchDevices(self, **kwargs: Unpack[CucmSqlSearchDevicesModel]) -> Optional[Tuple[Dict[str, Any]]]:
+    def sqlSearchDevices(self, **kwargs: Unpack[CucmSqlSearchDevicesModel]) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2464,49 +3528,12 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchDevicesModel(**kwargs)
-        # Search Device Without Line, Userid, Device Pool
-        value_for_none = self.__cucm_sql_search_none_value_normalizing(
-            validated_data.sql_criterion,
-            criterion_collection=("np.dnorpattern", "eu.userid", "dp.name")
-        )
-        sql_query = """SELECT d.pkid,
-                              d.name,
-                              d.description,
-                              dp.name AS device_pool,
-                              np.pkid AS line_pkid,
-                              np.dnorpattern AS line_number,
-                              dnpm.numplanindex AS line_index,
-                              rp.name AS line_partition,
-                              np.description AS line_description,
-                              tc.name AS class,
-                              tm.name AS model,
-                              eu.pkid AS end_user_pkid,
-                              eu.userid,
-                              eu.displayname AS display_name,
-                              eu_rdp.pkid AS end_user_rdp_pkid,
-                              eu_rdp.userid AS userid_rdp,
-                              eu_rdp.displayname AS display_name_rdp
-                         FROM device d
-                    LEFT JOIN devicenumplanmap dnpm ON dnpm.fkdevice = d.pkid
-                    LEFT JOIN numplan np ON np.pkid = dnpm.fknumplan
-                    LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition
-                    LEFT JOIN devicepool dp ON dp.pkid = d.fkdevicepool
-                    LEFT JOIN typemodel tm ON tm.enum = d.tkmodel
-                    LEFT JOIN typeclass tc ON tc.enum = d.tkclass
-                    LEFT JOIN typeproduct tprod ON tprod.tkmodel = d.tkmodel
-                    LEFT JOIN enduser eu ON eu.pkid = d.fkenduser
-                    LEFT JOIN enduser eu_rdp ON eu_rdp.pkid = d.fkenduser_mobility
-                        WHERE LOWER({obj}) {val}
-                          AND (d.tkclass = '1' OR d.tkclass = '20' OR d.tkclass = '254')
-                          AND d.name NOT LIKE 'ModelProfile%'
-                     ORDER BY d.name, dnpm.numplanindex""".format(
-            obj=validated_data.sql_criterion,
-            val=value_for_none if validated_data.value is None else f"LIKE '%{validated_data.value.lower()}%'"
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchDevices', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
         )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
-    def sqlSearchEndUsers(self, **kwargs: Unpack[CucmSqlSearchEndUsersModel]) -> Optional[Tuple[Dict[str, Any]]]:
+    def sqlSearchEndUsers(self, **kwargs: Unpack[CucmSqlSearchEndUsersModel]) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2541,27 +3568,12 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchEndUsersModel(**kwargs)
-        sql_query = """SELECT eu.pkid,
-                              eu.userid,
-                              eu.displayname AS display_name,
-                              eu.lastname AS last_name,
-                              eu.telephonenumber AS phone_number,
-                              eu.mobile AS mobile_number,
-                              eu.mailid,
-                              eu.department,
-                              eu.title,
-                              eu.fkdirectorypluginconfig AS user_type,
-                              eu.status AS user_status
-                         FROM enduser eu
-                        WHERE LOWER({obj}) {val}
-                     ORDER BY eu.userid""".format(
-            obj=validated_data.sql_criterion,
-            val="= ''" if validated_data.value is None else f"LIKE '%{validated_data.value.lower()}%'"
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchEndUsers', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
         )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
-    def sqlSearchLineForwards(self, **kwargs: str) -> Optional[Tuple[Dict[str, Any]]]:
+    def sqlSearchLineForwards(self, **kwargs: str) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2586,64 +3598,12 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchLineForwardsModel(**kwargs)
-
-        search_value = "= ''" if validated_data.value is None else f"LIKE '%{validated_data.value.lower()}%'"
-        search_condition = f"LOWER({validated_data.sql_criterion}) {search_value}"  \
-            if validated_data.criterion != CucmSqlSearchLineForwardsEnum.forward_destination \
-            else self.__cucm_sql_forward_dst_conditions(value=validated_data.value)
-        sql_query = """SELECT np.pkid,
-                              np.dnorpattern AS line,
-                              rp.name AS line_partition,
-                              np.description AS line_description,
-                              
-                              cfd.cfavoicemailenabled AS voice_all,
-                              cfd.cfadestination AS dst_all,
-                              cfa.name AS css_primary,
-                              scfa.name AS css_secondary,
-                              
-                              np.cfbvoicemailenabled AS voice_ext_busy,
-                              np.cfbdestination AS dst_ext_busy,
-                              cfb.name AS css_ext_busy,
-                              
-                              np.cfbintvoicemailenabled AS voice_int_busy,
-                              np.cfbintdestination AS dst_int_busy,
-                              cfbint.name AS css_int_busy,
-                              
-                              np.cfnavoicemailenabled AS voice_ext_no_ans,
-                              np.cfnadestination AS dst_ext_no_ans,
-                              cfna.name AS css_ext_no_ans,
-                              
-                              np.cfnaduration AS duration_no_ans,
-                              
-                              np.cfnaintvoicemailenabled AS voice_int_no_ans,
-                              np.cfnaintdestination AS dst_int_no_ans,
-                              cfnaint.name AS css_int_no_ans,
-                              
-                              np.cfurvoicemailenabled AS voice_ext_unreg,
-                              np.cfurdestination AS dst_ext_unreg,
-                              cfur.name AS css_ext_unreg,
-                              
-                              np.cfurintvoicemailenabled AS voice_int_unreg,
-                              np.cfurintdestination AS dst_int_unreg,
-                              cfurint.name AS css_int_unreg
-                         FROM numplan np
-                    LEFT JOIN routepartition rp ON np.fkroutepartition = rp.pkid
-                    LEFT JOIN callforwarddynamic cfd ON cfd.fknumplan = np.pkid
-                    LEFT JOIN callingsearchspace cfa ON cfd.fkcallingsearchspace_cfa = cfa.pkid
-                    LEFT JOIN callingsearchspace scfa ON cfd.fkcallingsearchspace_scfa = scfa.pkid
-                    LEFT JOIN callingsearchspace cfb ON np.fkcallingsearchspace_cfb = cfb.pkid
-                    LEFT JOIN callingsearchspace cfbint ON np.fkcallingsearchspace_cfbint = cfbint.pkid
-                    LEFT JOIN callingsearchspace cfna ON np.fkcallingsearchspace_cfna = cfna.pkid
-                    LEFT JOIN callingsearchspace cfnaint ON np.fkcallingsearchspace_cfnaint = cfnaint.pkid
-                    LEFT JOIN callingsearchspace cfur ON np.fkcallingsearchspace_cfur = cfur.pkid
-                    LEFT JOIN callingsearchspace cfurint ON np.fkcallingsearchspace_cfurint = cfurint.pkid
-                        WHERE {con}
-                          AND np.tkpatternusage = '2'
-                     ORDER BY np.dnorpattern""".format(con=search_condition)
-        return self.sqlExecuteQuery(sql_query=sql_query)
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchLineForwards', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
+        )
 
-    def sqlSearchLineGroups(self, **kwargs: Unpack[CucmSqlSearchLineGroupsModel]) -> Optional[Tuple[Dict[str, Any]]]:
+    def sqlSearchLineGroups(self, **kwargs: Unpack[CucmSqlSearchLineGroupsModel]) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2671,34 +3631,14 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchLineGroupsModel(**kwargs)
-        value_for_none = self.__cucm_sql_search_none_value_normalizing(
-            validated_data.sql_criterion,
-            criterion_collection=("np.dnorpattern", "np.description")
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchLineGroups', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
         )
-        sql_query = """SELECT lg.pkid,
-                              lg.name,
-                              tda.name AS algorithm,
-                              np.pkid AS line_pkid,
-                              np.dnorpattern AS line,
-                              rp.name AS line_partition,
-                              np.description AS line_description,
-                              lgnpm.lineselectionorder AS line_index
-                         FROM linegroup lg
-                    LEFT JOIN linegroupnumplanmap lgnpm ON lgnpm.fklinegroup = lg.pkid
-                    LEFT JOIN typedistributealgorithm tda ON tda.enum = lg.tkdistributealgorithm
-                    LEFT JOIN numplan np ON np.pkid = lgnpm.fknumplan
-                    LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition
-                        WHERE LOWER({obj}) {val}
-                     ORDER BY lg.name, lgnpm.lineselectionorder""".format(
-            obj=validated_data.sql_criterion,
-            val=value_for_none if validated_data.value is None else f"LIKE '%{validated_data.value.lower()}%'"
-        )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
     def sqlSearchLineNumbers(
         self, **kwargs: Unpack[CucmSqlSearchLineNumbersModel]
-    ) -> Optional[Tuple[Dict[str, Any]]]:
+    ) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2729,27 +3669,12 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchLineNumbersModel(**kwargs)
-        value_for_none = self.__cucm_sql_search_none_value_normalizing(validated_data.sql_criterion)
-        sql_query = """SELECT np.pkid,
-                              np.dnorpattern AS line_number,
-                              np.description AS line_description,
-                              np.alertingname,
-                              np.alertingnameascii,
-                              rp.name AS line_partition,
-                              css.name AS line_css_sharedline
-                         FROM numplan np
-                    LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition
-                    LEFT JOIN callingsearchspace css ON css.pkid = np.fkcallingsearchspace_sharedlineappear
-                        WHERE LOWER({obj}) {val}
-                          AND np.tkpatternusage = '2'
-                     ORDER BY np.dnorpattern""".format(
-            obj=validated_data.sql_criterion,
-            val=value_for_none if validated_data.value is None else f"LIKE '%{validated_data.value.lower()}%'"
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchLineNumbers', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
         )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
-    def sqlSearchPatterns(self, **kwargs: Unpack[CucmSqlSearchPatternsModel]) -> Optional[Tuple[Dict[str, Any]]]:
+    def sqlSearchPatterns(self, **kwargs: Unpack[CucmSqlSearchPatternsModel]) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2778,39 +3703,14 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchPatternsModel(**kwargs)
-        if validated_data.criterion == CucmSqlSearchPatternsEnum.pattern_usage:
-            # Pattern Usage Enum Value - Wildcard matching may not be used with non-character types
-            validated_value = f"= '{validated_data.value}'" # Pattern Usage Enum Value - Not None & Not Empty String
-        else:
-            if validated_data.value is None:
-                validated_value = self.__cucm_sql_search_none_value_normalizing(validated_data.sql_criterion)
-            else:
-                validated_value = f"LIKE '%{validated_data.value.lower()}%'"
-        sql_query = """SELECT np.pkid,
-                              np.dnorpattern AS pattern,
-                              np.description,
-                              rp.name AS partition,
-                              css.name AS css,
-                              np.tkpatternusage AS pattern_usage,
-                              tpu.name AS pattern_type
-                         FROM numplan np
-                    LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition
-                    LEFT JOIN callingsearchspace css ON css.pkid = np.fkcallingsearchspace_translation
-                    LEFT JOIN typepatternrouteclass rc ON rc.enum = np.tkpatternrouteclass
-                    LEFT JOIN typepatternusage tpu ON tpu.enum = np.tkpatternusage
-                        WHERE {con} {val}
-                     ORDER BY np.dnorpattern, np.tkpatternusage""".format(
-            con=validated_data.sql_criterion \
-                if validated_data.criterion == CucmSqlSearchPatternsEnum.pattern_usage \
-                else f"LOWER({validated_data.sql_criterion})",
-            val=validated_value
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchPatterns', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
         )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
     def sqlSearchRemoteDestinations(
         self, **kwargs: Unpack[CucmSqlSearchRemoteDestinationsModel]
-    ) -> Optional[Tuple[Dict[str, Any]]]:
+    ) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2833,26 +3733,14 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchRemoteDestinationsModel(**kwargs)
-        sql_query = """SELECT rd.pkid,
-                              rd.name,
-                              rdd.destination,
-                              rdd.enablesinglenumberreach AS snr,
-                              rdd.ismobilephone AS is_mobile,
-                              rdd.delaybeforeringingcell AS start_delay,
-                              rdd.answertoolatetimer AS stop_ringing
-                         FROM remotedestination rd
-                    LEFT JOIN remotedestinationdynamic rdd ON rdd.fkremotedestination = rd.pkid
-                        WHERE LOWER({obj}) {val}
-                     ORDER BY rd.name""".format(
-            obj=validated_data.sql_criterion,
-            val="= ''" if validated_data.value is None else f"LIKE '%{validated_data.value.lower()}%'"
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchRemoteDestinations', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
         )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
     def sqlSearchTranslationPatterns(
         self, **kwargs: Unpack[CucmSqlSearchTranslationPatternsModel]
-    ) -> Optional[Tuple[Dict[str, Any]]]:
+    ) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2883,32 +3771,14 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchTranslationPatternsModel(**kwargs)
-        value_for_none = self.__cucm_sql_search_none_value_normalizing(validated_data.sql_criterion)
-        sql_query = """SELECT np.pkid,
-                              np.dnorpattern AS pattern,
-                              np.description,
-                              rp.name AS partition,
-                              css.name AS css,
-                              np.calledpartytransformationmask AS called_tmask,
-                              np.prefixdigitsout AS called_prefix,
-                              rc.name AS route_class,
-                              np.blockenable AS block_enable
-                         FROM numplan np
-                    LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition
-                    LEFT JOIN callingsearchspace css ON css.pkid = np.fkcallingsearchspace_translation
-                    LEFT JOIN typepatternrouteclass rc ON rc.enum = np.tkpatternrouteclass
-                        WHERE LOWER({obj}) {val}
-                          AND np.tkpatternusage = '3'
-                     ORDER BY np.dnorpattern""".format(
-            obj=validated_data.sql_criterion,
-            val=value_for_none if validated_data.value is None else f"LIKE '%{validated_data.value.lower()}%'"
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchTranslationPatterns', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
         )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
     def sqlSearchUnassignedNumbers(
         self, **kwargs: Unpack[CucmSqlSearchLineNumbersModel]
-    ) -> Optional[Tuple[Dict[str, Any]]]:
+    ) -> CucmSqlSearchResp:
 
         """
         SQL Search Objects Method.
@@ -2939,29 +3809,10 @@ class CucmClient(CucmSettings):
         :return:
         """
 
-        validated_data = CucmSqlSearchLineNumbersModel(**kwargs)
-        value_for_none = self.__cucm_sql_search_none_value_normalizing(validated_data.sql_criterion)
-        sql_query = """SELECT np.pkid,
-                              np.dnorpattern AS line_number,
-                              np.description AS line_description,
-                              np.alertingname,
-                              np.alertingnameascii,
-                              rp.name AS line_partition,
-                              css.name AS line_css_sharedline
-                         FROM numplan np
-                    LEFT JOIN routepartition rp ON np.fkroutepartition = rp.pkid
-                    LEFT JOIN callingsearchspace css ON css.pkid = np.fkcallingsearchspace_sharedlineappear
-                    LEFT JOIN devicenumplanmap dnmp ON dnmp.fknumplan = np.pkid
-                    LEFT JOIN linegroupnumplanmap lgnmp ON lgnmp.fknumplan = np.pkid
-                        WHERE dnmp.pkid IS NULL
-                          AND lgnmp.pkid IS NULL
-                          AND LOWER({obj}) {val}
-                          AND np.tkpatternusage = '2'
-                     ORDER BY np.dnorpattern""".format(
-            obj=validated_data.sql_criterion,
-            val=value_for_none if validated_data.value is None else f"LIKE '%{validated_data.value.lower()}%'"
+        query, search_condition, validated_data = cucm_sql_search_prepare('sqlSearchUnassignedNumbers', **kwargs)
+        return self.__cucm_sql_search_query_execute(
+            query=query, condition=search_condition, validated_data=validated_data
         )
-        return self.__cucm_sql_execute(sql_query=sql_query)
 
     ####################################################################################################################
 
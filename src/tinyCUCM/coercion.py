@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Any, Callable, Optional, Union
+from uuid import UUID
+
+from .exceptions import CucmBadRequestError
+from .logger import logger
+from .records import CucmSqlRecords
+
+
+""" ######################################################### """
+""" *************** TINY CUCM SQL TYPE COERCION ************* """
+""" ######################################################### """
+
+
+def _cucm_bool(value: str) -> bool:
+    return value == "t" or value == "1" or value.lower() == "true"
+
+
+def _cucm_datetime(value: str) -> datetime:
+    # Epoch Seconds (Local Time Zone) or Informix `DATETIME YEAR TO SECOND`
+    return datetime.fromtimestamp(int(value)) if value.isdigit() else datetime.fromisoformat(value)
+
+
+# Column Types Of The Declared Schemas: {"type": converter}, None Values Stay None
+CUCM_SQL_COLUMN_TYPES: dict[str, Callable[[str], Any]] = {
+    "bool": _cucm_bool,
+    "datetime": _cucm_datetime,
+    "int": int,
+    "uuid": UUID,
+}
+
+
+def _cucm_sql_converter(column: str, column_type: str) -> Callable[[Optional[str]], Any]:
+
+    """
+    Converter Of The Column Values. Values Are Converted Once Per Distinct Value, Invalid Values Are Kept As Is.
+    :param column:      Column Name
+    :param column_type: Column Type: `bool`, `datetime`, `int` or `uuid`
+    :return:
+    """
+
+    try:
+        convert = CUCM_SQL_COLUMN_TYPES[column_type]
+    except KeyError:
+        raise CucmBadRequestError(
+            f"BadRequest error occurred. Invalid type of the column {repr(column)}: {repr(column_type)}. "
+            f"Available: {tuple(CUCM_SQL_COLUMN_TYPES)}."
+        )
+
+    converted = {None: None}
+
+    def converter(value: Optional[str]) -> Any:
+        try:
+            return converted[value]
+        except KeyError:
+            pass
+        try:
+            resp = convert(value)
+        except (TypeError, ValueError, OverflowError, OSError):
+            logger.debug(f"@ CUCM SQL Coercion @ - {repr(column)}: {repr(value)} isn't {column_type}, kept as is.")
+            resp = value
+        converted[value] = resp
+        return resp
+
+    return converter
+
+
+def cucm_sql_coerce(
+    resp: Union[tuple[dict, ...], CucmSqlRecords, None],
+    schema: Optional[dict[str, str]]
+) -> Union[tuple[dict, ...], CucmSqlRecords, None]:
+
+    """
+    Convert The Columns Of The SQL Response By The Declared Schema. Whole Columns Are Converted At Once,
+    The Columns Missing In The Schema Stay Strings.
+    :param resp:    SQL Response: Tuple Of Dictionaries or CucmSqlRecords
+    :param schema:  Column Types: `{"column": "type"}`
+    :return:        Response Of The Same Kind (Rows Of The Tuple Are Updated In Place)
+    """
+
+    if not resp or not schema:
+        return resp
+
+    if isinstance(resp, CucmSqlRecords):
+        return resp.map_columns({
+            column: _cucm_sql_converter(column, column_type)
+            for column, column_type in schema.items() if column in resp.columns
+        })
+
+    columns = resp[0].keys()
+    for column, column_type in schema.items():
+        if column not in columns:
+            continue
+        converter = _cucm_sql_converter(column, column_type)
+        for row in resp:
+            row[column] = converter(row.get(column))
+    return resp
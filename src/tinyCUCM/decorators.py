@@ -1,7 +1,9 @@
+from functools import wraps
 from requests.exceptions import ConnectionError, HTTPError, ProxyError, RequestException, Timeout
 from typing import Optional
 from zeep.exceptions import Fault, ValidationError
 
+from .cache import cucm_sql_cache_key
 from .exceptions import (
     CucmAxlSessionError,
     CucmBadRequestError,
@@ -12,12 +14,80 @@ from .exceptions import (
 )
 from .logger import logger
 
+try:
+    from httpx import HTTPError as HttpxError
+except ImportError:
+    # Optional `async` Extra (AsyncCucmClient)
+    HttpxError = None
+
 
 """ ######################################################### """
 """ ****************** TINY CUCM DECORATORS ***************** """
 """ ######################################################### """
 
 
+# Connection Errors Of The Sync (requests) & Async (httpx) Transports
+CUCM_CONNECTION_ERRORS = tuple(
+    err for err in (ConnectionError, HTTPError, ProxyError, RequestException, Timeout, HttpxError) if err is not None
+)
+
+
+def _cucm_error_classify(self, err: Exception, message: str) -> Exception:
+
+    """
+    Error Classification. The Error Of The Method Is Converted To The tinyCUCM Exception.
+    :param self:    CUCM Client
+    :param err:     Error Raised By The Method
+    :param message: Log Message Template
+    :return:
+    """
+
+    if isinstance(err, (AttributeError, TypeError)):
+        err = str(err)
+        if "NoneType" in err:
+            logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
+            return CucmAxlSessionError("Session FailedDependency error occurred. Client is None.")
+        elif ("Service has no operation" in err
+              or "is not in allowed get methods" in err
+              or "got an unexpected keyword argument" in err
+              or "object has no attribute" in err):
+            # "Service has no operation 'method name'" - Method Error
+            # "is not in allowed get methods" - Method Error (Example: wrong get axl method "getPhon")
+            # "got an unexpected keyword argument" - Invalid Argument for AXL Methods (Example: "uud" vs. "uuid")
+            logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
+            return CucmBadRequestError(f"BadRequest error occurred. {repr(err)}")
+
+        logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
+        return CucmUnexpectedError(f"Unexpected error occurred. {repr(err)}")
+
+    elif isinstance(err, (Fault, ValidationError)):
+        history = self._cucm_history_show()
+        if "HTTP Status 401" in history:
+            return CucmUnauthorizedError("Unauthorized error occurred.")
+        elif "<axlcode>5003</axlcode>" in history or "<axlcode>5007</axlcode>" in history:
+            # Only for AXL Requests - 404 Not Found
+            # Do or Get Request - AXLCode: 5007 - "Item not valid: The specified {{CUCM Object}} was not found"
+            # UpdateRequest - AXLCode: 5003 - "{{CUCM Object}} not found"
+            logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
+            logger.error(message.format(msg=f"History: {history}."))
+            return CucmObjNotFoundError(f"NotFound error occurred. {repr(err)}")
+        else:
+            # For Invalid SQL Queries.
+            # AXLCode: 201 - "A syntax error has occurred"
+            # AXLCode: 217 - "Column ({{column_names}}) not found..."
+            logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
+            logger.error(message.format(msg=f"History: {history}."))
+            return CucmBadRequestError(f"BadRequest error occurred. {repr(err)}")
+
+    elif isinstance(err, CUCM_CONNECTION_ERRORS):
+        logger.error(message.format(msg=f"Error Detail: {repr(err)}"))
+        return CucmConnectionError(f"Connection has been failed. {repr(err)}")
+
+    logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
+    logger.error(message.format(msg=f"History: {self._cucm_history_show()}"))
+    return CucmUnexpectedError(f"Unexpected error occurred. {repr(err)}")
+
+
 def cucm_logging(cucm_method):
 
     """
@@ -31,54 +101,72 @@ def cucm_logging(cucm_method):
         message = f"@ CUCM {repr(cucm_method.__name__)} Method @ - {{msg}}"
         logger.debug(message.format(msg=f"Query Params:\nArgs: {args}\nKwargs: {kwargs}."))
 
+        # Request-Scoped History: Faults Are Classified By The Envelopes Of This Thread (or asyncio Task) Only
+        self._cucm_history_reset()
+
         try:
             # Return Union[tuple, dict, None]
             return cucm_method(self, *args, **kwargs)
+        except Exception as err:
+            raise _cucm_error_classify(self, err, message)
 
-        except (AttributeError, TypeError) as err:
-            err = str(err)
-            if "NoneType" in err:
-                logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
-                raise CucmAxlSessionError("Session FailedDependency error occurred. Client is None.")
-            elif ("Service has no operation" in err
-                  or "is not in allowed get methods" in err
-                  or "got an unexpected keyword argument" in err
-                  or "object has no attribute" in err):
-                # "Service has no operation 'method name'" - Method Error
-                # "is not in allowed get methods" - Method Error (Example: wrong get axl method "getPhon")
-                # "got an unexpected keyword argument" - Invalid Argument for AXL Methods (Example: "uud" vs. "uuid")
-                logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
-                raise CucmBadRequestError(f"BadRequest error occurred. {repr(err)}")
+    return wrapper
 
-            logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
-            raise CucmUnexpectedError(f"Unexpected error occurred. {repr(err)}")
-
-        except (Fault, ValidationError) as err:
-            history = self._cucm_history_show()
-            if "HTTP Status 401" in history:
-                raise CucmUnauthorizedError("Unauthorized error occurred.")
-            elif "<axlcode>5003</axlcode>" in history or "<axlcode>5007</axlcode>" in history:
-                # Only for AXL Requests - 404 Not Found
-                # Do or Get Request - AXLCode: 5007 - "Item not valid: The specified {{CUCM Object}} was not found"
-                # UpdateRequest - AXLCode: 5003 - "{{CUCM Object}} not found"
-                logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
-                logger.error(message.format(msg=f"History: {history}."))
-                raise CucmObjNotFoundError(f"NotFound error occurred. {repr(err)}")
-            else:
-                # For Invalid SQL Queries.
-                # AXLCode: 201 - "A syntax error has occurred"
-                # AXLCode: 217 - "Column ({{column_names}}) not found..."
-                logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
-                logger.error(message.format(msg=f"History: {history}."))
-                raise CucmBadRequestError(f"BadRequest error occurred. {repr(err)}")
-
-        except (ConnectionError, HTTPError, ProxyError, RequestException, Timeout) as err:
-            logger.error(message.format(msg=f"Error Detail: {repr(err)}"))
-            raise CucmConnectionError(f"Connection has been failed. {repr(err)}")
 
+def cucm_async_logging(cucm_method):
+
+    """
+    Connection & Methods Logging Decorator Of The Coroutine Methods (AsyncCucmClient)
+    :param cucm_method: CUCM Coroutine Method
+    :return:
+    """
+
+    @wraps(cucm_method)
+    async def wrapper(self, *args, **kwargs):
+
+        message = f"@ CUCM {repr(cucm_method.__name__)} Method @ - {{msg}}"
+        logger.debug(message.format(msg=f"Query Params:\nArgs: {args}\nKwargs: {kwargs}."))
+
+        # Request-Scoped History: Each asyncio Task Has Its Own History
+        self._cucm_history_reset()
+
+        try:
+            return await cucm_method(self, *args, **kwargs)
         except Exception as err:
-            logger.error(message.format(msg=f"Error Detail: {repr(err)}."))
-            logger.error(message.format(msg=f"History: {self._cucm_history_show()}"))
-            raise CucmUnexpectedError(f"Unexpected error occurred. {repr(err)}")
+            raise _cucm_error_classify(self, err, message)
 
     return wrapper
+
+
+def cucm_sql_cache(ttl: float):
+
+    """
+    Reference Data Cache Decorator. The Response Is Served From The Client Cache Until The TTL Expires.
+    :param ttl: Time-To-Live In Seconds, Overridden By The `sql_cache_ttl` Setting
+    :return:
+    """
+
+    def decorator(cucm_method):
+
+        @wraps(cucm_method)
+        def wrapper(self, *args, **kwargs):
+
+            cache = self._cucm_sql_cache
+            if cache is None:
+                return cucm_method(self, *args, **kwargs)
+
+            key = cucm_sql_cache_key(cucm_method.__name__, args, kwargs)
+            is_hit, resp = cache.get(key)
+            if is_hit:
+                logger.debug(f"@ CUCM {repr(cucm_method.__name__)} Method @ - Cache Hit.")
+                return resp
+
+            resp = cucm_method(self, *args, **kwargs)
+            cache.set(key, resp, ttl=self._cucm_sql_cache_ttl(cucm_method.__name__, ttl))
+            return resp
+
+        # Default TTL Of The Method (Batched Reads Are Cached Like The Method Calls)
+        wrapper.cucm_sql_cache_ttl = ttl
+        return wrapper
+
+    return decorator
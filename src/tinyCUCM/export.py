@@ -0,0 +1,161 @@
+import csv
+import json
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from queue import Full, Queue
+from typing import IO, Any, Optional, Union
+
+from .exceptions import CucmBadRequestError
+
+
+""" ######################################################### """
+""" **************** TINY CUCM SQL EXPORT ******************* """
+""" ######################################################### """
+
+
+CUCM_SQL_EXPORT_FORMATS = ("csv", "jsonl")
+
+# Rows Per Write (& Per Prefetched Batch), Max Number Of The Prefetched Batches (~ One Default Chunk)
+CUCM_SQL_EXPORT_BATCH_SIZE = 1000
+CUCM_SQL_EXPORT_PREFETCH_DEPTH = 5
+
+
+def _cucm_export_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _cucm_export_json_default(value: Any) -> str:
+    # Typed Responses: datetime, UUID
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _cucm_export_batches(rows: Iterable[dict], batch_size: int) -> Iterator[list[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _cucm_export_prefetch(
+    batches: Iterator[list[dict]],
+    depth: int = CUCM_SQL_EXPORT_PREFETCH_DEPTH
+) -> Iterator[list[dict]]:
+
+    """
+    Read The Batches In The Background Thread: The Next Chunk Is Fetched While The Current One Is Written.
+    Errors Of The Reader Are Raised In The Caller Thread.
+    :param batches: Rows Batches (Lazy, The Remote Chunks Are Fetched On Iteration)
+    :param depth:   Max Number Of The Read & Not Written Batches
+    :return:
+    """
+
+    queue = Queue(maxsize=depth)
+    is_stopped = threading.Event()
+    end = object()
+
+    def put(item: tuple) -> bool:
+        while not is_stopped.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def reader():
+        try:
+            for batch in batches:
+                if not put((batch, None)):
+                    return
+            put((end, None))
+        except BaseException as err:
+            put((end, err))
+
+    thread = threading.Thread(target=reader, name="tinyCUCM-export-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            batch, err = queue.get()
+            if batch is end:
+                if err is not None:
+                    raise err
+                return
+            yield batch
+    finally:
+        # The Writer Failed or Stopped Early: Release The Reader
+        is_stopped.set()
+
+
+def cucm_sql_export(
+    rows: Iterable[dict],
+    sink: Union[str, os.PathLike, IO[str]],
+    export_format: str = "jsonl",
+    columns: Optional[Iterable[str]] = None,
+    batch_size: int = CUCM_SQL_EXPORT_BATCH_SIZE,
+    is_prefetch: bool = True
+) -> int:
+
+    """
+    Stream The Rows To The File As CSV or JSONL. Rows Are Written By Batches & Flushed, The Memory Doesn't Depend
+    On The Number Of Rows.
+    :param rows:            Rows (Lazy Iterator Of The Chunked Execution)
+    :param sink:            File Path or Text File-Like Object (Opened With `newline=""` For CSV)
+    :param export_format:   `csv` or `jsonl`
+    :param columns:         CSV Columns (Header), The Columns Of The First Row If None
+    :param batch_size:      Rows Per Write
+    :param is_prefetch:     Fetch The Next Rows In The Background Thread While The Current Ones Are Written
+    :return:                Number Of Written Rows
+    """
+
+    if export_format not in CUCM_SQL_EXPORT_FORMATS:
+        raise CucmBadRequestError(
+            f"BadRequest error occurred. Invalid export format: {repr(export_format)}. "
+            f"Available: {CUCM_SQL_EXPORT_FORMATS}."
+        )
+
+    if isinstance(sink, (str, os.PathLike)):
+        with open(sink, "w", encoding="utf-8", newline="") as file:
+            return cucm_sql_export(
+                rows=rows,
+                sink=file,
+                export_format=export_format,
+                columns=columns,
+                batch_size=batch_size,
+                is_prefetch=is_prefetch
+            )
+
+    batches = _cucm_export_batches(rows, batch_size)
+    if is_prefetch:
+        batches = _cucm_export_prefetch(batches)
+
+    columns = list(columns) if columns else None
+    writer = None
+    count = 0
+    for batch in batches:
+        if export_format == "csv":
+            if writer is None:
+                columns = columns or list(batch[0])
+                writer = csv.writer(sink)
+                writer.writerow(columns)
+            writer.writerows([_cucm_export_value(row.get(column)) for column in columns] for row in batch)
+        else:
+            sink.write("".join(
+                json.dumps(row, ensure_ascii=False, default=_cucm_export_json_default) + "\n" for row in batch
+            ))
+        sink.flush()
+        count += len(batch)
+
+    # Header Of The Empty Result
+    if export_format == "csv" and writer is None and columns:
+        csv.writer(sink).writerow(columns)
+    return count
@@ -0,0 +1,217 @@
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Callable, Iterable, Optional
+
+from .exceptions import CucmBadRequestError
+
+
+""" ######################################################### """
+""" ************ TINY CUCM FORWARD DESTINATIONS INDEX ******* """
+""" ######################################################### """
+
+
+# Line Forward Destinations: {"forward_type": "column"}, Forward Types Are The `sqlSearchLineForwards` Columns
+CUCM_FORWARD_DESTINATIONS = {
+    "dst_all": "cfd.cfadestination",
+    "dst_ext_busy": "np.cfbdestination",
+    "dst_int_busy": "np.cfbintdestination",
+    "dst_ext_no_ans": "np.cfnadestination",
+    "dst_int_no_ans": "np.cfnaintdestination",
+    "dst_ext_unreg": "np.cfurdestination",
+    "dst_int_unreg": "np.cfurintdestination",
+}
+
+CUCM_FORWARD_INDEX_MATCHES = ("exact", "prefix", "suffix", "contains")
+
+
+class CucmForwardIndex:
+
+    """
+        tinyCUCM Forward Destinations Index. Inverted Index Of The Line Forward Destinations (All Forward Types).
+
+        * `exact`: dictionary lookup, `prefix` & `suffix`: binary search in the sorted destinations (reversed for
+          the suffix), `contains`: scan of the distinct destinations (not the lines).
+        * Lines are refreshed by pkid, the whole index is rebuilt when it's older than `refresh_interval`.
+        """
+
+    def __init__(self, fetch: Callable[[str], Iterable[dict]], refresh_interval: float = 3600):
+
+        """
+        :param fetch:               Remote Rows Getter: `fetch(sql_query) -> Iterable[dict]` (Chunked Execution)
+        :param refresh_interval:    Full Rebuild Interval (Seconds)
+        """
+
+        self.__fetch = fetch
+        self.__refresh_interval = refresh_interval
+        self.__lock = threading.RLock()
+
+        self.__lines: dict[str, dict[str, str]] = {}                    # {pkid: {forward_type: destination}}
+        self.__destinations: dict[str, dict[str, set[str]]] = {}        # {destination: {pkid: {forward_type}}}
+        self.__sorted: list[str] = []                                   # Destinations
+        self.__sorted_reversed: list[str] = []                          # Reversed Destinations
+        self.__refreshed_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self.__lines)
+
+    def __cucm_query(self, condition: str) -> str:
+
+        """
+        Forward Destinations SQL Query.
+        :param condition:   Lines Condition
+        :return:
+        """
+
+        return """SELECT np.pkid, {col}
+                    FROM numplan np
+               LEFT JOIN callforwarddynamic cfd ON cfd.fknumplan = np.pkid
+                   WHERE {con}
+                     AND np.tkpatternusage = '2'
+                ORDER BY np.pkid""".format(
+            col=", ".join(f"{column} AS {forward_type}" for forward_type, column in CUCM_FORWARD_DESTINATIONS.items()),
+            con=condition
+        )
+
+    def __cucm_destination_add(self, destination: str, pkid: str, forward_type: str):
+        lines = self.__destinations.get(destination)
+        if lines is None:
+            lines = self.__destinations[destination] = {}
+            insort(self.__sorted, destination)
+            insort(self.__sorted_reversed, destination[::-1])
+        lines.setdefault(pkid, set()).add(forward_type)
+
+    def __cucm_destination_remove(self, destination: str, pkid: str, forward_type: str):
+        lines = self.__destinations[destination]
+        lines[pkid].discard(forward_type)
+        if not lines[pkid]:
+            del lines[pkid]
+        if not lines:
+            del self.__destinations[destination]
+            del self.__sorted[bisect_left(self.__sorted, destination)]
+            del self.__sorted_reversed[bisect_left(self.__sorted_reversed, destination[::-1])]
+
+    def __cucm_line_update(self, pkid: str, forwards: dict[str, str]):
+
+        """
+        Replace The Line Forward Destinations.
+        :param pkid:        Line PKID
+        :param forwards:    New Destinations: `{forward_type: destination}`, Empty If The Line Was Removed
+        :return:
+        """
+
+        for forward_type, destination in self.__lines.pop(pkid, {}).items():
+            self.__cucm_destination_remove(destination, pkid, forward_type)
+        if forwards:
+            self.__lines[pkid] = forwards
+            for forward_type, destination in forwards.items():
+                self.__cucm_destination_add(destination, pkid, forward_type)
+
+    def refresh(self, pkids: Optional[Iterable[str]] = None):
+
+        """
+        Refresh The Index.
+        :param pkids:   Lines PKIDs (Incremental Refresh, Removed Lines Are Dropped), The Whole Index If None
+        :return:
+        """
+
+        if pkids is None:
+            rows = self.__fetch(self.__cucm_query(
+                "({})".format(" OR ".join(f"{column} <> ''" for column in CUCM_FORWARD_DESTINATIONS.values()))
+            ))
+            lines = {row["pkid"]: _cucm_forwards(row) for row in rows}
+            with self.__lock:
+                self.__lines.clear()
+                self.__destinations.clear()
+                self.__sorted.clear()
+                self.__sorted_reversed.clear()
+                for pkid, forwards in lines.items():
+                    self.__cucm_line_update(pkid, forwards)
+                self.__refreshed_at = time.time()
+            return
+
+        pkids = list(dict.fromkeys(str(pkid).lower() for pkid in pkids))
+        for index in range(0, len(pkids), 200):
+            chunk = pkids[index:index + 200]
+            rows = self.__fetch(self.__cucm_query(
+                "np.pkid IN ({})".format(", ".join("'{}'".format(pkid.replace("'", "''")) for pkid in chunk))
+            ))
+            lines = {row["pkid"]: _cucm_forwards(row) for row in rows}
+            with self.__lock:
+                for pkid in chunk:
+                    self.__cucm_line_update(pkid, lines.get(pkid, {}))
+
+    def update(self, rows: Iterable[dict]):
+
+        """
+        Update The Index By The Fetched Lines, Without A Request.
+        :param rows:    Lines Rows: `{"pkid": ..., "dst_all": ..., ...}` (All Forward Types Columns)
+        :return:
+        """
+
+        with self.__lock:
+            for row in rows:
+                self.__cucm_line_update(row["pkid"], _cucm_forwards(row))
+
+    def lookup(self, destination: str, match: str = "exact") -> dict[str, tuple[str, ...]]:
+
+        """
+        Lines Forwarded To The Destination.
+        :param destination: Forward Destination (Full or Part)
+        :param match:       `exact`, `prefix`, `suffix` or `contains`
+        :return:            `{pkid: (forward_type, ...)}`
+        """
+
+        if match not in CUCM_FORWARD_INDEX_MATCHES:
+            raise CucmBadRequestError(
+                f"BadRequest error occurred. Invalid match: {repr(match)}. Available: {CUCM_FORWARD_INDEX_MATCHES}."
+            )
+        if time.time() - self.__refreshed_at > self.__refresh_interval:
+            self.refresh()
+
+        with self.__lock:
+            if match == "exact":
+                destinations = [destination] if destination in self.__destinations else []
+            elif match == "prefix":
+                destinations = _cucm_prefix_range(self.__sorted, destination)
+            elif match == "suffix":
+                destinations = [item[::-1] for item in _cucm_prefix_range(self.__sorted_reversed, destination[::-1])]
+            else:
+                destinations = [item for item in self.__sorted if destination in item]
+
+            resp_result = {}
+            for item in destinations:
+                for pkid, forward_types in self.__destinations[item].items():
+                    resp_result.setdefault(pkid, set()).update(forward_types)
+        return {pkid: tuple(sorted(forward_types)) for pkid, forward_types in resp_result.items()}
+
+
+def cucm_forward_types(row: dict, destination: str, match: str = "exact") -> tuple[str, ...]:
+
+    """
+    Forward Types Of The Line Row Pointing To The Destination.
+    :param row:         Line Row: `{"dst_all": ..., "dst_ext_busy": ..., ...}`
+    :param destination: Forward Destination (Full or Part)
+    :param match:       `exact`, `prefix`, `suffix` or `contains`
+    :return:
+    """
+
+    check = {
+        "exact": lambda item: item == destination,
+        "prefix": lambda item: item.startswith(destination),
+        "suffix": lambda item: item.endswith(destination),
+        "contains": lambda item: destination in item,
+    }[match]
+    return tuple(sorted(forward_type for forward_type, item in _cucm_forwards(row).items() if check(item)))
+
+
+def _cucm_forwards(row: dict) -> dict[str, str]:
+    return {forward_type: row[forward_type] for forward_type in CUCM_FORWARD_DESTINATIONS if row.get(forward_type)}
+
+
+def _cucm_prefix_range(items: list[str], prefix: str) -> list[str]:
+    start = bisect_left(items, prefix)
+    end = start
+    while end < len(items) and items[end].startswith(prefix):
+        end += 1
+    return items[start:end]
@@ -0,0 +1,174 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+from .client import CucmClient
+from .exceptions import CucmBadRequestError, CucmBaseError
+from .logger import logger
+
+
+""" ######################################################### """
+""" ************** TINY CUCM CLUSTERS MANAGER *************** """
+""" ######################################################### """
+
+
+class CucmClusterManager:
+
+    """
+        tinyCUCM Clusters Manager. Warm Clients & Fan-Out Execution For Many CUCM Clusters.
+
+        * Clients are created on first use per cluster and kept for the next calls.
+        * `cluster_concurrency` limits the calls running at the same time against one cluster (publisher).
+        """
+
+    def __init__(
+        self,
+        clusters: Dict[str, dict],
+        max_workers: int = 16,
+        cluster_concurrency: int = 4,
+        **kwargs
+    ):
+
+        """
+        :param clusters:            Cluster Settings: `{"cluster_name": {"pub_fqdn": "str", ...}}`
+        :param max_workers:         Total Number Of Concurrent Calls
+        :param cluster_concurrency: Number Of Concurrent Calls Per Cluster
+        :param kwargs:              Settings Shared By All Clusters (toolkit_path, user_login, ...)
+        """
+
+        self.__clusters = {name: {**kwargs, **settings} for name, settings in clusters.items()}
+        self.__clients: Dict[str, CucmClient] = {}
+        self.__clients_lock = threading.Lock()
+        self.__semaphores = {name: threading.BoundedSemaphore(cluster_concurrency) for name in self.__clusters}
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tinyCUCM-cluster")
+
+    def __enter__(self) -> "CucmClusterManager":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def clusters(self) -> tuple[str, ...]:
+
+        """
+        Cluster Names Property.
+        :return:
+        """
+
+        return tuple(self.__clusters)
+
+    def close(self):
+
+        """
+        Stop The Worker Pool & Close The Pooled Sessions Of The Warm Clients.
+        :return:
+        """
+
+        self.__executor.shutdown(wait=True, cancel_futures=True)
+        with self.__clients_lock:
+            clients, self.__clients = self.__clients, {}
+        for client in clients.values():
+            client._cucm_close()
+
+    def client(self, cluster: str) -> CucmClient:
+
+        """
+        Warm Client Of The Cluster, Created On First Use.
+        :param cluster:     Cluster Name
+        :return:
+        """
+
+        if cluster not in self.__clusters:
+            raise CucmBadRequestError(f"BadRequest error occurred. Unknown cluster: {repr(cluster)}.")
+
+        client = self.__clients.get(cluster)
+        if client is None:
+            with self.__clients_lock:
+                client = self.__clients.get(cluster)
+                if client is None:
+                    client = CucmClient(**self.__clusters[cluster])
+                    self.__clients[cluster] = client
+        return client
+
+    def __cucm_cluster_call(self, cluster: str, method_name: str, args: tuple, kwargs: dict) -> Any:
+
+        """
+        Call The Client Method Within The Cluster Concurrency Limit.
+        :param cluster:     Cluster Name
+        :param method_name: CucmClient Method Name
+        :return:
+        """
+
+        with self.__semaphores[cluster]:
+            return getattr(self.client(cluster), method_name)(*args, **kwargs)
+
+    def run(
+        self,
+        method_name: str,
+        *args,
+        clusters: Optional[Iterable[str]] = None,
+        is_raise: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+
+        """
+        Run The Client Method Against Many Clusters Concurrently.
+
+        A cluster result is the method result or the `CucmBaseError` raised by the call (`is_raise=False`).
+
+        :param method_name: CucmClient Method Name (`sqlSearchDevices`, `risGetPhones`, ...)
+        :param clusters:    Cluster Names, All Clusters If None
+        :param is_raise:    Raise The First Cluster Error Instead Of Returning It
+        :return:            `{"cluster_name": result}`
+        """
+
+        log_message = f"@ CUCM Clusters {repr(method_name)} Method @ - {{message}}"
+
+        clusters = tuple(clusters or self.__clusters)
+        unknown_clusters = [cluster for cluster in clusters if cluster not in self.__clusters]
+        if unknown_clusters:
+            raise CucmBadRequestError(f"BadRequest error occurred. Unknown clusters: {repr(unknown_clusters)}.")
+
+        futures = {
+            cluster: self.__executor.submit(self.__cucm_cluster_call, cluster, method_name, args, kwargs)
+            for cluster in clusters
+        }
+        resp_result = {}
+        for cluster, future in futures.items():
+            try:
+                resp_result[cluster] = future.result()
+            except CucmBaseError as err:
+                logger.error(log_message.format(message=f"Cluster {repr(cluster)} Error Detail: {repr(err)}."))
+                if is_raise:
+                    raise
+                resp_result[cluster] = err
+        return resp_result
+
+    def run_merged(
+        self,
+        method_name: str,
+        *args,
+        clusters: Optional[Iterable[str]] = None,
+        cluster_key: str = "cluster",
+        **kwargs
+    ) -> tuple[dict, ...]:
+
+        """
+        Run The Client Method Against Many Clusters & Merge The Rows Tagged By Cluster Name.
+
+        For methods returning a collection of dictionaries (`sqlSearch*`, `sqlList*`, `risGetPhones`, ...).
+        Failed clusters are logged and skipped.
+
+        :param method_name: CucmClient Method Name
+        :param clusters:    Cluster Names, All Clusters If None
+        :param cluster_key: Row Key For The Cluster Name
+        :return:
+        """
+
+        resp_result = []
+        for cluster, rows in self.run(method_name, *args, clusters=clusters, **kwargs).items():
+            if isinstance(rows, CucmBaseError) or not rows:
+                continue
+            resp_result.extend({**row, cluster_key: cluster} for row in rows)
+        return tuple(resp_result)
@@ -0,0 +1,55 @@
+from collections import deque
+from contextvars import ContextVar
+from weakref import WeakKeyDictionary
+from zeep.plugins import HistoryPlugin
+
+
+""" ######################################################### """
+""" ******************* TINY CUCM PLUGINS ******************* """
+""" ######################################################### """
+
+
+# Context-Local History Buffers Of All Plugins: {CucmHistoryPlugin: deque}. One Module-Level Variable (Contexts Keep
+# Strong References To Their Variables), Short-Lived Clients Are Released With Their Plugins (Weak Keys)
+_CUCM_HISTORY_BUFFERS: ContextVar = ContextVar("cucm_history_buffers", default=None)
+
+
+class CucmHistoryPlugin(HistoryPlugin):
+
+    """
+        tinyCUCM Context-Local History Plugin.
+        Each thread (or asyncio task) sees only the envelopes of its own requests, so one client can be shared
+        by a thread pool without mixing up the history used for the error classification.
+        """
+
+    def __init__(self, maxlen: int = 1):
+        # `HistoryPlugin.__init__` isn't called, the buffer is context-local
+        self.__maxlen = maxlen
+
+    @property
+    def _buffer(self) -> deque:
+
+        """
+        Context-Local History Buffer.
+        :return:
+        """
+
+        buffers = _CUCM_HISTORY_BUFFERS.get()
+        buffer = buffers.get(self) if buffers is not None else None
+        if buffer is None:
+            buffer = self.reset()
+        return buffer
+
+    def reset(self) -> deque:
+
+        """
+        Start A New History Buffer For The Current Context.
+        The Mapping Is Copied, Not Changed In Place: Child Contexts (asyncio Tasks) Share It With The Parent.
+        :return:
+        """
+
+        buffer = deque([], self.__maxlen)
+        buffers = WeakKeyDictionary(_CUCM_HISTORY_BUFFERS.get() or {})
+        buffers[self] = buffer
+        _CUCM_HISTORY_BUFFERS.set(buffers)
+        return buffer
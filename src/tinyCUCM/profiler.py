@@ -0,0 +1,201 @@
+import hashlib
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+from .logger import logger
+
+
+""" ######################################################### """
+""" **************** TINY CUCM SQL PROFILER ***************** """
+""" ######################################################### """
+
+
+CUCM_SQL_FINGERPRINT_PATTERNS = (
+    (re.compile(r"'(?:[^']|'')*'"), "?"),                                  # String Literals
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),                                # Numbers
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(?+)"),                    # IN Lists Of Any Length
+    (re.compile(r"\s+"), " "),                                              # Whitespaces
+)
+
+CUCM_SQL_PROFILER_PERCENTILES = (50, 95, 99)
+
+_CUCM_PACKAGE_PATH = os.path.dirname(os.path.abspath(__file__))
+_CUCM_CLIENT_FILENAMES = (
+    os.path.join(_CUCM_PACKAGE_PATH, "client.py"),
+    os.path.join(_CUCM_PACKAGE_PATH, "async_client.py"),
+)
+
+
+def cucm_sql_fingerprint(sql_query: str) -> str:
+
+    """
+    Query Fingerprint: The Query With The Literals Replaced By `?` & The Whitespaces Collapsed, Queries Differing
+    By The Values Only (Search Values, PKIDs, `SKIP`/`FIRST`, `IN (...)` Lists) Have The Same Fingerprint.
+    :param sql_query:   SQL Query Expression
+    :return:
+    """
+
+    for pattern, replacement in CUCM_SQL_FINGERPRINT_PATTERNS:
+        sql_query = pattern.sub(replacement, sql_query)
+    return sql_query.strip()
+
+
+def _cucm_sql_caller() -> tuple[Optional[str], Optional[str]]:
+
+    """
+    Calling Method & Calling Code Of The Query.
+    :return:    `(method, origin)`: The Outermost Public CucmClient Method (The Outermost Client Method If None Is
+                Public) & `file:line` Of The First Frame Outside The Package
+    """
+
+    method = private_method = origin = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename in _CUCM_CLIENT_FILENAMES:
+            name = frame.f_code.co_name
+            if name.startswith("_"):
+                private_method = name
+            else:
+                method = name
+        elif not filename.startswith(_CUCM_PACKAGE_PATH):
+            origin = f"{filename}:{frame.f_lineno}"
+            break
+        frame = frame.f_back
+    return method or private_method, origin
+
+
+def _cucm_percentile(samples: list[float], percentile: float) -> float:
+    # Nearest-Rank Percentile Of The Sorted Samples
+    index = max(0, min(len(samples) - 1, -(-len(samples) * percentile // 100) - 1))
+    return samples[int(index)]
+
+
+class CucmSqlProfiler:
+
+    """
+        tinyCUCM SQL Profiler. Statistics Of The SQL Queries Sent To The Publisher.
+
+        * Every query is recorded with its fingerprint, wall time, response bytes, row count & calling method.
+        * Queries slower than `slow_threshold` are logged (WARNING) & kept in the slow-query log.
+        * Aggregates per fingerprint: count, total, mean, max & p50/p95/p99 wall time (of the last `samples`
+          queries), bytes & rows.
+        """
+
+    def __init__(self, slow_threshold: float = 1.0, samples: int = 1000, slow_log_size: int = 100):
+
+        """
+        :param slow_threshold:  Slow Query Wall Time (Seconds)
+        :param samples:         Max Number Of The Wall Time Samples Per Fingerprint (Percentiles)
+        :param slow_log_size:   Max Number Of The Slow-Query Log Entries
+        """
+
+        self.slow_threshold = slow_threshold
+        self.__samples = samples
+        self.__lock = threading.Lock()
+        self.__stats: dict[str, dict[str, Any]] = {}        # {fingerprint: aggregates}
+        self.__slow_log: deque[dict[str, Any]] = deque(maxlen=slow_log_size)
+
+    def record(self, sql_query: str, elapsed: float, response_bytes: int, rows: int, is_error: bool = False):
+
+        """
+        Record The Query.
+        :param sql_query:       SQL Query Expression
+        :param elapsed:         Wall Time (Seconds)
+        :param response_bytes:  Response Size
+        :param rows:            Number Of Rows
+        :param is_error:        Query Failed (SQL Fault, Connection Error)
+        :return:
+        """
+
+        fingerprint = cucm_sql_fingerprint(sql_query)
+        method, origin = _cucm_sql_caller()
+        with self.__lock:
+            stats = self.__stats.get(fingerprint)
+            if stats is None:
+                stats = self.__stats[fingerprint] = {
+                    "fingerprint_id": hashlib.sha1(fingerprint.encode()).hexdigest()[:12],
+                    "fingerprint": fingerprint,
+                    "methods": set(),
+                    "count": 0,
+                    "errors": 0,
+                    "slow": 0,
+                    "total_time": 0.0,
+                    "max_time": 0.0,
+                    "bytes": 0,
+                    "rows": 0,
+                    "samples": deque(maxlen=self.__samples),
+                }
+            stats["methods"].add(method)
+            stats["count"] += 1
+            stats["errors"] += is_error
+            stats["total_time"] += elapsed
+            stats["max_time"] = max(stats["max_time"], elapsed)
+            stats["bytes"] += response_bytes
+            stats["rows"] += rows
+            stats["samples"].append(elapsed)
+
+            if elapsed < self.slow_threshold:
+                return
+            stats["slow"] += 1
+            entry = {
+                "timestamp": time.time(),
+                "fingerprint_id": stats["fingerprint_id"],
+                "method": method,
+                "origin": origin,
+                "elapsed": elapsed,
+                "bytes": response_bytes,
+                "rows": rows,
+                "sql_query": sql_query,
+            }
+            self.__slow_log.append(entry)
+        logger.warning(
+            f"@ CUCM SQL Profiler @ - Slow query {entry['fingerprint_id']} ({elapsed:.3f} s, {rows} rows, "
+            f"{response_bytes} bytes), method {repr(method)}, origin {repr(origin)}:\n{sql_query}"
+        )
+
+    def stats(self) -> tuple[dict[str, Any], ...]:
+
+        """
+        Aggregates Per Fingerprint, The Most Expensive (Total Wall Time) First.
+        :return:
+        """
+
+        with self.__lock:
+            items = [(dict(stats), sorted(stats["samples"])) for stats in self.__stats.values()]
+
+        resp_result = []
+        for stats, samples in items:
+            stats.pop("samples")
+            stats["methods"] = ", ".join(sorted(method for method in stats["methods"] if method))
+            stats["mean_time"] = stats["total_time"] / stats["count"]
+            for percentile in CUCM_SQL_PROFILER_PERCENTILES:
+                stats[f"p{percentile}_time"] = _cucm_percentile(samples, percentile)
+            resp_result.append(stats)
+        return tuple(sorted(resp_result, key=lambda item: item["total_time"], reverse=True))
+
+    def slow_queries(self) -> tuple[dict[str, Any], ...]:
+
+        """
+        Slow-Query Log, The Oldest First.
+        :return:
+        """
+
+        with self.__lock:
+            return tuple(dict(entry) for entry in self.__slow_log)
+
+    def reset(self):
+
+        """
+        Drop The Statistics & The Slow-Query Log.
+        :return:
+        """
+
+        with self.__lock:
+            self.__stats.clear()
+            self.__slow_log.clear()
@@ -0,0 +1,197 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Callable, Optional, Union
+
+
+""" ######################################################### """
+""" **************** TINY CUCM SQL RECORDS ****************** """
+""" ######################################################### """
+
+
+class CucmSqlRecords(Sequence):
+
+    """
+        tinyCUCM SQL Records. Compact Column-Oriented Container Of The SQL Rows Sharing One Column Schema.
+
+        * Column names are stored once per container (not once per row).
+        * Every column is dictionary-encoded: distinct values are stored once, rows keep 1-4 byte codes
+          (device pools, models, partitions, flags, ... take 1 byte per row).
+        * Iteration & indexing return dictionaries built on access, like the rows of the regular response.
+        """
+
+    __slots__ = ("__columns", "__positions", "__values", "__codes", "__size")
+
+    def __init__(
+        self,
+        columns: Iterable[str] = (),
+        values: Iterable[list] = (),
+        codes: Iterable[array] = (),
+        size: int = 0
+    ):
+
+        """
+        Use `from_items` or `concat` To Build The Container.
+        :param columns: Column Names
+        :param values:  Distinct Values Per Column, The Code 0 Is None
+        :param codes:   Value Codes Per Column (One Code Per Row)
+        :param size:    Number Of Rows
+        """
+
+        self.__columns = tuple(columns)
+        self.__positions = {column: position for position, column in enumerate(self.__columns)}
+        self.__values = tuple(values)
+        self.__codes = tuple(codes)
+        self.__size = size
+
+    @classmethod
+    def from_items(cls, rows: Iterable[Iterable[tuple[str, Optional[str]]]]) -> "CucmSqlRecords":
+
+        """
+        Build The Container From The Rows Of `(column, value)` Pairs (`dict.items()`, XML Row Cells).
+        Columns Missing In Some Rows Are None There.
+        :param rows:    Rows Of `(column, value)` Pairs
+        :return:
+        """
+
+        columns = []
+        positions = {}
+        values = []             # [[None, value, ...], ...]
+        lookups = []            # [{value: code}, ...]
+        codes = []              # [array("I", [code, ...]), ...]
+        size = 0
+        for row in rows:
+            row_codes = [0] * len(columns)
+            for column, value in row:
+                position = positions.get(column)
+                if position is None:
+                    position = positions[column] = len(columns)
+                    columns.append(column)
+                    values.append([None])
+                    lookups.append({None: 0})
+                    codes.append(array("I", bytes(4 * size)))
+                    row_codes.append(0)
+                code = lookups[position].get(value)
+                if code is None:
+                    code = lookups[position][value] = len(values[position])
+                    values[position].append(value)
+                row_codes[position] = code
+            for position, code in enumerate(row_codes):
+                codes[position].append(code)
+            size += 1
+
+        # The Smallest Code Type Per Column
+        codes = [
+            array("B" if len(column_values) <= 0xFF else "H" if len(column_values) <= 0xFFFF else "I", column_codes)
+            for column_values, column_codes in zip(values, codes)
+        ]
+        return cls(columns=columns, values=values, codes=codes, size=size)
+
+    @classmethod
+    def concat(cls, records: Iterable["CucmSqlRecords"]) -> "CucmSqlRecords":
+
+        """
+        Concatenate The Containers (The Chunks Of One Response).
+        :param records: Containers
+        :return:
+        """
+
+        return cls.from_items(
+            zip(chunk.columns, row) for chunk in records for row in chunk.rows()
+        )
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+
+        """
+        Column Names Property.
+        :return:
+        """
+
+        return self.__columns
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[dict, "CucmSqlRecords"]:
+        if isinstance(index, slice):
+            codes = tuple(column_codes[index] for column_codes in self.__codes)
+            return self.__class__(
+                columns=self.__columns,
+                values=self.__values,
+                codes=codes,
+                size=len(range(*index.indices(self.__size)))
+            )
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        return dict(zip(self.__columns, self.__cucm_row(index)))
+
+    def __iter__(self) -> Iterator[dict]:
+        for row in self.rows():
+            yield dict(zip(self.__columns, row))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CucmSqlRecords):
+            return self.__columns == other.columns and tuple(self.rows()) == tuple(other.rows())
+        if isinstance(other, (tuple, list)):
+            return self.to_dicts() == tuple(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(columns={self.__columns}, rows={self.__size})"
+
+    def __cucm_row(self, index: int) -> tuple:
+        return tuple(
+            column_values[column_codes[index]] for column_values, column_codes in zip(self.__values, self.__codes)
+        )
+
+    def rows(self) -> Iterator[tuple]:
+
+        """
+        Rows As Tuples Of Values In The Column Order.
+        :return:
+        """
+
+        if not self.__columns:
+            yield from (() for _ in range(self.__size))
+            return
+        yield from zip(*(
+            map(column_values.__getitem__, column_codes)
+            for column_values, column_codes in zip(self.__values, self.__codes)
+        ))
+
+    def column(self, name: str) -> tuple[Optional[str], ...]:
+
+        """
+        Values Of The Column.
+        :param name:    Column Name
+        :return:
+        """
+
+        position = self.__positions[name]
+        column_values = self.__values[position]
+        return tuple(column_values[code] for code in self.__codes[position])
+
+    def map_columns(self, converters: dict[str, Callable[[Optional[str]], Any]]) -> "CucmSqlRecords":
+
+        """
+        Convert The Columns. Only The Distinct Values Are Converted, The Row Codes Are Shared.
+        :param converters:  Column Converters: `{"column": converter}`
+        :return:            New Container
+        """
+
+        values = [
+            list(map(converters[column], column_values)) if column in converters else column_values
+            for column, column_values in zip(self.__columns, self.__values)
+        ]
+        return self.__class__(columns=self.__columns, values=values, codes=self.__codes, size=self.__size)
+
+    def to_dicts(self) -> tuple[dict, ...]:
+
+        """
+        Convert To The Regular Response: Tuple Of Dictionaries.
+        :return:
+        """
+
+        return tuple(self)
@@ -0,0 +1,468 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+from uuid import UUID
+
+from .logger import logger
+from .records import CucmSqlRecords
+from .sql_queries import CUCM_SQL_SEARCH_QUERIES
+
+
+""" ######################################################### """
+""" ***************** TINY CUCM SQL REPLICA ***************** """
+""" ######################################################### """
+
+
+# Informix Integer Columns Of The Replica Tables (Numeric Order & Comparison), Others Are Stored As Text
+CUCM_SQL_REPLICA_INTEGER_COLUMNS = (
+    "answertoolatetimer",
+    "cfnaduration",
+    "delaybeforeringingcell",
+    "lineselectionorder",
+    "numplanindex",
+    "status",
+)
+
+# AXL Change Notification Object Types -> Replica Table & Dependent Tables Refreshed With It:
+# {"Type": ("table", (("child_table", "child_column", "table_column"), ...))}
+CUCM_SQL_REPLICA_CHANGE_TABLES = {
+    "CallPickupGroup": (
+        "pickupgroup",
+        (("pickupgrouplinemap", "fkpickupgroup", "pkid"), ("numplan", "pkid", "fknumplan_pickup"))
+    ),
+    "Css": ("callingsearchspace", ()),
+    "DevicePool": ("devicepool", ()),
+    "DeviceProfile": ("device", (("devicenumplanmap", "fkdevice", "pkid"),)),
+    "HuntPilot": ("numplan", ()),
+    "Line": (
+        "numplan",
+        (
+            ("callforwarddynamic", "fknumplan", "pkid"),
+            ("devicenumplanmap", "fknumplan", "pkid"),
+            ("linegroupnumplanmap", "fknumplan", "pkid"),
+            ("pickupgrouplinemap", "fknumplan_line", "pkid"),
+        )
+    ),
+    "LineGroup": ("linegroup", (("linegroupnumplanmap", "fklinegroup", "pkid"),)),
+    "Phone": ("device", (("devicenumplanmap", "fkdevice", "pkid"),)),
+    "RemoteDestination": ("remotedestination", (("remotedestinationdynamic", "fkremotedestination", "pkid"),)),
+    "RemoteDestinationProfile": ("device", (("devicenumplanmap", "fkdevice", "pkid"),)),
+    "RoutePartition": ("routepartition", ()),
+    "RoutePattern": ("numplan", ()),
+    "TransPattern": ("numplan", ()),
+    "User": ("enduser", ()),
+}
+
+# Max Number Of Keys In The `IN (...)` List Of One Request
+CUCM_SQL_REPLICA_IN_LIST_SIZE = 200
+
+
+def cucm_sql_replica_tables() -> dict[str, tuple[str, ...]]:
+
+    """
+    Replica Tables & Columns Referenced By The Search Queries, The Key Column (`pkid` or `enum`) Goes First.
+    :return:    `{"table": ("key_column", "column", ...)}`
+    """
+
+    table_columns = {}
+    for query in CUCM_SQL_SEARCH_QUERIES:
+        for table, columns in query.table_columns.items():
+            table_columns.setdefault(table, set()).update(columns)
+
+    tables = {}
+    for table, columns in sorted(table_columns.items()):
+        key = cucm_sql_replica_key(table)
+        tables[table] = (key, *sorted(columns - {key}))
+    return tables
+
+
+def cucm_sql_replica_key(table: str) -> str:
+
+    """
+    Key Column Of The Table: `enum` For The Type (Enum) Tables, `pkid` For Others.
+    :param table:   Table Name
+    :return:
+    """
+
+    return "enum" if table.startswith("type") else "pkid"
+
+
+def _cucm_sql_replica_column_type(column: str) -> str:
+    if column == "enum" or column.startswith("tk") or column in CUCM_SQL_REPLICA_INTEGER_COLUMNS:
+        return "INTEGER"
+    return "TEXT"
+
+
+class CucmSqlReplica:
+
+    """
+        tinyCUCM SQL Replica. Local SQLite Copy Of The Tables Used By The `sqlSearch*` Methods.
+
+        * The search queries run against the replica file as is: same tables, columns & aliases.
+        * Empty Informix values are stored as empty strings (AXL doesn't tell NULL from ''), so `= ''` searches
+          work locally. Missing joins still give NULL (`IS NULL` searches).
+        * `LIKE` is case-sensitive like Informix.
+        * The file is rebuilt into a temporary file and replaced atomically, readers are never blocked.
+        """
+
+    def __init__(self, path: str, max_age: Optional[float] = None):
+
+        """
+        :param path:    SQLite File Path
+        :param max_age: Max Age (Seconds) Since The Last Build or Sync, The Publisher Is Requested If Older.
+                        Never Expires If None
+        """
+
+        self.__path = path
+        self.__max_age = max_age
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+
+        """
+        SQLite File Path Property.
+        :return:
+        """
+
+        return self.__path
+
+    @property
+    def is_ready(self) -> bool:
+
+        """
+        Replica Is Built Property.
+        :return:
+        """
+
+        return os.path.isfile(self.__path)
+
+    @property
+    def is_fresh(self) -> bool:
+
+        """
+        Replica Is Built & Not Older Than `max_age` (Since The Last Build or Sync) Property.
+        :return:
+        """
+
+        if not self.is_ready:
+            return False
+        if self.__max_age is None:
+            return True
+        meta = self.info() or {}
+        updated_at = max(float(meta.get("built_at") or 0), float(meta.get("synced_at") or 0))
+        age = time.time() - updated_at
+        if age > self.__max_age:
+            logger.warning(
+                f"@ CUCM SQL Replica @ - {repr(self.__path)}, replica is stale ({int(age)}s > {self.__max_age}s), "
+                f"the publisher is requested."
+            )
+            return False
+        return True
+
+    def connect(self, path: Optional[str] = None) -> sqlite3.Connection:
+
+        """
+        New Connection To The Replica, Connections Aren't Shared Between Threads.
+        :param path:    SQLite File Path, Replica File If None
+        :return:
+        """
+
+        connection = sqlite3.connect(path or self.__path, timeout=30)
+        connection.execute("PRAGMA case_sensitive_like = ON")
+        # Built-In LOWER / UPPER Fold ASCII Only, Informix Folds Any Letters (`LOWER(col) LIKE '%иван%'`)
+        connection.create_function("LOWER", 1, _cucm_sql_replica_lower, deterministic=True)
+        connection.create_function("UPPER", 1, _cucm_sql_replica_upper, deterministic=True)
+        return connection
+
+    def info(self) -> Union[dict, None]:
+
+        """
+        Replica Metadata: Publisher, Build Time, Rows Per Table.
+        :return:
+        """
+
+        if not self.is_ready:
+            return None
+        with closing(self.connect()) as connection:
+            return dict(connection.execute("SELECT key, value FROM replica_meta").fetchall())
+
+    def execute(self, sql_query: str, is_compact_resp: bool = False) -> Union[tuple[dict, ...], CucmSqlRecords, None]:
+
+        """
+        Run The Search Query Against The Replica. Rows Look Like The AXL Rows: String Values, None If Empty.
+        :param sql_query:       SQL `SELECT` Query Expression
+        :param is_compact_resp: Return The Compact Container (CucmSqlRecords) Instead Of The Tuple Of Dictionaries
+        :return:
+        """
+
+        with closing(self.connect()) as connection:
+            cursor = connection.execute(sql_query)
+            names = [column[0] for column in cursor.description]
+            rows = (
+                ((name, None if value is None or value == "" else str(value)) for name, value in zip(names, row))
+                for row in cursor
+            )
+            resp_result = CucmSqlRecords.from_items(rows) if is_compact_resp else tuple(dict(row) for row in rows)
+        return resp_result or None
+
+    def execute_chunks(self, sql_query: str, chunk_size: int) -> Iterator[tuple[dict, ...]]:
+
+        """
+        Run The Search Query Against The Replica, Rows Are Read From The Cursor In Chunks.
+        :param sql_query:   SQL `SELECT` Query Expression
+        :param chunk_size:  Rows Per Chunk
+        :return:
+        """
+
+        with closing(self.connect()) as connection:
+            cursor = connection.execute(sql_query)
+            names = [column[0] for column in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield tuple(
+                    {name: None if value is None or value == "" else str(value) for name, value in zip(names, row)}
+                    for row in rows
+                )
+
+    def execute_page(self, sql_query: str, size: int, offset: int = 0) -> Union[tuple[dict, ...], None]:
+
+        """
+        Run The Page Query Against The Replica (`LIMIT` & `OFFSET` Instead Of The Informix `SKIP` & `FIRST`).
+        :param sql_query:   SQL `SELECT` Query Expression With The `ORDER BY` Clause
+        :param size:        Max Number Of Rows
+        :param offset:      Rows Skipped Before The Page
+        :return:
+        """
+
+        return self.execute(sql_query=f"{sql_query}\n LIMIT {int(size)} OFFSET {int(offset)}")
+
+    def build(self, fetch: Callable[[str], Iterable[dict]], meta: Optional[dict] = None) -> dict[str, int]:
+
+        """
+        Rebuild The Replica From The Remote Tables.
+        :param fetch:   Remote Rows Getter: `fetch(sql_query) -> Iterable[dict]` (Chunked Execution)
+        :param meta:    Additional Metadata (Publisher, ...)
+        :return:        Rows Per Table
+        """
+
+        log_message = "@ CUCM SQL Replica @ - {message}"
+
+        with self.__lock:
+            temp_path = f"{self.__path}.{os.getpid()}.tmp"
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+
+            resp_result = {}
+            try:
+                with closing(self.connect(temp_path)) as connection, connection:
+                    connection.execute("CREATE TABLE replica_meta (key TEXT PRIMARY KEY, value TEXT)")
+                    for table, columns in cucm_sql_replica_tables().items():
+                        self.create_table(connection, table, columns)
+                        rows = fetch(
+                            "SELECT {col} FROM {tab} ORDER BY {key}".format(
+                                col=", ".join(columns), tab=table, key=columns[0]
+                            )
+                        )
+                        resp_result[table] = self.upsert(connection, table, columns, rows)
+                        logger.debug(log_message.format(message=f"{repr(table)}: {resp_result[table]} rows."))
+
+                    self.meta_update(connection, {**(meta or {}), "built_at": time.time(), **resp_result})
+                os.replace(temp_path, self.__path)
+            except BaseException:
+                if os.path.isfile(temp_path):
+                    os.remove(temp_path)
+                raise
+        return resp_result
+
+    def checkpoint(self) -> Union[tuple[str, int], None]:
+
+        """
+        Change Notification Position Of The Replica: `(queue_id, next_change_id)`. None If It Isn't Tracked.
+        :return:
+        """
+
+        meta = self.info() or {}
+        if not meta.get("queue_id") or not meta.get("next_change_id"):
+            return None
+        return meta["queue_id"], int(meta["next_change_id"])
+
+    def apply_changes(
+        self,
+        changes: Iterable[dict],
+        fetch: Callable[[str], Iterable[dict]],
+        checkpoint: tuple[str, int]
+    ) -> dict[str, int]:
+
+        """
+        Apply The AXL Change Notifications: Refresh Added & Updated Objects By Pkid, Delete Removed Objects.
+        The Changes & The New Checkpoint Are Committed Together, An Interrupted Sync Is Resumed From The Old One.
+        :param changes:     AXL Changes: `[{"type": "Phone", "uuid": "{...}", "action": "a" | "u" | "r"}, ...]`
+        :param fetch:       Remote Rows Getter: `fetch(sql_query) -> Iterable[dict]` (Chunked Execution)
+        :param checkpoint:  New Checkpoint: `(queue_id, next_change_id)`
+        :return:            Refreshed (Upserted or Deleted) Rows Per Table
+        """
+
+        # Last Action Per Object Wins: {("Type", "pkid"): "action"}
+        actions = {}
+        for change in changes:
+            if change.get("type") in CUCM_SQL_REPLICA_CHANGE_TABLES and change.get("uuid"):
+                pkid = str(UUID(change["uuid"].strip("{}")))
+                actions.pop((change["type"], pkid), None)
+                actions[(change["type"], pkid)] = change.get("action")
+
+        # {("Type", is_removed): [pkid, ...]}
+        groups = {}
+        for (change_type, pkid), action in actions.items():
+            groups.setdefault((change_type, action == "r"), []).append(pkid)
+
+        tables = cucm_sql_replica_tables()
+        resp_result = {}
+        with self.__lock, closing(self.connect()) as connection, connection:
+            for (change_type, is_removed), pkids in groups.items():
+                table, children = CUCM_SQL_REPLICA_CHANGE_TABLES[change_type]
+                for index in range(0, len(pkids), CUCM_SQL_REPLICA_IN_LIST_SIZE):
+                    in_list = ", ".join(f"'{pkid}'" for pkid in pkids[index:index + CUCM_SQL_REPLICA_IN_LIST_SIZE])
+                    # Dependent Rows: Local Delete By The Old Parent Values, Remote Fetch By The New Ones
+                    for child_table, child_column, table_column in children:
+                        condition = "{col} IN (SELECT {par} FROM {tab} WHERE pkid IN ({val}))".format(
+                            col=child_column, par=table_column, tab=table, val=in_list
+                        )
+                        count = connection.execute(f"DELETE FROM {child_table} WHERE {condition}").rowcount
+                        if not is_removed:
+                            count = self.__cucm_replica_fetch(
+                                connection, fetch, child_table, tables[child_table], condition
+                            )
+                        resp_result[child_table] = resp_result.get(child_table, 0) + count
+                    count = connection.execute(f"DELETE FROM {table} WHERE pkid IN ({in_list})").rowcount
+                    if not is_removed:
+                        count = self.__cucm_replica_fetch(
+                            connection, fetch, table, tables[table], f"pkid IN ({in_list})"
+                        )
+                    resp_result[table] = resp_result.get(table, 0) + count
+
+            queue_id, next_change_id = checkpoint
+            self.meta_update(
+                connection, {"queue_id": queue_id, "next_change_id": next_change_id, "synced_at": time.time()}
+            )
+        return resp_result
+
+    def __cucm_replica_fetch(
+        self,
+        connection: sqlite3.Connection,
+        fetch: Callable[[str], Iterable[dict]],
+        table: str,
+        columns: tuple[str, ...],
+        condition: str
+    ) -> int:
+
+        """
+        Fetch The Remote Rows Of The Table By The Condition & Upsert Them.
+        :param connection:  Replica Connection
+        :param fetch:       Remote Rows Getter
+        :param table:       Table Name
+        :param columns:     Columns, The Key Column Goes First
+        :param condition:   SQL Condition, Valid For Both Informix & SQLite
+        :return:            Number Of Rows
+        """
+
+        rows = fetch(
+            "SELECT {col} FROM {tab} WHERE {con} ORDER BY {key}".format(
+                col=", ".join(columns), tab=table, con=condition, key=columns[0]
+            )
+        )
+        return self.upsert(connection, table, columns, rows)
+
+    @staticmethod
+    def create_table(connection: sqlite3.Connection, table: str, columns: tuple[str, ...]):
+
+        """
+        Create The Replica Table, Key & Foreign Key Columns Are Indexed For The Search Joins.
+        :param connection:  Replica Connection
+        :param table:       Table Name
+        :param columns:     Columns, The Key Column Goes First
+        :return:
+        """
+
+        connection.execute(
+            "CREATE TABLE {tab} ({col}, PRIMARY KEY ({key}))".format(
+                tab=table,
+                col=", ".join(f"{column} {_cucm_sql_replica_column_type(column)}" for column in columns),
+                key=columns[0]
+            )
+        )
+        for column in columns[1:]:
+            if column.startswith(("fk", "tk")):
+                connection.execute(f"CREATE INDEX ix_{table}_{column} ON {table} ({column})")
+
+    @staticmethod
+    def upsert(
+        connection: sqlite3.Connection,
+        table: str,
+        columns: tuple[str, ...],
+        rows: Iterable[dict]
+    ) -> int:
+
+        """
+        Insert Or Replace The Rows (By The Key Column).
+        :param connection:  Replica Connection
+        :param table:       Table Name
+        :param columns:     Columns, The Key Column Goes First
+        :param rows:        Remote Rows
+        :return:            Number Of Rows
+        """
+
+        cursor = connection.executemany(
+            "INSERT OR REPLACE INTO {tab} ({col}) VALUES ({val})".format(
+                tab=table, col=", ".join(columns), val=", ".join("?" * len(columns))
+            ),
+            _cucm_sql_replica_values(columns, rows)
+        )
+        return cursor.rowcount
+
+    @staticmethod
+    def meta_update(connection: sqlite3.Connection, meta: dict):
+
+        """
+        Update The Replica Metadata.
+        :param connection:  Replica Connection
+        :param meta:        Metadata
+        :return:
+        """
+
+        connection.executemany(
+            "INSERT OR REPLACE INTO replica_meta (key, value) VALUES (?, ?)",
+            ((key, str(value)) for key, value in meta.items())
+        )
+
+
+def _cucm_sql_replica_lower(value: Any) -> Union[str, None]:
+
+    """
+    Unicode `LOWER` Of The Replica Connections.
+    :param value:   Column Value
+    :return:
+    """
+
+    return None if value is None else str(value).lower()
+
+
+def _cucm_sql_replica_upper(value: Any) -> Union[str, None]:
+
+    """
+    Unicode `UPPER` Of The Replica Connections.
+    :param value:   Column Value
+    :return:
+    """
+
+    return None if value is None else str(value).upper()
+
+
+def _cucm_sql_replica_values(columns: tuple[str, ...], rows: Iterable[dict]) -> Iterator[tuple]:
+    for row in rows:
+        yield tuple("" if row.get(column) is None else row[column] for column in columns)
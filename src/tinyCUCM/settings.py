@@ -1,18 +1,33 @@
 import os
+import ssl
+import threading
+from collections import OrderedDict
 from lxml import etree
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from typing import Union
+from typing import Optional, Union
 from urllib3 import disable_warnings
 from urllib3.exceptions import InsecureRequestWarning
-from zeep import Client
+from zeep import AsyncClient, Client
 from zeep.cache import SqliteCache
-from zeep.plugins import HistoryPlugin
-from zeep.proxy import ServiceProxy
-from zeep.transports import Transport
+from zeep.proxy import AsyncServiceProxy, ServiceProxy
+from zeep.settings import Settings
+from zeep.transports import AsyncTransport, Transport
 
+from .cache import CucmSqlCache
 from .exceptions import CucmSessionError
 from .logger import logger
+from .plugins import CucmHistoryPlugin
+from .profiler import CucmSqlProfiler
+from .replica import CucmSqlReplica
+from .snapshot import cucm_wsdl_document_load
+
+try:
+    import httpx
+except ImportError:
+    # Optional `async` Extra (AsyncCucmClient): `pip install tinyCUCM[async]`
+    httpx = None
 
 
 """ ######################################################### """
@@ -31,12 +46,29 @@ class CucmSettings:
 
         disable_warnings(InsecureRequestWarning)
 
-        self._axl = None
-        self._axl_client = None     # Workaround for CSCvq98025 (axlAddRemoteDestination)
-        self._axl_transport = None  # Workaround for CSCvq98025 (axlAddRemoteDestination)
-        self._ccs = None            # Control Center Services
-        self._ris = None            # Real-time Information Server
-        self._ris_factory = None    # Real-time Information Server
+        # Guards the lazy creation of the session, services & caches shared by threads
+        self._cucm_lock = threading.RLock()
+
+        # Services are built on first use (see the `_axl`, `_ccs` and `_ris` properties)
+        self.__axl = None
+        self.__axl_client = None        # Workaround for CSCvq98025 (axlAddRemoteDestination)
+        self.__axl_transport = None     # Workaround for CSCvq98025 (axlAddRemoteDestination)
+        self.__ccs = None               # Control Center Services
+        self.__ccs_client = None        # Control Center Services
+        self.__ccs_nodes = OrderedDict()  # Control Center Services of Cluster Nodes: {node_fqdn: ServiceProxy}
+        self.__ris = None               # Real-time Information Server
+        self.__ris_factory = None       # Real-time Information Server
+
+        # asyncio Services (AsyncCucmClient) Are Built On First Use Over One Pooled httpx Transport
+        self.__async_transport = None
+        self.__axl_async = None
+        self.__axl_async_client = None
+        self.__axl_sql_async = None     # Raw SQL Responses (Parsed Without zeep)
+        self.__ccs_async = None
+        self.__ccs_async_client = None
+        self.__ccs_async_nodes = OrderedDict()  # {node_fqdn: AsyncServiceProxy}
+        self.__ris_async = None
+        self.__ris_async_factory = None
 
         self.__pub_fqdn: str = kwargs.get("pub_fqdn")
         self.__pub_version: str = kwargs.get("pub_version")
@@ -47,14 +79,175 @@ class CucmSettings:
         self.__session_verify: bool = kwargs.get("session_verify")
         self.__session_timeout: int = kwargs.get("session_timeout") or 20
 
+        # One Pooled Session Shared By All Services & Cluster Nodes
+        self.__session = None
+        self.__session_pool_connections: int = kwargs.get("session_pool_connections") or 10   # Pools (Hosts)
+        self.__session_pool_maxsize: int = kwargs.get("session_pool_maxsize") or 10           # Connections Per Host
+        self.__session_pool_block: bool = kwargs.get("session_pool_block") or False
+        self.__session_max_retries: int = kwargs.get("session_max_retries") or 0
+        self.__session_keep_alive: bool = kwargs.get("session_keep_alive", True)
+
         self.__ccs_wsdl_filename: str = kwargs.get("ccs_wsdl_filename") or "wsdlControlCenterServices.xml"
         self.__ris_wsdl_filename: str = kwargs.get("ris_wsdl_filename") or "wsdlRISService70.xml"
+        self.__ccs_nodes_cache_size: int = kwargs.get("ccs_nodes_cache_size") or 16
+
+        # Parsed WSDL Snapshots: `{wsdl_snapshot_path}/snapshot_{service}.pickle`
+        self.__wsdl_snapshot: bool = kwargs.get("wsdl_snapshot") or False
+        self.__wsdl_snapshot_path: str = kwargs.get("wsdl_snapshot_path") or self.__toolkit_path
+
+        # Reference Data (`sqlList*`) Cache, Disabled By Default: {method_name: ttl_seconds} Overrides Method TTLs
+        self.__sql_cache = None
+        self.__sql_cache_ttl: dict = kwargs.get("sql_cache_ttl") or {}
+        if kwargs.get("sql_cache"):
+            self.__sql_cache = CucmSqlCache(
+                maxsize=kwargs.get("sql_cache_maxsize") or 128,
+                persist_path=kwargs.get("sql_cache_path"),
+                persist_key=self.__pub_fqdn
+            )
+
+        # Local SQLite Replica Of The Search Tables, `sqlSearch*` Methods Run Against It When It's Built
+        self.__sql_replica = None
+        if kwargs.get("sql_replica_path"):
+            self.__sql_replica = CucmSqlReplica(
+                path=kwargs.get("sql_replica_path"),
+                max_age=kwargs.get("sql_replica_max_age")
+            )
+
+        # SQL Profiler & Slow-Query Log Of The Publisher Queries, Disabled By Default
+        self.__sql_profiler = None
+        if kwargs.get("sql_profiler"):
+            self.__sql_profiler = CucmSqlProfiler(
+                slow_threshold=kwargs.get("sql_profiler_slow_threshold", 1.0),
+                samples=kwargs.get("sql_profiler_samples") or 1000,
+                slow_log_size=kwargs.get("sql_profiler_slow_log_size") or 100
+            )
+
+        self.__cucm_history = CucmHistoryPlugin()
+
+    @property
+    def _axl(self) -> ServiceProxy:
 
-        self.__cucm_history = HistoryPlugin()
+        """
+        AXL Service Property. The Service is Built on First Use.
+        :return:
+        """
 
-        self.__cucm_axl_service()
-        self.__cucm_ccs_service()
-        self.__cucm_ris_service()
+        if self.__axl is None:
+            with self._cucm_lock:
+                if self.__axl is None:
+                    self.__cucm_axl_service()
+        return self.__axl
+
+    @property
+    def _axl_client(self) -> Client:
+
+        """
+        AXL Client Property. The Service is Built on First Use.
+        :return:
+        """
+
+        if self.__axl_client is None:
+            with self._cucm_lock:
+                if self.__axl_client is None:
+                    self.__cucm_axl_service()
+        return self.__axl_client
+
+    @property
+    def _axl_transport(self) -> Transport:
+
+        """
+        AXL Transport Property. The Service is Built on First Use.
+        :return:
+        """
+
+        if self.__axl_transport is None:
+            with self._cucm_lock:
+                if self.__axl_transport is None:
+                    self.__cucm_axl_service()
+        return self.__axl_transport
+
+    @property
+    def _ccs(self) -> ServiceProxy:
+
+        """
+        CCS (Control Center Services) Service Property. The Service is Built on First Use.
+        :return:
+        """
+
+        if self.__ccs is None:
+            with self._cucm_lock:
+                if self.__ccs is None:
+                    self.__cucm_ccs_service()
+        return self.__ccs
+
+    @property
+    def _ris(self) -> Client:
+
+        """
+        RIS (Real-time Information Server) Client Property. The Client is Built on First Use.
+        :return:
+        """
+
+        if self.__ris is None:
+            with self._cucm_lock:
+                if self.__ris is None:
+                    self.__cucm_ris_service()
+        return self.__ris
+
+    @property
+    def _ris_factory(self):
+
+        """
+        RIS (Real-time Information Server) Type Factory Property. The Client is Built on First Use.
+        :return:
+        """
+
+        if self.__ris_factory is None:
+            with self._cucm_lock:
+                if self.__ris_factory is None:
+                    self.__cucm_ris_service()
+        return self.__ris_factory
+
+    @property
+    def _cucm_sql_cache(self) -> Union[CucmSqlCache, None]:
+
+        """
+        Reference Data (`sqlList*`) Cache Property. None If The Cache Is Disabled.
+        :return:
+        """
+
+        return self.__sql_cache
+
+    @property
+    def _cucm_sql_replica(self) -> Union[CucmSqlReplica, None]:
+
+        """
+        Local SQL Replica Property. None If The Replica Is Disabled.
+        :return:
+        """
+
+        return self.__sql_replica
+
+    @property
+    def _cucm_sql_profiler(self) -> Union[CucmSqlProfiler, None]:
+
+        """
+        SQL Profiler Property. None If The Profiler Is Disabled.
+        :return:
+        """
+
+        return self.__sql_profiler
+
+    def _cucm_sql_cache_ttl(self, method_name: str, ttl: float) -> float:
+
+        """
+        Cache TTL Of The Method, The `sql_cache_ttl` Setting Overrides The Method Default.
+        :param method_name: CucmClient Method Name
+        :param ttl:         Method Default TTL In Seconds
+        :return:
+        """
+
+        return self.__sql_cache_ttl.get(method_name, ttl)
 
     @property
     def _cucm_publisher_property(self) -> str:
@@ -66,6 +259,26 @@ class CucmSettings:
 
         return self.__pub_fqdn
 
+    def _cucm_history_reset(self):
+
+        """
+        History Reset. Starts A New History For The Current Thread (or asyncio Task).
+        :return:
+        """
+
+        self.__cucm_history.reset()
+
+    def _cucm_history_received(self, envelope: etree._Element, http_headers: dict):
+
+        """
+        History Received. For Responses Processed Without zeep (Raw Responses).
+        :param envelope:        Received SOAP Envelope
+        :param http_headers:    Received HTTP Headers
+        :return:
+        """
+
+        self.__cucm_history.ingress(envelope, http_headers, None)
+
     def _cucm_history_show(self) -> str:
 
         """
@@ -84,10 +297,29 @@ class CucmSettings:
         except IndexError:
             return history_error
 
+    @property
+    def _cucm_session(self) -> Session:
+
+        """
+        Pooled Session Property. One Session (Connection Pool Manager) Is Shared By All Services.
+        :return:
+        """
+
+        if self.__session is None:
+            with self._cucm_lock:
+                if self.__session is None:
+                    self.__session = self.__cucm_session_create()
+        return self.__session
+
     def __cucm_session_create(self) -> Session:
 
         """
         Session Create.
+
+        * Connections to port 8443 are pooled per host and reused with keep-alive, so the TLS handshake is paid
+          once per pooled connection instead of once per request.
+        * `session_pool_maxsize` should be not less than the number of threads sharing the client.
+
         :return:
         """
 
@@ -99,8 +331,40 @@ class CucmSettings:
             if not os.path.isfile(self.__cert_path):
                 raise FileNotFoundError(f"{repr(self.__cert_path)}, certificate file not found.")
         session.auth = HTTPBasicAuth(self.__user_login, self.__user_password)
+        adapter = HTTPAdapter(
+            pool_connections=self.__session_pool_connections,
+            pool_maxsize=self.__session_pool_maxsize,
+            max_retries=self.__session_max_retries,
+            pool_block=self.__session_pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.__session_keep_alive:
+            session.headers["Connection"] = "close"
         return session
 
+    def __cucm_client_create(self, wsdl_path: str, transport: Transport, snapshot_name: str) -> Client:
+
+        """
+        zeep Client Create. The Parsed WSDL Is Shared By The Clients Of The Process & Optionally Snapshotted.
+        :param wsdl_path:       WSDL File Path or URL
+        :param transport:       Client Transport
+        :param snapshot_name:   Snapshot File Name Suffix (Service Name & Version)
+        :return:
+        """
+
+        settings = Settings()
+        snapshot_path = None
+        if self.__wsdl_snapshot:
+            snapshot_path = f"{self.__wsdl_snapshot_path}/snapshot_{snapshot_name}.pickle"
+        document = cucm_wsdl_document_load(
+            wsdl_path,
+            transport=transport,
+            settings=settings,
+            snapshot_path=snapshot_path
+        )
+        return Client(wsdl=document, transport=transport, plugins=[self.__cucm_history], settings=settings)
+
     def __cucm_axl_service(self):
 
         """
@@ -110,61 +374,75 @@ class CucmSettings:
 
         log_message = "@ CUCM AXL Service @ - {message}"
 
-        # If you're not disabling SSL verification, host should be the FQDN of the server rather than IP
-        location = f"https://{self.__pub_fqdn}:8443/axl/"
-        binding = "{http://www.cisco.com/AXLAPIService/}AXLAPIBinding"
-        wsdl_path = f"{self.__toolkit_path}/schema/{self.__pub_version}/AXLAPI.wsdl"
-        if not os.path.isfile(wsdl_path):
-            raise FileNotFoundError(f"{repr(wsdl_path)}, wsdl file not found.")
-
-        session = self.__cucm_session_create()
+        wsdl_path, binding, location = self.__cucm_axl_endpoint()
+        session = self._cucm_session
         try:
             # 'Exception Value: [WinError 5] Access is denied: '.\\zeep'' fixes:
             # cache=False or cache=SqliteCache(".../axlsqltoolkit/cache_axl.db")
-            self._axl_transport = Transport(
+            transport = Transport(
                 cache=SqliteCache(f"{self.__toolkit_path}/cache_axl.db"),
                 session=session,
                 timeout=self.__session_timeout
             )
-            self._axl_client = Client(wsdl=wsdl_path, transport=self._axl_transport, plugins=[self.__cucm_history])
-            self._axl = self._axl_client.create_service(binding, location)
+            client = self.__cucm_client_create(wsdl_path, transport=transport, snapshot_name=f"axl_{self.__pub_version}")
+            self.__axl = client.create_service(binding, location)
+            self.__axl_client = client
+            self.__axl_transport = transport
         except Exception as err:
             logger.error(log_message.format(message=f"Error Detail:\n{err}."))
             raise CucmSessionError("Session error occurred.")
 
-    def __cucm_ccs_service(self, node_fqdn: str = None) -> Union[ServiceProxy, None]:
+    def __cucm_ccs_service(self):
 
         """
         CCS (Control Center Services) Service.
-        :param node_fqdn:   Cluster Node FQDN or IP Address
         :return:
         """
 
         log_message = "@ CUCM CCS Service @ - {message}"
 
-        location = f"https://{self.__pub_fqdn}:8443/controlcenterservice2/services/ControlCenterServices"
-        binding = "{http://schemas.cisco.com/ast/soap}ControlCenterServicesBinding"
-
-        wsdl_path = f"{self.__toolkit_path}/{self.__ccs_wsdl_filename}"
-        if not os.path.isfile(wsdl_path):
-            raise FileNotFoundError(f"{repr(wsdl_path)}, wsdl file not found.")
-
-        session = self.__cucm_session_create()
+        wsdl_path, binding, location = self.__cucm_ccs_endpoint()
+        session = self._cucm_session
         try:
             transport = Transport(
                 cache=False,
                 session=session,
                 timeout=self.__session_timeout
             )
-            client = Client(wsdl=wsdl_path, transport=transport, plugins=[self.__cucm_history])
-            if node_fqdn:
-                location = f"https://{node_fqdn}:8443/controlcenterservice2/services/ControlCenterServices"
-                return client.create_service(binding, location)
-            self._ccs = client.create_service(binding, location)
+            client = self.__cucm_client_create(wsdl_path, transport=transport, snapshot_name="ccs")
+            self.__ccs = client.create_service(binding, location)
+            self.__ccs_client = client
         except Exception as err:
             logger.error(log_message.format(message=f"Error Detail:\n{err}."))
             raise CucmSessionError("Session error occurred.")
 
+    def __cucm_ccs_node_service(self, node_fqdn: str) -> ServiceProxy:
+
+        """
+        CCS (Control Center Services) Service for Another Cluster Node.
+
+        Node services share the publisher CCS client (parsed WSDL, transport & session), the last
+        `ccs_nodes_cache_size` used node services are cached.
+
+        :param node_fqdn:   Cluster Node FQDN or IP Address
+        :return:
+        """
+
+        with self._cucm_lock:
+            service = self.__ccs_nodes.get(node_fqdn)
+            if service is not None:
+                self.__ccs_nodes.move_to_end(node_fqdn)
+                return service
+
+            if self.__ccs_client is None:
+                self.__cucm_ccs_service()
+            _, binding, location = self.__cucm_ccs_endpoint(node_fqdn=node_fqdn)
+            service = self.__ccs_client.create_service(binding, location)
+            self.__ccs_nodes[node_fqdn] = service
+            if len(self.__ccs_nodes) > self.__ccs_nodes_cache_size:
+                self.__ccs_nodes.popitem(last=False)
+            return service
+
     def __cucm_ris_service(self):
 
         """
@@ -174,21 +452,17 @@ class CucmSettings:
 
         log_message = "@ CUCM RIS Service @ - {message}"
 
-        wsdl_path = f"{self.__toolkit_path}/{self.__ris_wsdl_filename}"
-        if not os.path.isfile(wsdl_path):
-            logger.warning(log_message.format(message=f"{repr(wsdl_path)}, wsdl file not found."))
-            wsdl_path = f"https://{self.__pub_fqdn}:8443/realtimeservice2/services/RISService70?wsdl"
-            # raise FileNotFoundError(f"{repr(wsdl_path)}, wsdl file not found.")
-
-        session = self.__cucm_session_create()
+        wsdl_path = self.__cucm_ris_wsdl_path()
+        session = self._cucm_session
         try:
             transport = Transport(
                 cache=SqliteCache(f"{self.__toolkit_path}/cache_ris.db"),
                 session=session,
                 timeout=self.__session_timeout
             )
-            self._ris = Client(wsdl=wsdl_path, transport=transport, plugins=[self.__cucm_history])
-            self._ris_factory = self._ris.type_factory("ns0")
+            client = self.__cucm_client_create(wsdl_path, transport=transport, snapshot_name="ris")
+            self.__ris_factory = client.type_factory("ns0")
+            self.__ris = client
         except Exception as err:
             logger.error(log_message.format(message=f"Error Detail:\n{err}."))
             raise CucmSessionError("Session error occurred.")
@@ -201,4 +475,324 @@ class CucmSettings:
         :return:
         """
 
-        return self.__cucm_ccs_service(node_fqdn=node_fqdn) if node_fqdn and node_fqdn != self.__pub_fqdn else self._ccs
+        return self.__cucm_ccs_node_service(node_fqdn=node_fqdn) if node_fqdn and node_fqdn != self.__pub_fqdn else self._ccs
+
+    def __cucm_axl_endpoint(self) -> tuple[str, str, str]:
+
+        """
+        AXL Service Endpoint.
+        :return:    `(wsdl_path, binding, location)`
+        """
+
+        # If you're not disabling SSL verification, host should be the FQDN of the server rather than IP
+        location = f"https://{self.__pub_fqdn}:8443/axl/"
+        binding = "{http://www.cisco.com/AXLAPIService/}AXLAPIBinding"
+        wsdl_path = f"{self.__toolkit_path}/schema/{self.__pub_version}/AXLAPI.wsdl"
+        if not os.path.isfile(wsdl_path):
+            raise FileNotFoundError(f"{repr(wsdl_path)}, wsdl file not found.")
+        return wsdl_path, binding, location
+
+    def __cucm_ccs_endpoint(self, node_fqdn: Optional[str] = None) -> tuple[str, str, str]:
+
+        """
+        CCS (Control Center Services) Service Endpoint.
+        :param node_fqdn:   Cluster Node FQDN or IP Address, The Publisher If None
+        :return:    `(wsdl_path, binding, location)`
+        """
+
+        location = f"https://{node_fqdn or self.__pub_fqdn}:8443/controlcenterservice2/services/ControlCenterServices"
+        binding = "{http://schemas.cisco.com/ast/soap}ControlCenterServicesBinding"
+        wsdl_path = f"{self.__toolkit_path}/{self.__ccs_wsdl_filename}"
+        if not os.path.isfile(wsdl_path):
+            raise FileNotFoundError(f"{repr(wsdl_path)}, wsdl file not found.")
+        return wsdl_path, binding, location
+
+    def __cucm_ris_wsdl_path(self) -> str:
+
+        """
+        RIS (Real-time Information Server) WSDL Path, The Publisher WSDL URL If The Local File Isn't Found.
+        :return:
+        """
+
+        wsdl_path = f"{self.__toolkit_path}/{self.__ris_wsdl_filename}"
+        if not os.path.isfile(wsdl_path):
+            logger.warning(f"@ CUCM RIS Service @ - {repr(wsdl_path)}, wsdl file not found.")
+            wsdl_path = f"https://{self.__pub_fqdn}:8443/realtimeservice2/services/RISService70?wsdl"
+        return wsdl_path
+
+    @property
+    def _cucm_async_transport(self) -> AsyncTransport:
+
+        """
+        asyncio Transport Property. One Pooled httpx Client Is Shared By All asyncio Services & Cluster Nodes.
+        :return:
+        """
+
+        if self.__async_transport is None:
+            with self._cucm_lock:
+                if self.__async_transport is None:
+                    self.__async_transport = self.__cucm_async_transport_create()
+        return self.__async_transport
+
+    def __cucm_async_transport_create(self) -> AsyncTransport:
+
+        """
+        asyncio Transport Create.
+
+        * Requests are sent by the `httpx.AsyncClient`: `session_pool_maxsize` limits the connections per host,
+          `session_timeout` limits each request, a cancelled request releases its connection.
+        * WSDL files are loaded by the sync `httpx.Client` once, when the service is built.
+
+        :return:
+        """
+
+        if httpx is None:
+            raise CucmSessionError(
+                "Session error occurred. AsyncCucmClient requires `httpx`: `pip install tinyCUCM[async]`."
+            )
+
+        verify = False
+        if self.__session_verify:
+            if not os.path.isfile(self.__cert_path):
+                raise FileNotFoundError(f"{repr(self.__cert_path)}, certificate file not found.")
+            verify = ssl.create_default_context(cafile=self.__cert_path)
+        auth = httpx.BasicAuth(self.__user_login, self.__user_password)
+        limits = httpx.Limits(
+            max_connections=self.__session_pool_connections * self.__session_pool_maxsize,
+            max_keepalive_connections=self.__session_pool_maxsize if self.__session_keep_alive else 0
+        )
+        return AsyncTransport(
+            client=httpx.AsyncClient(
+                auth=auth,
+                timeout=self.__session_timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    verify=verify,
+                    limits=limits,
+                    retries=self.__session_max_retries
+                )
+            ),
+            wsdl_client=httpx.Client(auth=auth, timeout=self.__session_timeout, verify=verify),
+            cache=SqliteCache(f"{self.__toolkit_path}/cache_async.db")
+        )
+
+    def __cucm_async_client_create(
+        self,
+        wsdl_path: str,
+        snapshot_name: str,
+        settings: Optional[Settings] = None
+    ) -> AsyncClient:
+
+        """
+        zeep asyncio Client Create. The Parsed WSDL Is Shared With The Sync Clients Of The Process.
+        :param wsdl_path:       WSDL File Path or URL
+        :param snapshot_name:   Snapshot File Name Suffix (Service Name & Version)
+        :param settings:        Client Settings, Default Settings If None
+        :return:
+        """
+
+        transport = self._cucm_async_transport
+        settings = settings or Settings()
+        snapshot_path = None
+        if self.__wsdl_snapshot:
+            snapshot_path = f"{self.__wsdl_snapshot_path}/snapshot_{snapshot_name}.pickle"
+        document = cucm_wsdl_document_load(
+            wsdl_path,
+            transport=transport,
+            settings=settings,
+            snapshot_path=snapshot_path
+        )
+        return AsyncClient(wsdl=document, transport=transport, plugins=[self.__cucm_history], settings=settings)
+
+    def __cucm_axl_async_service(self):
+
+        """
+        AXL asyncio Services. SQL Queries Have Their Own Client With The `raw_response` Settings: The Setting Isn't
+        Switched Per Request, It Would Be Seen By The Concurrent Tasks Of The Thread.
+        :return:
+        """
+
+        log_message = "@ CUCM AXL asyncio Service @ - {message}"
+
+        wsdl_path, binding, location = self.__cucm_axl_endpoint()
+        try:
+            snapshot_name = f"axl_{self.__pub_version}"
+            client = self.__cucm_async_client_create(wsdl_path, snapshot_name=snapshot_name)
+            sql_client = self.__cucm_async_client_create(
+                wsdl_path,
+                snapshot_name=snapshot_name,
+                settings=Settings(raw_response=True)
+            )
+            # `AsyncClient.create_service` Returns The Sync ServiceProxy (zeep 4.3)
+            self.__axl_sql_async = AsyncServiceProxy(sql_client, sql_client.wsdl.bindings[binding], address=location)
+            self.__axl_async = AsyncServiceProxy(client, client.wsdl.bindings[binding], address=location)
+            self.__axl_async_client = client
+        except Exception as err:
+            logger.error(log_message.format(message=f"Error Detail:\n{err}."))
+            raise CucmSessionError("Session error occurred.")
+
+    def __cucm_ccs_async_service(self):
+
+        """
+        CCS (Control Center Services) asyncio Service.
+        :return:
+        """
+
+        log_message = "@ CUCM CCS asyncio Service @ - {message}"
+
+        wsdl_path, binding, location = self.__cucm_ccs_endpoint()
+        try:
+            client = self.__cucm_async_client_create(wsdl_path, snapshot_name="ccs")
+            self.__ccs_async = AsyncServiceProxy(client, client.wsdl.bindings[binding], address=location)
+            self.__ccs_async_client = client
+        except Exception as err:
+            logger.error(log_message.format(message=f"Error Detail:\n{err}."))
+            raise CucmSessionError("Session error occurred.")
+
+    def __cucm_ris_async_service(self):
+
+        """
+        RIS (Real-time Information Server) asyncio Service.
+        :return:
+        """
+
+        log_message = "@ CUCM RIS asyncio Service @ - {message}"
+
+        wsdl_path = self.__cucm_ris_wsdl_path()
+        try:
+            client = self.__cucm_async_client_create(wsdl_path, snapshot_name="ris")
+            self.__ris_async_factory = client.type_factory("ns0")
+            self.__ris_async = client
+        except Exception as err:
+            logger.error(log_message.format(message=f"Error Detail:\n{err}."))
+            raise CucmSessionError("Session error occurred.")
+
+    @property
+    def _axl_async(self) -> AsyncServiceProxy:
+
+        """
+        AXL asyncio Service Property. The Service is Built on First Use.
+        :return:
+        """
+
+        if self.__axl_async is None:
+            with self._cucm_lock:
+                if self.__axl_async is None:
+                    self.__cucm_axl_async_service()
+        return self.__axl_async
+
+    @property
+    def _axl_async_client(self) -> AsyncClient:
+
+        """
+        AXL asyncio Client Property. The Service is Built on First Use.
+        :return:
+        """
+
+        if self.__axl_async_client is None:
+            with self._cucm_lock:
+                if self.__axl_async_client is None:
+                    self.__cucm_axl_async_service()
+        return self.__axl_async_client
+
+    @property
+    def _axl_sql_async(self) -> AsyncServiceProxy:
+
+        """
+        AXL asyncio Service Property For The Raw SQL Responses. The Service is Built on First Use.
+        :return:
+        """
+
+        if self.__axl_sql_async is None:
+            with self._cucm_lock:
+                if self.__axl_sql_async is None:
+                    self.__cucm_axl_async_service()
+        return self.__axl_sql_async
+
+    @property
+    def _ris_async(self) -> AsyncClient:
+
+        """
+        RIS (Real-time Information Server) asyncio Client Property. The Client is Built on First Use.
+        :return:
+        """
+
+        if self.__ris_async is None:
+            with self._cucm_lock:
+                if self.__ris_async is None:
+                    self.__cucm_ris_async_service()
+        return self.__ris_async
+
+    @property
+    def _ris_async_factory(self):
+
+        """
+        RIS (Real-time Information Server) asyncio Type Factory Property. The Client is Built on First Use.
+        :return:
+        """
+
+        if self.__ris_async_factory is None:
+            with self._cucm_lock:
+                if self.__ris_async_factory is None:
+                    self.__cucm_ris_async_service()
+        return self.__ris_async_factory
+
+    def _cucm_ccs_async_custom_node_service(self, node_fqdn: Union[str, None]) -> AsyncServiceProxy:
+
+        """
+        CCS (Control Center Services) asyncio Service for Another Cluster Node, The Publisher Service If None.
+        The last `ccs_nodes_cache_size` used node services are cached.
+        :param node_fqdn:   Cluster Node FQDN or IP Address
+        :return:
+        """
+
+        with self._cucm_lock:
+            if self.__ccs_async is None:
+                self.__cucm_ccs_async_service()
+            if not node_fqdn or node_fqdn == self.__pub_fqdn:
+                return self.__ccs_async
+
+            service = self.__ccs_async_nodes.get(node_fqdn)
+            if service is not None:
+                self.__ccs_async_nodes.move_to_end(node_fqdn)
+                return service
+
+            _, binding, location = self.__cucm_ccs_endpoint(node_fqdn=node_fqdn)
+            client = self.__ccs_async_client
+            service = AsyncServiceProxy(client, client.wsdl.bindings[binding], address=location)
+            self.__ccs_async_nodes[node_fqdn] = service
+            if len(self.__ccs_async_nodes) > self.__ccs_nodes_cache_size:
+                self.__ccs_async_nodes.popitem(last=False)
+            return service
+
+    def _cucm_close(self):
+
+        """
+        Close The Pooled Session (Connections). Services Are Rebuilt On The Next Use.
+        :return:
+        """
+
+        with self._cucm_lock:
+            session, self.__session = self.__session, None
+            self.__axl = self.__axl_client = self.__axl_transport = None
+            self.__ccs = self.__ccs_client = None
+            self.__ris = self.__ris_factory = None
+            self.__ccs_nodes.clear()
+        if session is not None:
+            session.close()
+
+    async def _cucm_async_close(self):
+
+        """
+        Close The asyncio Transport (Pooled Connections). Services Are Rebuilt On The Next Use.
+        :return:
+        """
+
+        with self._cucm_lock:
+            transport, self.__async_transport = self.__async_transport, None
+            self.__axl_async = self.__axl_async_client = self.__axl_sql_async = None
+            self.__ccs_async = self.__ccs_async_client = None
+            self.__ris_async = self.__ris_async_factory = None
+            self.__ccs_async_nodes.clear()
+        if transport is not None:
+            await transport.aclose()
+            transport.wsdl_client.close()
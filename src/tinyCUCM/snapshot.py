@@ -0,0 +1,343 @@
+import copy
+import copyreg
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from lxml import etree
+from typing import Optional, Union
+from zeep import __version__ as zeep_version
+from zeep.settings import Settings
+from zeep.transports import Transport
+from zeep.wsdl import Document
+
+from .logger import logger
+
+
+""" ######################################################### """
+""" *************** TINY CUCM WSDL SNAPSHOTS **************** """
+""" ######################################################### """
+
+
+# Parsed WSDL Documents Shared By All Clients Of The Process: {(wsdl_path, mtime, size): Document}
+# Shared Documents Are Detached: No Transport (Session), Every Client Gets Its Own Bound Copy
+_CUCM_WSDL_DOCUMENTS = {}
+_CUCM_WSDL_DOCUMENTS_LOCK = threading.Lock()
+
+# Deep XSD Type Graphs (AXLAPI.wsdl) Exceed The Default Recursion Limit While Pickling. Snapshots Are Written
+# By A Child Process (`_CUCM_WSDL_SNAPSHOT_WRITER`), The Limit & The Stack Of The Client Process Aren't Changed
+_CUCM_WSDL_SNAPSHOT_RECURSION_LIMIT = 20000
+_CUCM_WSDL_SNAPSHOT_STACK_SIZE = 512 * 1024 * 1024
+_CUCM_WSDL_SNAPSHOT_WRITER = (
+    f"import sys; from {__package__}.snapshot import _cucm_wsdl_snapshot_main; "
+    "_cucm_wsdl_snapshot_main(*sys.argv[1:3])"
+)
+
+# One Writer Per Snapshot: Processes Starting Together (Workers) Don't Parse The WSDL Each. A Writer Lock Older
+# Than The Timeout Is Left By A Killed Writer & Is Taken Over
+_CUCM_WSDL_SNAPSHOT_LOCK_TIMEOUT = 600
+
+# Embedded Interpreters (uWSGI, mod_wsgi) Have The Server Binary As `sys.executable`, The Writer Isn't Started
+_CUCM_WSDL_SNAPSHOT_INTERPRETERS = ("python", "pypy")
+
+# zeep Builds Value & Type Classes At Runtime, Their Modules Can't Be Imported Back
+_CUCM_WSDL_DYNAMIC_MODULES = ("zeep.objects", "zeep.xsd.dynamic_types")
+
+
+def _cucm_dynamic_type_rebuild(name: str, bases: tuple, attrs: dict) -> type:
+    return type(name, bases, attrs)
+
+
+class _CucmSnapshotPickler(pickle.Pickler):
+
+    """
+        Pickler For The Detached zeep `Document`. Settings Are Not Stored, They Belong To The Process.
+        """
+
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[etree.QName] = lambda qname: (etree.QName, (qname.text,))
+
+    def __init__(self, file, settings: Settings):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__settings = settings
+
+    def persistent_id(self, obj):
+        if obj is self.__settings:
+            return "settings"
+        return None
+
+    def reducer_override(self, obj):
+        if isinstance(obj, type) and obj.__module__ in _CUCM_WSDL_DYNAMIC_MODULES:
+            attrs = {key: val for key, val in vars(obj).items() if key not in ("__dict__", "__weakref__")}
+            return _cucm_dynamic_type_rebuild, (obj.__name__, obj.__bases__, attrs)
+        return NotImplemented
+
+
+class _CucmSnapshotUnpickler(pickle.Unpickler):
+
+    """
+        Unpickler For The Detached zeep `Document`. Loading Isn't Recursive, The Default Recursion Limit Is Enough.
+        """
+
+    def __init__(self, file, settings: Settings):
+        super().__init__(file)
+        self.__persistent = {"settings": settings}
+
+    def persistent_load(self, pid):
+        return self.__persistent[pid]
+
+
+def _cucm_wsdl_fingerprint(wsdl_path: str) -> Union[tuple, None]:
+
+    """
+    Local WSDL File Fingerprint. Remote WSDL (URL) Has No Fingerprint.
+    :param wsdl_path:   WSDL File Path or URL
+    :return:
+    """
+
+    if not os.path.isfile(wsdl_path):
+        return None
+    stat = os.stat(wsdl_path)
+    return os.path.abspath(wsdl_path), stat.st_mtime_ns, stat.st_size
+
+
+def _cucm_wsdl_snapshot_read(snapshot_path: str, fingerprint: tuple, settings: Settings) -> Union[Document, None]:
+
+    """
+    Read The WSDL Snapshot, Stale or Broken Snapshots Are Ignored.
+    :param snapshot_path:   Snapshot File Path
+    :param fingerprint:     WSDL File Fingerprint
+    :param settings:        Settings Of The Detached Document
+    :return:
+    """
+
+    log_message = "@ CUCM WSDL Snapshot @ - {message}"
+
+    if not os.path.isfile(snapshot_path):
+        return None
+
+    try:
+        with open(snapshot_path, "rb") as file:
+            unpickler = _CucmSnapshotUnpickler(file, settings=settings)
+            if unpickler.load() != {"zeep": zeep_version, "wsdl": fingerprint}:
+                logger.info(log_message.format(message=f"{repr(snapshot_path)}, snapshot is stale."))
+                return None
+            return unpickler.load()
+    except Exception as err:
+        logger.warning(log_message.format(message=f"{repr(snapshot_path)}, snapshot is broken: {repr(err)}."))
+        return None
+
+
+def _cucm_wsdl_snapshot_write(snapshot_path: str, fingerprint: tuple, document: Document):
+
+    """
+    Write The WSDL Snapshot. The File Is Replaced Atomically, Concurrent Writers Don't Corrupt It.
+    Runs In The Snapshot Writer Process (Raised Recursion Limit).
+    :param snapshot_path:   Snapshot File Path
+    :param fingerprint:     WSDL File Fingerprint
+    :param document:        Detached WSDL Document
+    :return:
+    """
+
+    log_message = "@ CUCM WSDL Snapshot @ - {message}"
+
+    temp_path = f"{snapshot_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            pickler = _CucmSnapshotPickler(file, settings=document.settings)
+            pickler.dump({"zeep": zeep_version, "wsdl": fingerprint})
+            pickler.dump(document)
+        os.replace(temp_path, snapshot_path)
+    except Exception as err:
+        logger.warning(log_message.format(message=f"{repr(snapshot_path)}, snapshot isn't saved: {repr(err)}."))
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+
+
+def _cucm_wsdl_snapshot_lock(snapshot_path: str) -> bool:
+
+    """
+    Take The Snapshot Writer Lock (`{snapshot_path}.lock`), Released By The Writer Process When It Ends.
+    :param snapshot_path:   Snapshot File Path
+    :return:                True If Taken, False If Another Writer Is Running
+    """
+
+    lock_path = f"{snapshot_path}.lock"
+    for _ in range(2):
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) < _CUCM_WSDL_SNAPSHOT_LOCK_TIMEOUT:
+                    return False
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+        except OSError as err:
+            logger.warning(f"@ CUCM WSDL Snapshot @ - {repr(snapshot_path)}, snapshot isn't saved: {repr(err)}.")
+            return False
+    return False
+
+
+def _cucm_wsdl_snapshot_unlock(snapshot_path: str):
+
+    """
+    Release The Snapshot Writer Lock.
+    :param snapshot_path:   Snapshot File Path
+    :return:
+    """
+
+    try:
+        os.remove(f"{snapshot_path}.lock")
+    except FileNotFoundError:
+        pass
+
+
+def _cucm_wsdl_snapshot_spawn(wsdl_path: str, snapshot_path: str):
+
+    """
+    Start The Snapshot Writer Process: It Parses The WSDL & Writes The Snapshot In The Background.
+    Not Started If Another Writer Holds The Lock or `sys.executable` Isn't A Python Interpreter.
+    :param wsdl_path:       WSDL File Path
+    :param snapshot_path:   Snapshot File Path
+    :return:
+    """
+
+    log_message = "@ CUCM WSDL Snapshot @ - {message}"
+
+    if not os.path.basename(sys.executable or "").lower().startswith(_CUCM_WSDL_SNAPSHOT_INTERPRETERS):
+        logger.info(log_message.format(
+            message=f"{repr(snapshot_path)}, snapshot isn't saved: {repr(sys.executable)} isn't a Python interpreter."
+        ))
+        return
+    if not _cucm_wsdl_snapshot_lock(snapshot_path):
+        return
+
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (package_root, env.get("PYTHONPATH"))))
+    try:
+        subprocess.Popen(
+            [sys.executable, "-c", _CUCM_WSDL_SNAPSHOT_WRITER, wsdl_path, snapshot_path],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL
+        )
+    except OSError as err:
+        _cucm_wsdl_snapshot_unlock(snapshot_path)
+        logger.warning(log_message.format(message=f"{repr(snapshot_path)}, snapshot isn't saved: {repr(err)}."))
+
+
+def _cucm_wsdl_document_detach(document: Document) -> Document:
+
+    """
+    Detach The Parsed Document From The Transport It Was Loaded With (Session & Connection Pool Of A Client).
+    :param document:    Parsed WSDL Document
+    :return:
+    """
+
+    document.transport = None
+    document.types._transport = None
+    for binding in document.bindings.values():
+        if hasattr(binding, "transport"):
+            binding.transport = None
+    return document
+
+
+def _cucm_wsdl_document_bind(document: Document, transport: Transport, settings: Settings) -> Document:
+
+    """
+    Client Copy Of The Shared Document: Own Bindings, Services & Ports Bound To The Client Transport.
+    Schema, Messages & Operations Are Shared.
+    :param document:    Detached WSDL Document
+    :param transport:   Client Transport
+    :param settings:    Client Settings
+    :return:
+    """
+
+    bound = copy.copy(document)
+    bound.transport = transport
+    bound.settings = settings
+
+    bound.bindings = {}
+    for name, binding in document.bindings.items():
+        binding = copy.copy(binding)
+        if hasattr(binding, "transport"):
+            binding.transport = transport
+        bound.bindings[name] = binding
+
+    bound.services = OrderedDict()
+    for name, service in document.services.items():
+        service = bound.services[name] = copy.copy(service)
+        service.ports = OrderedDict()
+        for port_name, port in document.services[name].ports.items():
+            port = service.ports[port_name] = copy.copy(port)
+            if port.binding is not None:
+                port.binding = bound.bindings.get(port.binding.name.text, port.binding)
+    return bound
+
+
+def cucm_wsdl_document_load(
+    wsdl_path: str,
+    transport: Transport,
+    settings: Settings,
+    snapshot_path: Optional[str] = None
+) -> Document:
+
+    """
+    Load The Parsed WSDL Document.
+
+    * The document is parsed once per process, every client gets a copy bound to its own transport & settings.
+      The shared document doesn't keep the transport (session) of the client which parsed it.
+    * With `snapshot_path` the parsed document is also stored on disk (by a background writer process) and loaded
+      by the next processes. The snapshot is rebuilt when the WSDL file or the zeep version changes.
+
+    :param wsdl_path:       WSDL File Path or URL
+    :param transport:       Client Transport
+    :param settings:        Client Settings
+    :param snapshot_path:   Snapshot File Path, Snapshot Is Disabled If None
+    :return:
+    """
+
+    fingerprint = _cucm_wsdl_fingerprint(wsdl_path)
+    key = fingerprint or wsdl_path
+    with _CUCM_WSDL_DOCUMENTS_LOCK:
+        document = _CUCM_WSDL_DOCUMENTS.get(key)
+        if document is None:
+            if snapshot_path and fingerprint:
+                document = _cucm_wsdl_snapshot_read(snapshot_path, fingerprint, settings=Settings())
+            if document is None:
+                document = _cucm_wsdl_document_detach(Document(wsdl_path, transport, settings=Settings()))
+                if snapshot_path and fingerprint:
+                    _cucm_wsdl_snapshot_spawn(wsdl_path, snapshot_path)
+            _CUCM_WSDL_DOCUMENTS[key] = document
+    return _cucm_wsdl_document_bind(document, transport=transport, settings=settings)
+
+
+def _cucm_wsdl_snapshot_main(wsdl_path: str, snapshot_path: str):
+
+    """
+    Snapshot Writer Process: Parse The WSDL & Write The Snapshot (Deep Pickling In A Thread With A Large Stack),
+    The Writer Lock Is Released At The End.
+    :param wsdl_path:       WSDL File Path
+    :param snapshot_path:   Snapshot File Path
+    :return:
+    """
+
+    try:
+        fingerprint = _cucm_wsdl_fingerprint(wsdl_path)
+        if fingerprint is None:
+            return
+        document = _cucm_wsdl_document_detach(Document(wsdl_path, Transport(), settings=Settings()))
+
+        sys.setrecursionlimit(_CUCM_WSDL_SNAPSHOT_RECURSION_LIMIT)
+        threading.stack_size(_CUCM_WSDL_SNAPSHOT_STACK_SIZE)
+        writer = threading.Thread(target=_cucm_wsdl_snapshot_write, args=(snapshot_path, fingerprint, document))
+        writer.start()
+        writer.join()
+    finally:
+        _cucm_wsdl_snapshot_unlock(snapshot_path)
@@ -1,5 +1,5 @@
 from enum import Enum
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, NonNegativeInt, PositiveInt, PrivateAttr, model_validator
 from typing import Optional, Self
 
 
@@ -8,8 +8,108 @@ from typing import Optional, Self
 """ ######################################################### """
 
 
+# Search Value Match Modes: Condition Templates Of The Quoted Value
+CUCM_SQL_SEARCH_MATCH_TEMPLATES = {
+    "exact": "= '{val}'",
+    "prefix": "LIKE '{val}%'",
+    "suffix": "LIKE '%{val}'",
+    "contains": "LIKE '%{val}%'",
+}
+
+class CucmSqlSearchMatchEnum(str, Enum):
+    exact = "exact"
+    prefix = "prefix"
+    suffix = "suffix"
+    contains = "contains"
+
+class CucmSqlSearchOperatorEnum(str, Enum):
+    and_ = "AND"
+    or_ = "OR"
+
+class CucmSqlSearchConditionModel(BaseModel):
+    criterion: str
+    value: Optional[str] = None
+    match: CucmSqlSearchMatchEnum = CucmSqlSearchMatchEnum.contains
+    is_case_sensitive: bool = False
+
 class CucmSqlBaseSearchModel(BaseModel):
     value: Optional[str] = None
+    match: CucmSqlSearchMatchEnum = CucmSqlSearchMatchEnum.contains     # `exact` & `prefix` Can Use The Indexes
+    is_case_sensitive: bool = False             # Compare The Column As Is, `LOWER(column)` Disables The Indexes
+    chunk_size: Optional[PositiveInt] = None    # Fetch Large Results In Chunks Of `chunk_size` Rows
+    fields: Optional[list[str]] = None          # Result Columns, Unneeded Joins Are Pruned, All Columns If None
+    is_replica: bool = True                     # Run Against The Local Replica If It's Built
+    is_compact_resp: bool = False               # Return The Compact Container (CucmSqlRecords) For Large Results
+    is_typed_resp: bool = False                 # Convert The Columns By The Search Query Schema (bool, int, ...)
+    is_stream_resp: bool = False                # Return The Rows Iterator, Rows Are Fetched In Chunks On Iteration
+    conditions: Optional[list[CucmSqlSearchConditionModel]] = None      # More Criteria Of The Compound Search
+    operator: CucmSqlSearchOperatorEnum = CucmSqlSearchOperatorEnum.and_  # Joins The Criterion & The Conditions
+    page_size: Optional[PositiveInt] = None     # Return One Page: `{"rows", "total", "next_cursor"}`
+    page_offset: NonNegativeInt = 0             # Rows Skipped Before The Page (After The `page_cursor` If It's Set)
+    page_cursor: Optional[str] = None           # `next_cursor` Of The Previous Page (Keyset Pagination)
+    group_by: Optional[list[str]] = None        # Return The Counts Per Group (Criteria or Fields), [] - Total Count
+
+    _search_items: list[Self] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode="after")
+    def check_response_modes(self) -> Self:
+        # One Response Mode: Counts (`group_by`), One Page (`page_size`) or Rows (Tuple, Compact, Stream, Chunks)
+        if self.group_by is not None:
+            flags = [
+                name for name in ("page_size", "is_stream_resp", "chunk_size", "is_compact_resp")
+                if getattr(self, name)
+            ]
+            if flags:
+                raise ValueError(f"The 'group_by' field can't be combined with: {', '.join(map(repr, flags))}.")
+        if self.page_size:
+            flags = [name for name in ("is_stream_resp", "chunk_size") if getattr(self, name)]
+            if flags:
+                raise ValueError(f"The 'page_size' field can't be combined with: {', '.join(map(repr, flags))}.")
+        elif self.page_cursor is not None or self.page_offset:
+            raise ValueError("The 'page_cursor' & 'page_offset' fields require the 'page_size'.")
+        return self
+
+    @model_validator(mode="after")
+    def check_conditions(self) -> Self:
+        # Every Condition Is Validated As The Search Model Of Its Own (Criterion Enum, Criterion Rules)
+        self._search_items = [self]
+        for condition in self.conditions or ():
+            self._search_items.append(self.__class__.model_validate(condition.model_dump()))
+        return self
+
+    @property
+    def search_items(self) -> list[Self]:
+
+        """
+        Search Models Of The Criterion & The Conditions (`criterion`, `value`, `match`, `is_case_sensitive`).
+        :return:
+        """
+
+        return self._search_items
+
+    def sql_condition(self, expression: str, condition_for_none: str = "= ''") -> str:
+
+        """
+        Search Condition Of The Column Expression By The `value`, `match` & `is_case_sensitive`.
+
+        * The column is compared as is (the index can be used) if the search is case-sensitive or the value has no
+          letters (digits, `+`, ...: `LOWER()` doesn't change the result), otherwise `LOWER(column)` is compared.
+        * Empty value matches all records (any `match`), None is compared by the `condition_for_none`.
+
+        :param expression:          Column Expression (`d.name`)
+        :param condition_for_none:  Condition Of The None Value (`IS NULL`, `= ''`)
+        :return:
+        """
+
+        if self.value is None:
+            # NULL & Empty Values Aren't Changed By LOWER()
+            return f"{expression} {condition_for_none}"
+
+        value = self.value.replace("'", "''")
+        if not self.is_case_sensitive and value.lower() != value.upper():
+            expression, value = f"LOWER({expression})", value.lower()
+        match = self.match.value if value else CucmSqlSearchMatchEnum.contains.value
+        return f"{expression} {CUCM_SQL_SEARCH_MATCH_TEMPLATES[match].format(val=value)}"
 
 
 ########################################################################################################################
@@ -0,0 +1,811 @@
+import base64
+import hashlib
+import json
+import re
+from typing import Iterable, Optional
+
+from .exceptions import CucmBadRequestError
+from .sql_models import (
+    CUCM_SQL_SEARCH_CALL_PICKUP_GROUPS_CRITERIA,
+    CUCM_SQL_SEARCH_DEVICES_CRITERIA,
+    CUCM_SQL_SEARCH_END_USERS_CRITERIA,
+    CUCM_SQL_SEARCH_LINE_GROUPS_CRITERIA,
+    CUCM_SQL_SEARCH_LINE_NUMBERS_CRITERIA,
+    CUCM_SQL_SEARCH_PATTERNS_CRITERIA,
+    CUCM_SQL_SEARCH_REMOTE_DESTINATIONS_CRITERIA,
+    CUCM_SQL_SEARCH_TRANSLATION_PATTERNS_CRITERIA,
+)
+
+
+""" ######################################################### """
+""" ************** TINY CUCM SQL SEARCH QUERIES ************* """
+""" ######################################################### """
+
+
+CUCM_SQL_TABLE_ALIAS_PATTERN = re.compile(r"\b([a-z_]+)\.[a-z_]+\b")
+CUCM_SQL_TABLE_COLUMN_PATTERN = re.compile(r"\b([a-z_]+)\.([a-z_]+)\b")
+
+# Order Keys Columns Of The Page Query: `page_key_0`, `page_key_1`, ...
+CUCM_SQL_PAGE_KEY_PREFIX = "page_key_"
+
+# Group Columns Of The Aggregate Query: `group_0`, `group_1`, ...
+CUCM_SQL_GROUP_KEY_PREFIX = "group_"
+
+
+def _cucm_sql_select(columns: dict[str, str], separator: str = ",\n       ") -> str:
+    return separator.join(
+        expression if expression.split(".")[-1] == alias else f"{expression} AS {alias}"
+        for alias, expression in columns.items()
+    )
+
+
+def cucm_sql_keyset_condition(order_by: list[str], after: list[Optional[str]]) -> str:
+
+    """
+    Keyset Condition: The Rows Following The Row With The `after` Keys In The `ORDER BY` (Ascending) Order.
+    Informix Sorts NULL First, So NULL Keys Are Compared With `IS NULL` & `IS NOT NULL`.
+    :param order_by:    Order Expressions
+    :param after:       Order Keys Of The Row (One Per Expression)
+    :return:
+    """
+
+    def compare(expression: str, value: Optional[str], operator: str, condition_for_none: str) -> str:
+        if value is None:
+            return f"{expression} {condition_for_none}"
+        return "{} {} '{}'".format(expression, operator, value.replace("'", "''"))
+
+    # (a > 1) OR (a = 1 AND b > 2) OR ...
+    return " OR ".join(
+        "({})".format(" AND ".join([
+            *(compare(expression, value, "=", "IS NULL") for expression, value in zip(order_by[:index], after)),
+            compare(order_by[index], after[index], ">", "IS NOT NULL")
+        ]))
+        for index in range(len(order_by))
+    )
+
+
+def cucm_sql_skip_first(sql_query: str, skip: int, first: int) -> str:
+
+    """
+    Informix Server-Side Paging Of The `SELECT` Query.
+    :param sql_query:   SQL `SELECT` Query Expression
+    :param skip:        Rows Skipped
+    :param first:       Max Number Of Rows
+    :return:
+    """
+
+    return re.sub(r"^\s*SELECT\s", f"SELECT SKIP {skip} FIRST {first} ", sql_query, count=1, flags=re.IGNORECASE)
+
+
+def cucm_sql_page_cursor(page_query: str, keys: list[Optional[str]]) -> str:
+
+    """
+    Page Cursor: The Order Keys Of The Last Row Of The Page, Bound To The Page Query (Search & Fields).
+    :param page_query:  Page Query Of The First Page (`render_page` Without `after`)
+    :param keys:        Order Keys Of The Last Row
+    :return:
+    """
+
+    content = {"query": hashlib.sha1(page_query.encode()).hexdigest()[:12], "keys": keys}
+    return base64.urlsafe_b64encode(json.dumps(content, separators=(",", ":")).encode()).decode()
+
+
+def cucm_sql_page_cursor_keys(page_query: str, cursor: str) -> list[Optional[str]]:
+
+    """
+    Order Keys Of The Page Cursor.
+    :param page_query:  Page Query Of The First Page (`render_page` Without `after`)
+    :param cursor:      Page Cursor
+    :return:
+    """
+
+    try:
+        content = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        query, keys = content["query"], content["keys"]
+    except (TypeError, ValueError, KeyError):
+        raise CucmBadRequestError(f"BadRequest error occurred. Invalid page cursor: {repr(cursor)}.")
+    if query != hashlib.sha1(page_query.encode()).hexdigest()[:12] or not isinstance(keys, list):
+        raise CucmBadRequestError("BadRequest error occurred. The page cursor doesn't match the search.")
+    return keys
+
+
+def cucm_sql_table_aliases(expression: str) -> set[str]:
+
+    """
+    Table Aliases Referenced By The SQL Expression (`alias.column`).
+    :param expression:  SQL Expression
+    :return:
+    """
+
+    return set(CUCM_SQL_TABLE_ALIAS_PATTERN.findall(expression))
+
+
+class CucmSqlSearchQuery:
+
+    """
+        tinyCUCM SQL Search Query. Declarative `SELECT` Of The `sqlSearch*` Methods Family.
+
+        * columns:      Result Columns `(("alias", "expression"), ...)`
+        * table:        Main Table `"table alias"`
+        * joins:        `LEFT JOIN` Clauses `(("alias", "LEFT JOIN table alias ON ..."), ...)`, joins may reference
+                        only the main table & the previous joins
+        * conditions:   Constant `WHERE` Conditions
+        * order_by:     `ORDER BY` Expressions, must give a stable (total) order for the chunked
+                        execution & the pages
+        * criteria:     Search Criteria `{"Criterion": "expression"}` Of The Search Model
+        * schema:       Result Column Types `{"alias": "type"}` (`bool`, `datetime`, `int`, `uuid`) Of The Typed
+                        Response, the other columns are strings
+
+        Joins which aren't referenced by the requested columns, the search condition, the constant conditions or
+        the order (directly or through another join) are pruned. Pruned `LEFT JOIN` never filters the main table
+        rows, so the result contains the same objects with fewer columns (and no duplicates of 1:N joins).
+        """
+
+    def __init__(
+        self,
+        columns: tuple[tuple[str, str], ...],
+        table: str,
+        joins: tuple[tuple[str, str], ...] = (),
+        conditions: tuple[str, ...] = (),
+        order_by: tuple[str, ...] = (),
+        criteria: Optional[dict[str, str]] = None,
+        schema: Optional[dict[str, str]] = None
+    ):
+        self.columns = dict(columns)
+        self.table = table
+        self.joins = dict(joins)
+        self.conditions = conditions
+        self.order_by = order_by
+        self.criteria = criteria or {}
+        self.schema = schema or {}
+
+        self.__table_alias = table.split()[-1]
+        self.__joins_aliases = {
+            alias: cucm_sql_table_aliases(clause) - {alias} for alias, clause in self.joins.items()
+        }
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+
+        """
+        Result Columns Aliases Property.
+        :return:
+        """
+
+        return tuple(self.columns)
+
+    @property
+    def tables(self) -> dict[str, str]:
+
+        """
+        Tables Property: `{"alias": "table"}`.
+        :return:
+        """
+
+        tables = dict([self.table.split()[::-1]])
+        tables.update(clause.split()[2:4][::-1] for clause in self.joins.values())
+        return tables
+
+    @property
+    def table_columns(self) -> dict[str, set[str]]:
+
+        """
+        Table Columns Referenced By The Query (Columns, Joins, Conditions, Order & Criteria): `{"table": {"column"}}`.
+        :return:
+        """
+
+        tables = self.tables
+        table_columns = {table: set() for table in tables.values()}
+        expressions = [
+            *self.columns.values(), *self.joins.values(), *self.conditions, *self.order_by, *self.criteria.values()
+        ]
+        for expression in expressions:
+            for alias, column in CUCM_SQL_TABLE_COLUMN_PATTERN.findall(expression):
+                if alias in tables:
+                    table_columns[tables[alias]].add(column)
+        return table_columns
+
+    def __joins_required(self, expressions: Iterable[str]) -> set[str]:
+
+        """
+        Join Aliases Required By The Expressions, Including The Joins Required By Other Joins.
+        :param expressions: SQL Expressions
+        :return:
+        """
+
+        required = set()
+        pending = set().union(*(cucm_sql_table_aliases(expression) for expression in expressions))
+        while pending:
+            alias = pending.pop()
+            if alias in required or alias not in self.joins:
+                continue
+            required.add(alias)
+            pending |= self.__joins_aliases[alias]
+        return required
+
+    def __columns_select(self, fields: Optional[Iterable[str]]) -> dict[str, str]:
+
+        """
+        Requested Result Columns.
+        :param fields:  Result Columns Aliases, All Columns If None
+        :return:
+        """
+
+        if not fields:
+            return self.columns
+
+        unknown = [field for field in fields if field not in self.columns]
+        if unknown:
+            raise CucmBadRequestError(
+                f"BadRequest error occurred. Unknown fields: {unknown}. Available fields: {list(self.columns)}."
+            )
+        return {field: self.columns[field] for field in fields}
+
+    def __plan(self, condition: str, fields: Optional[Iterable[str]]) -> tuple[dict[str, str], set[str], list[str]]:
+
+        """
+        Query Plan: Requested Columns, Required Joins & Order Expressions.
+        :param condition:   Search Condition (`WHERE` Expression)
+        :param fields:      Result Columns Aliases, All Columns If None
+        :return:            `(columns, joins_aliases, order_by)`
+        """
+
+        columns = self.__columns_select(fields)
+        required = self.__joins_required([*columns.values(), condition, *self.conditions])
+        # Order Expressions Of The Pruned Joins Are Dropped (Pruned 1:N Joins Don't Multiply Rows)
+        order_by = [
+            expression for expression in self.order_by
+            if cucm_sql_table_aliases(expression) <= required | {self.__table_alias}
+        ]
+        return columns, required, order_by
+
+    def __from_where(self, required: set[str], conditions: Iterable[str]) -> list[str]:
+
+        """
+        `FROM`, `LEFT JOIN` & `WHERE` Clauses.
+        :param required:    Required Joins Aliases
+        :param conditions:  Search Conditions, Joined With The Constant Conditions
+        :return:
+        """
+
+        sql_query = [f"  FROM {self.table}"]
+        sql_query.extend(clause for alias, clause in self.joins.items() if alias in required)
+        sql_query.append(" WHERE " + "\n   AND ".join([*(f"({item})" for item in conditions), *self.conditions]))
+        return sql_query
+
+    def render(self, condition: str, fields: Optional[Iterable[str]] = None) -> str:
+
+        """
+        Render The SQL Query.
+        :param condition:   Search Condition (`WHERE` Expression)
+        :param fields:      Result Columns Aliases, All Columns If None
+        :return:
+        """
+
+        columns, required, order_by = self.__plan(condition, fields)
+        sql_query = [f"SELECT {_cucm_sql_select(columns)}", *self.__from_where(required, [condition])]
+        if order_by:
+            sql_query.append(" ORDER BY " + ", ".join(order_by))
+        return "\n".join(sql_query)
+
+    def render_page(
+        self,
+        condition: str,
+        fields: Optional[Iterable[str]] = None,
+        after: Optional[list[Optional[str]]] = None
+    ) -> str:
+
+        """
+        Render The SQL Query Of One Page (Keyset Pagination). The Order Expressions Are Selected As The
+        `page_key_N` Columns, The Page Starts After The Row With The `after` Keys. Paging Is Applied By The Caller
+        (`SKIP` & `FIRST`).
+        :param condition:   Search Condition (`WHERE` Expression)
+        :param fields:      Result Columns Aliases, All Columns If None
+        :param after:       Order Keys Of The Last Row Of The Previous Page, The First Page If None
+        :return:
+        """
+
+        columns, required, order_by = self.__plan(condition, fields)
+        if after is not None and len(after) != len(order_by):
+            raise CucmBadRequestError("BadRequest error occurred. The page cursor doesn't match the search.")
+
+        columns = {
+            **columns,
+            **{f"{CUCM_SQL_PAGE_KEY_PREFIX}{index}": expression for index, expression in enumerate(order_by)}
+        }
+        conditions = [condition]
+        if after is not None:
+            conditions.append(cucm_sql_keyset_condition(order_by, after))
+        sql_query = [f"SELECT {_cucm_sql_select(columns)}", *self.__from_where(required, conditions)]
+        sql_query.append(" ORDER BY " + ", ".join(order_by))
+        return "\n".join(sql_query)
+
+    def render_count(self, condition: str, fields: Optional[Iterable[str]] = None) -> str:
+
+        """
+        Render The Count Query: Number Of The Rows Of The Search (The Same Joins, No Order).
+        :param condition:   Search Condition (`WHERE` Expression)
+        :param fields:      Result Columns Aliases, All Columns If None
+        :return:
+        """
+
+        _, required, _ = self.__plan(condition, fields)
+        return "\n".join(["SELECT COUNT(*) AS total", *self.__from_where(required, [condition])])
+
+    def render_aggregate(self, condition: str, group_by: Iterable[str] = ()) -> str:
+
+        """
+        Render The Aggregate Query: Number Of The Distinct Objects (Main Table PKIDs) Per Group. Only The Joins Of
+        The Groups & The Condition Are Kept, 1:N Joins Don't Multiply The Counts.
+        :param condition:   Search Condition (`WHERE` Expression)
+        :param group_by:    Groups: Search Criteria (`"Device Pool"`) or Result Columns Aliases (`"model"`),
+                            Selected As The `group_N` Columns; The Total Count If Empty
+        :return:
+        """
+
+        expressions = []
+        for item in group_by:
+            expression = self.criteria.get(item) or self.columns.get(item)
+            if expression is None:
+                raise CucmBadRequestError(
+                    f"BadRequest error occurred. Unknown group: {repr(item)}. "
+                    f"Available groups: {[*self.criteria, *self.columns]}."
+                )
+            expressions.append(expression)
+
+        required = self.__joins_required([*expressions, condition, *self.conditions])
+        select = [f"{expression} AS {CUCM_SQL_GROUP_KEY_PREFIX}{index}" for index, expression in enumerate(expressions)]
+        select.append(f"COUNT(DISTINCT {self.__table_alias}.pkid) AS total")
+        sql_query = ["SELECT " + ",\n       ".join(select), *self.__from_where(required, [condition])]
+        if expressions:
+            sql_query.append(" GROUP BY " + ", ".join(expressions))
+            sql_query.append(" ORDER BY " + ", ".join(expressions))
+        return "\n".join(sql_query)
+
+
+########################################################################################################################
+
+
+CUCM_SQL_SEARCH_CALL_PICKUP_GROUPS_QUERY = CucmSqlSearchQuery(
+    columns=(
+        ("pkid", "cpg.pkid"),
+        ("name", "cpg.name"),
+        ("description", "npg.description"),
+        ("pattern", "npg.dnorpattern"),
+        ("partition", "rpg.name"),
+        ("line_pkid", "npm.pkid"),
+        ("line_number", "npm.dnorpattern"),
+        ("line_partition", "rpm.name"),
+        ("line_description", "npm.description"),
+    ),
+    table="pickupgroup cpg",
+    joins=(
+        ("npg", "LEFT JOIN numplan npg ON npg.pkid = cpg.fknumplan_pickup"),
+        ("rpg", "LEFT JOIN routepartition rpg ON rpg.pkid = npg.fkroutepartition"),
+        ("pglm", "LEFT JOIN pickupgrouplinemap pglm ON pglm.fkpickupgroup = cpg.pkid"),
+        ("npm", "LEFT JOIN numplan npm ON npm.pkid = pglm.fknumplan_line"),
+        ("rpm", "LEFT JOIN routepartition rpm ON rpm.pkid = npm.fkroutepartition"),
+    ),
+    conditions=("npg.tkpatternusage = '4'",),
+    order_by=("cpg.name", "cpg.pkid", "npm.pkid"),
+    criteria=CUCM_SQL_SEARCH_CALL_PICKUP_GROUPS_CRITERIA,
+    schema={"pkid": "uuid", "line_pkid": "uuid"},
+)
+
+
+CUCM_SQL_SEARCH_DEVICES_QUERY = CucmSqlSearchQuery(
+    columns=(
+        ("pkid", "d.pkid"),
+        ("name", "d.name"),
+        ("description", "d.description"),
+        ("device_pool", "dp.name"),
+        ("line_pkid", "np.pkid"),
+        ("line_number", "np.dnorpattern"),
+        ("line_index", "dnpm.numplanindex"),
+        ("line_partition", "rp.name"),
+        ("line_description", "np.description"),
+        ("class", "tc.name"),
+        ("model", "tm.name"),
+        ("end_user_pkid", "eu.pkid"),
+        ("userid", "eu.userid"),
+        ("display_name", "eu.displayname"),
+        ("end_user_rdp_pkid", "eu_rdp.pkid"),
+        ("userid_rdp", "eu_rdp.userid"),
+        ("display_name_rdp", "eu_rdp.displayname"),
+    ),
+    table="device d",
+    joins=(
+        ("dnpm", "LEFT JOIN devicenumplanmap dnpm ON dnpm.fkdevice = d.pkid"),
+        ("np", "LEFT JOIN numplan np ON np.pkid = dnpm.fknumplan"),
+        ("rp", "LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition"),
+        ("dp", "LEFT JOIN devicepool dp ON dp.pkid = d.fkdevicepool"),
+        ("tm", "LEFT JOIN typemodel tm ON tm.enum = d.tkmodel"),
+        ("tc", "LEFT JOIN typeclass tc ON tc.enum = d.tkclass"),
+        ("tprod", "LEFT JOIN typeproduct tprod ON tprod.tkmodel = d.tkmodel"),
+        ("eu", "LEFT JOIN enduser eu ON eu.pkid = d.fkenduser"),
+        ("eu_rdp", "LEFT JOIN enduser eu_rdp ON eu_rdp.pkid = d.fkenduser_mobility"),
+    ),
+    conditions=(
+        "(d.tkclass = '1' OR d.tkclass = '20' OR d.tkclass = '254')",
+        "d.name NOT LIKE 'ModelProfile%'",
+    ),
+    order_by=("d.name", "dnpm.numplanindex"),
+    criteria=CUCM_SQL_SEARCH_DEVICES_CRITERIA,
+    schema={
+        "pkid": "uuid",
+        "line_pkid": "uuid",
+        "line_index": "int",
+        "end_user_pkid": "uuid",
+        "end_user_rdp_pkid": "uuid",
+    },
+)
+
+
+CUCM_SQL_SEARCH_END_USERS_QUERY = CucmSqlSearchQuery(
+    columns=(
+        ("pkid", "eu.pkid"),
+        ("userid", "eu.userid"),
+        ("display_name", "eu.displayname"),
+        ("last_name", "eu.lastname"),
+        ("phone_number", "eu.telephonenumber"),
+        ("mobile_number", "eu.mobile"),
+        ("mailid", "eu.mailid"),
+        ("department", "eu.department"),
+        ("title", "eu.title"),
+        ("user_type", "eu.fkdirectorypluginconfig"),
+        ("user_status", "eu.status"),
+    ),
+    table="enduser eu",
+    order_by=("eu.userid",),
+    criteria=CUCM_SQL_SEARCH_END_USERS_CRITERIA,
+    schema={"pkid": "uuid", "user_type": "uuid", "user_status": "int"},
+)
+
+
+CUCM_SQL_SEARCH_LINE_FORWARDS_QUERY = CucmSqlSearchQuery(
+    columns=(
+        ("pkid", "np.pkid"),
+        ("line", "np.dnorpattern"),
+        ("line_partition", "rp.name"),
+        ("line_description", "np.description"),
+
+        ("voice_all", "cfd.cfavoicemailenabled"),
+        ("dst_all", "cfd.cfadestination"),
+        ("css_primary", "cfa.name"),
+        ("css_secondary", "scfa.name"),
+
+        ("voice_ext_busy", "np.cfbvoicemailenabled"),
+        ("dst_ext_busy", "np.cfbdestination"),
+        ("css_ext_busy", "cfb.name"),
+
+        ("voice_int_busy", "np.cfbintvoicemailenabled"),
+        ("dst_int_busy", "np.cfbintdestination"),
+        ("css_int_busy", "cfbint.name"),
+
+        ("voice_ext_no_ans", "np.cfnavoicemailenabled"),
+        ("dst_ext_no_ans", "np.cfnadestination"),
+        ("css_ext_no_ans", "cfna.name"),
+
+        ("duration_no_ans", "np.cfnaduration"),
+
+        ("voice_int_no_ans", "np.cfnaintvoicemailenabled"),
+        ("dst_int_no_ans", "np.cfnaintdestination"),
+        ("css_int_no_ans", "cfnaint.name"),
+
+        ("voice_ext_unreg", "np.cfurvoicemailenabled"),
+        ("dst_ext_unreg", "np.cfurdestination"),
+        ("css_ext_unreg", "cfur.name"),
+
+        ("voice_int_unreg", "np.cfurintvoicemailenabled"),
+        ("dst_int_unreg", "np.cfurintdestination"),
+        ("css_int_unreg", "cfurint.name"),
+    ),
+    table="numplan np",
+    joins=(
+        ("rp", "LEFT JOIN routepartition rp ON np.fkroutepartition = rp.pkid"),
+        ("cfd", "LEFT JOIN callforwarddynamic cfd ON cfd.fknumplan = np.pkid"),
+        ("cfa", "LEFT JOIN callingsearchspace cfa ON cfd.fkcallingsearchspace_cfa = cfa.pkid"),
+        ("scfa", "LEFT JOIN callingsearchspace scfa ON cfd.fkcallingsearchspace_scfa = scfa.pkid"),
+        ("cfb", "LEFT JOIN callingsearchspace cfb ON np.fkcallingsearchspace_cfb = cfb.pkid"),
+        ("cfbint", "LEFT JOIN callingsearchspace cfbint ON np.fkcallingsearchspace_cfbint = cfbint.pkid"),
+        ("cfna", "LEFT JOIN callingsearchspace cfna ON np.fkcallingsearchspace_cfna = cfna.pkid"),
+        ("cfnaint", "LEFT JOIN callingsearchspace cfnaint ON np.fkcallingsearchspace_cfnaint = cfnaint.pkid"),
+        ("cfur", "LEFT JOIN callingsearchspace cfur ON np.fkcallingsearchspace_cfur = cfur.pkid"),
+        ("cfurint", "LEFT JOIN callingsearchspace cfurint ON np.fkcallingsearchspace_cfurint = cfurint.pkid"),
+    ),
+    conditions=("np.tkpatternusage = '2'",),
+    order_by=("np.dnorpattern", "np.pkid"),
+    schema={
+        "pkid": "uuid",
+        "voice_all": "bool",
+        "voice_ext_busy": "bool",
+        "voice_int_busy": "bool",
+        "voice_ext_no_ans": "bool",
+        "duration_no_ans": "int",
+        "voice_int_no_ans": "bool",
+        "voice_ext_unreg": "bool",
+        "voice_int_unreg": "bool",
+    },
+)
+
+
+CUCM_SQL_SEARCH_LINE_GROUPS_QUERY = CucmSqlSearchQuery(
+    columns=(
+        ("pkid", "lg.pkid"),
+        ("name", "lg.name"),
+        ("algorithm", "tda.name"),
+        ("line_pkid", "np.pkid"),
+        ("line", "np.dnorpattern"),
+        ("line_partition", "rp.name"),
+        ("line_description", "np.description"),
+        ("line_index", "lgnpm.lineselectionorder"),
+    ),
+    table="linegroup lg",
+    joins=(
+        ("lgnpm", "LEFT JOIN linegroupnumplanmap lgnpm ON lgnpm.fklinegroup = lg.pkid"),
+        ("tda", "LEFT JOIN typedistributealgorithm tda ON tda.enum = lg.tkdistributealgorithm"),
+        ("np", "LEFT JOIN numplan np ON np.pkid = lgnpm.fknumplan"),
+        ("rp", "LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition"),
+    ),
+    order_by=("lg.name", "lgnpm.lineselectionorder"),
+    criteria=CUCM_SQL_SEARCH_LINE_GROUPS_CRITERIA,
+    schema={"pkid": "uuid", "line_pkid": "uuid", "line_index": "int"},
+)
+
+
+CUCM_SQL_SEARCH_LINE_NUMBERS_QUERY = CucmSqlSearchQuery(
+    columns=(
+        ("pkid", "np.pkid"),
+        ("line_number", "np.dnorpattern"),
+        ("line_description", "np.description"),
+        ("alertingname", "np.alertingname"),
+        ("alertingnameascii", "np.alertingnameascii"),
+        ("line_partition", "rp.name"),
+        ("line_css_sharedline", "css.name"),
+    ),
+    table="numplan np",
+    joins=(
+        ("rp", "LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition"),
+        ("css", "LEFT JOIN callingsearchspace css ON css.pkid = np.fkcallingsearchspace_sharedlineappear"),
+    ),
+    conditions=("np.tkpatternusage = '2'",),
+    order_by=("np.dnorpattern", "np.pkid"),
+    criteria=CUCM_SQL_SEARCH_LINE_NUMBERS_CRITERIA,
+    schema={"pkid": "uuid"},
+)
+
+
+CUCM_SQL_SEARCH_PATTERNS_QUERY = CucmSqlSearchQuery(
+    columns=(
+        ("pkid", "np.pkid"),
+        ("pattern", "np.dnorpattern"),
+        ("description", "np.description"),
+        ("partition", "rp.name"),
+        ("css", "css.name"),
+        ("pattern_usage", "np.tkpatternusage"),
+        ("pattern_type", "tpu.name"),
+    ),
+    table="numplan np",
+    joins=(
+        ("rp", "LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition"),
+        ("css", "LEFT JOIN callingsearchspace css ON css.pkid = np.fkcallingsearchspace_translation"),
+        ("tpu", "LEFT JOIN typepatternusage tpu ON tpu.enum = np.tkpatternusage"),
+    ),
+    order_by=("np.dnorpattern", "np.tkpatternusage", "np.pkid"),
+    criteria=CUCM_SQL_SEARCH_PATTERNS_CRITERIA,
+    schema={"pkid": "uuid", "pattern_usage": "int"},
+)
+
+
+CUCM_SQL_SEARCH_REMOTE_DESTINATIONS_QUERY = CucmSqlSearchQuery(
+    columns=(
+        ("pkid", "rd.pkid"),
+        ("name", "rd.name"),
+        ("destination", "rdd.destination"),
+        ("snr", "rdd.enablesinglenumberreach"),
+        ("is_mobile", "rdd.ismobilephone"),
+        ("start_delay", "rdd.delaybeforeringingcell"),
+        ("stop_ringing", "rdd.answertoolatetimer"),
+    ),
+    table="remotedestination rd",
+    joins=(
+        ("rdd", "LEFT JOIN remotedestinationdynamic rdd ON rdd.fkremotedestination = rd.pkid"),
+    ),
+    order_by=("rd.name", "rd.pkid"),
+    criteria=CUCM_SQL_SEARCH_REMOTE_DESTINATIONS_CRITERIA,
+    schema={
+        "pkid": "uuid",
+        "snr": "bool",
+        "is_mobile": "bool",
+        "start_delay": "int",
+        "stop_ringing": "int",
+    },
+)
+
+
+CUCM_SQL_SEARCH_TRANSLATION_PATTERNS_QUERY = CucmSqlSearchQuery(
+    columns=(
+        ("pkid", "np.pkid"),
+        ("pattern", "np.dnorpattern"),
+        ("description", "np.description"),
+        ("partition", "rp.name"),
+        ("css", "css.name"),
+        ("called_tmask", "np.calledpartytransformationmask"),
+        ("called_prefix", "np.prefixdigitsout"),
+        ("route_class", "rc.name"),
+        ("block_enable", "np.blockenable"),
+    ),
+    table="numplan np",
+    joins=(
+        ("rp", "LEFT JOIN routepartition rp ON rp.pkid = np.fkroutepartition"),
+        ("css", "LEFT JOIN callingsearchspace css ON css.pkid = np.fkcallingsearchspace_translation"),
+        ("rc", "LEFT JOIN typepatternrouteclass rc ON rc.enum = np.tkpatternrouteclass"),
+    ),
+    conditions=("np.tkpatternusage = '3'",),
+    order_by=("np.dnorpattern", "np.pkid"),
+    criteria=CUCM_SQL_SEARCH_TRANSLATION_PATTERNS_CRITERIA,
+    schema={"pkid": "uuid", "block_enable": "bool"},
+)
+
+
+CUCM_SQL_SEARCH_UNASSIGNED_NUMBERS_QUERY = CucmSqlSearchQuery(
+    columns=tuple(CUCM_SQL_SEARCH_LINE_NUMBERS_QUERY.columns.items()),
+    table="numplan np",
+    joins=(
+        ("rp", "LEFT JOIN routepartition rp ON np.fkroutepartition = rp.pkid"),
+        ("css", "LEFT JOIN callingsearchspace css ON css.pkid = np.fkcallingsearchspace_sharedlineappear"),
+        ("dnmp", "LEFT JOIN devicenumplanmap dnmp ON dnmp.fknumplan = np.pkid"),
+        ("lgnmp", "LEFT JOIN linegroupnumplanmap lgnmp ON lgnmp.fknumplan = np.pkid"),
+    ),
+    conditions=("dnmp.pkid IS NULL", "lgnmp.pkid IS NULL", "np.tkpatternusage = '2'"),
+    order_by=("np.dnorpattern", "np.pkid"),
+    criteria=CUCM_SQL_SEARCH_LINE_NUMBERS_CRITERIA,
+    schema=dict(CUCM_SQL_SEARCH_LINE_NUMBERS_QUERY.schema),
+)
+
+
+# All Search Queries, The Replica Stores The Tables & Columns Referenced By Them
+CUCM_SQL_SEARCH_QUERIES = (
+    CUCM_SQL_SEARCH_CALL_PICKUP_GROUPS_QUERY,
+    CUCM_SQL_SEARCH_DEVICES_QUERY,
+    CUCM_SQL_SEARCH_END_USERS_QUERY,
+    CUCM_SQL_SEARCH_LINE_FORWARDS_QUERY,
+    CUCM_SQL_SEARCH_LINE_GROUPS_QUERY,
+    CUCM_SQL_SEARCH_LINE_NUMBERS_QUERY,
+    CUCM_SQL_SEARCH_PATTERNS_QUERY,
+    CUCM_SQL_SEARCH_REMOTE_DESTINATIONS_QUERY,
+    CUCM_SQL_SEARCH_TRANSLATION_PATTERNS_QUERY,
+    CUCM_SQL_SEARCH_UNASSIGNED_NUMBERS_QUERY,
+)
+
+
+########################################################################################################################
+
+
+class CucmSqlListQuery:
+
+    """
+        tinyCUCM SQL List Query. Declarative `SELECT` Of The `sqlList*` (Reference Data) Methods Family.
+
+        * columns:              Result Columns `(("alias", "expression"), ...)`
+        * table:                Table `"table alias"`
+        * conditions:           Constant `WHERE` Conditions
+        * order_by:             Result Column Alias Of The Order
+        * is_numeric_order:     Order Column Is A Number (`enum` Of The Type Tables)
+        """
+
+    def __init__(
+        self,
+        columns: tuple[tuple[str, str], ...],
+        table: str,
+        conditions: tuple[str, ...] = (),
+        order_by: str = "name",
+        is_numeric_order: bool = False
+    ):
+        self.columns = dict(columns)
+        self.table = table
+        self.conditions = conditions
+        self.order_by = order_by
+        self.is_numeric_order = is_numeric_order
+
+    def __from_where(self) -> str:
+        where = " WHERE " + " AND ".join(self.conditions) if self.conditions else ""
+        return f" FROM {self.table}{where}"
+
+    def render(self) -> str:
+
+        """
+        Render The SQL Query.
+        :return:
+        """
+
+        select = _cucm_sql_select(self.columns, separator=", ")
+        return f"SELECT {select}{self.__from_where()} ORDER BY {self.columns[self.order_by]}"
+
+    def render_branch(self, index: int, aliases: Iterable[str]) -> str:
+
+        """
+        Render The `UNION ALL` Branch: The Discriminator `list_index` & The Union Columns Cast To `LVARCHAR`
+        (NULL If The Query Doesn't Have The Column). Branches Of The `UNION` Aren't Ordered.
+        :param index:   Discriminator Value
+        :param aliases: Result Columns Aliases Of The Union
+        :return:
+        """
+
+        select = [f"{index} AS list_index"]
+        select.extend(f"CAST({self.columns.get(alias, 'NULL')} AS LVARCHAR) AS {alias}" for alias in aliases)
+        return f"SELECT {', '.join(select)}{self.__from_where()}"
+
+    def sort(self, rows: Iterable[dict]) -> tuple[dict, ...]:
+
+        """
+        Sort The Rows Of The `UNION ALL` Branch Like The `ORDER BY` Of The Query (NULL First).
+        :param rows:    Rows
+        :return:
+        """
+
+        def key(row: dict) -> tuple:
+            value = row.get(self.order_by)
+            if value is None:
+                return False, 0 if self.is_numeric_order else ""
+            return True, int(value) if self.is_numeric_order else value
+
+        return tuple(sorted(rows, key=key))
+
+
+def cucm_sql_list_union(queries: Iterable[CucmSqlListQuery]) -> str:
+
+    """
+    Render The `UNION ALL` Of The List Queries: One Request For Many Lists. The `list_index` Column Is The Index
+    Of The Query, The Columns Are The Union Of The Queries Columns.
+    :param queries: List Queries
+    :return:
+    """
+
+    queries = list(queries)
+    aliases = list(dict.fromkeys(alias for query in queries for alias in query.columns))
+    return "\nUNION ALL\n".join(query.render_branch(index, aliases) for index, query in enumerate(queries))
+
+
+def _cucm_sql_list_query(alias: str, table: str, columns: Iterable[str] = ("pkid", "name")) -> CucmSqlListQuery:
+    return CucmSqlListQuery(columns=tuple((column, f"{alias}.{column}") for column in columns), table=f"{table} {alias}")
+
+
+def _cucm_sql_type_query(alias: str, table: str, columns: Iterable[str] = ("name",)) -> CucmSqlListQuery:
+    return CucmSqlListQuery(
+        columns=(("pkid", f"{alias}.enum"), *((column, f"{alias}.{column}") for column in columns)),
+        table=f"{table} {alias}",
+        order_by="pkid",
+        is_numeric_order=True
+    )
+
+
+# Reference Data Queries Of The `sqlList*` Methods: {"method_name": CucmSqlListQuery}
+CUCM_SQL_LIST_QUERIES = {
+    "sqlListCallingSearchSpace": _cucm_sql_list_query("css", "callingsearchspace", ("pkid", "name", "description")),
+    "sqlListCredentialPolicy": CucmSqlListQuery(
+        columns=(("pkid", "cp.pkid"), ("name", "cp.displayname")),
+        table="credentialpolicy cp"
+    ),
+    "sqlListDevicePool": _cucm_sql_list_query("dp", "devicepool"),
+    "sqlListDirGroup": _cucm_sql_list_query("dg", "dirgroup"),
+    "sqlListMediaResourceGroup": _cucm_sql_list_query("mrg", "mediaresourcegroup", ("pkid", "name", "description")),
+    "sqlListMediaResourceList": _cucm_sql_list_query("mrl", "mediaresourcelist"),
+    "sqlListPhoneTemplate": _cucm_sql_list_query("pt", "phonetemplate"),
+    "sqlListProcessNode": CucmSqlListQuery(
+        columns=(("pkid", "pn.pkid"), ("name", "pn.name"), ("description", "pn.description")),
+        table="processnode pn",
+        conditions=("pn.name NOT LIKE 'EnterpriseWideData'",)
+    ),
+    "sqlListRecordingProfile": _cucm_sql_list_query("rp", "recordingprofile"),
+    "sqlListRegion": _cucm_sql_list_query("r", "region"),
+    "sqlListRoutePartition": _cucm_sql_list_query("rp", "routepartition", ("pkid", "name", "description")),
+    "sqlListSoftkeyTemplate": _cucm_sql_list_query("skt", "softkeytemplate", ("pkid", "name", "description")),
+    "sqlListTelecasterService": _cucm_sql_list_query("ts", "telecasterservice", ("pkid", "name", "description")),
+    "sqlListTypeClass": _cucm_sql_type_query("tc", "typeclass"),
+    "sqlListTypeCountry": _cucm_sql_type_query("tc", "typecountry"),
+    "sqlListTypeModel": _cucm_sql_type_query("tm", "typemodel"),
+    "sqlListTypeUserLocale": _cucm_sql_type_query("tul", "typeuserlocale", ("name", "nativename")),
+    "sqlListUcServiceProfile": _cucm_sql_list_query("ucsp", "ucserviceprofile", ("pkid", "name", "description")),
+    "sqlListUcUserProfile": _cucm_sql_list_query("ucup", "ucuserprofile", ("pkid", "name", "description")),
+}
@@ -0,0 +1,141 @@
+import asyncio
+import re
+
+import pytest
+
+from tinyCUCM import AsyncCucmClient, CucmClient
+from tinyCUCM.exceptions import CucmBadRequestError
+from tinyCUCM.replica import CucmSqlReplica
+
+
+# Publisher Tables: One Device With Two Lines (Rows Share The `d.name` Order Key), Non-ASCII & NULL Descriptions
+TABLES = {
+    "device": [
+        {"pkid": f"d{index:02d}", "name": f"SEP{index % 4:04d}{index:02d}", "description": description,
+         "fkdevicepool": "dp1", "tkmodel": "36", "tkclass": "1"}
+        for index, description in enumerate(["Иванов", "ИВАНОВА", "Petrov", None, "ivanova", "Smith", "", "Иван"])
+    ],
+    "devicepool": [{"pkid": "dp1", "name": "DP_HQ"}],
+    "numplan": [
+        {"pkid": "n1", "dnorpattern": "1001", "tkpatternusage": "2", "fkroutepartition": "rp1"},
+        {"pkid": "n2", "dnorpattern": "1002", "tkpatternusage": "2", "fkroutepartition": None},
+    ],
+    "devicenumplanmap": [
+        {"pkid": "m1", "fkdevice": "d01", "fknumplan": "n1", "numplanindex": "1"},
+        {"pkid": "m2", "fkdevice": "d01", "fknumplan": "n2", "numplanindex": "2"},
+        {"pkid": "m3", "fkdevice": "d05", "fknumplan": "n2", "numplanindex": "1"},
+    ],
+    "routepartition": [{"pkid": "rp1", "name": "PT_Internal"}],
+}
+
+
+def fetch(sql_query: str) -> list[dict]:
+    match = re.match(r"SELECT (.*?) FROM (\w+) ORDER BY", sql_query, re.S)
+    columns = [column.strip() for column in match[1].split(",")]
+    return [{column: row.get(column) for column in columns} for row in TABLES.get(match[2], [])]
+
+
+@pytest.fixture
+def replica_path(tmp_path):
+    replica = CucmSqlReplica(path=str(tmp_path / "replica.sqlite"))
+    replica.build(fetch)
+    return replica.path
+
+
+@pytest.fixture
+def client(tmp_path, replica_path):
+    return CucmClient(
+        pub_fqdn="cucm.invalid",
+        pub_version="11.5",
+        toolkit_path=str(tmp_path),
+        user_login="user",
+        user_password="password",
+        sql_replica_path=replica_path,
+    )
+
+
+@pytest.fixture
+def async_client(tmp_path, replica_path):
+    return AsyncCucmClient(
+        pub_fqdn="cucm.invalid",
+        pub_version="11.5",
+        toolkit_path=str(tmp_path),
+        user_login="user",
+        user_password="password",
+        sql_replica_path=replica_path,
+    )
+
+
+########################################################################################################################
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 5])
+def test_search_pages_follow_the_full_search(client, page_size):
+    full = client.sqlSearchDevices(criterion="Name", value="")
+
+    rows, cursor = [], None
+    while True:
+        page = client.sqlSearchDevices(criterion="Name", value="", page_size=page_size, page_cursor=cursor)
+        assert page["total"] == len(full)
+        rows.extend(page["rows"] or ())
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert tuple(rows) == full
+
+
+def test_search_page_cursor_is_bound_to_the_search(client):
+    page = client.sqlSearchDevices(criterion="Name", value="SEP", page_size=1)
+    with pytest.raises(CucmBadRequestError):
+        client.sqlSearchDevices(
+            criterion="Name", value="SEP", fields=["name"], page_size=1, page_cursor=page["next_cursor"]
+        )
+
+
+def test_case_insensitive_search_folds_non_ascii_letters(client):
+    rows = client.sqlSearchDevices(criterion="Description", value="иванов", fields=["description"])
+    assert sorted(row["description"] for row in rows) == sorted(["Иванов", "ИВАНОВА"])
+
+    rows = client.sqlSearchDevices(criterion="Description", value="ИВАН", match="prefix", fields=["description"])
+    assert sorted(row["description"] for row in rows) == sorted(["Иванов", "ИВАНОВА", "Иван"])
+
+
+########################################################################################################################
+
+
+def test_async_search_matches_the_sync_search(client, async_client):
+    async def search():
+        rows = await async_client.sqlSearchDevices(criterion="Name", value="")
+        stream = await async_client.sqlSearchDevices(criterion="Name", value="", is_stream_resp=True, chunk_size=2)
+        counts = await async_client.sqlSearchDevices(criterion="Name", value="", group_by=["Device Pool"])
+        return rows, [row async for row in stream], counts
+
+    rows, streamed, counts = asyncio.run(search())
+    assert rows == client.sqlSearchDevices(criterion="Name", value="")
+    assert tuple(streamed) == rows
+    assert counts == client.sqlSearchDevices(criterion="Name", value="", group_by=["Device Pool"])
+
+
+@pytest.mark.parametrize("page_size", [1, 3])
+def test_async_search_pages_follow_the_sync_pages(client, async_client, page_size):
+    async def pages():
+        resp, cursor = [], None
+        while True:
+            page = await async_client.sqlSearchDevices(
+                criterion="Name", value="", page_size=page_size, page_cursor=cursor
+            )
+            resp.append(page)
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return resp
+
+    sync_pages, cursor = [], None
+    while True:
+        page = client.sqlSearchDevices(criterion="Name", value="", page_size=page_size, page_cursor=cursor)
+        sync_pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert asyncio.run(pages()) == sync_pages
@@ -0,0 +1,185 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from tinyCUCM.exceptions import CucmBadRequestError
+from tinyCUCM.sql_models import CucmSqlSearchDevicesModel
+from tinyCUCM.sql_queries import (
+    CUCM_SQL_PAGE_KEY_PREFIX,
+    CUCM_SQL_SEARCH_DEVICES_QUERY,
+    CucmSqlSearchQuery,
+    cucm_sql_keyset_condition,
+    cucm_sql_page_cursor,
+    cucm_sql_page_cursor_keys,
+)
+
+
+ITEMS_QUERY = CucmSqlSearchQuery(
+    columns=(("pkid", "t.pkid"), ("name", "t.name"), ("extra", "t.extra")),
+    table="items t",
+    order_by=("t.name", "t.extra", "t.pkid"),
+)
+
+# NULL Keys In Every Position Of The Order, Duplicate First Keys
+ITEMS = [
+    ("p01", "alpha", "x"),
+    ("p02", "alpha", None),
+    ("p03", None, "y"),
+    ("p04", None, None),
+    ("p05", "beta", "x"),
+    ("p06", "beta", "x"),
+    ("p07", None, "y"),
+    ("p08", "alpha", "z"),
+    ("p09", "gamma", None),
+    ("p10", "o'hara", "x"),
+]
+
+
+@pytest.fixture
+def items_db():
+    with closing(sqlite3.connect(":memory:")) as connection:
+        connection.execute("CREATE TABLE items (pkid TEXT, name TEXT, extra TEXT)")
+        connection.executemany("INSERT INTO items VALUES (?, ?, ?)", ITEMS)
+        yield connection
+
+
+def fetch(connection: sqlite3.Connection, sql_query: str) -> list[dict]:
+    cursor = connection.execute(sql_query)
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+########################################################################################################################
+
+
+def test_sqlite_sorts_null_first_like_informix(items_db):
+    # The keyset condition relies on NULL being the lowest value of the ascending order (Informix & SQLite)
+    rows = fetch(items_db, "SELECT name FROM items ORDER BY name")
+    assert [row["name"] for row in rows[:3]] == [None, None, None]
+
+
+def test_keyset_condition_null_keys():
+    assert cucm_sql_keyset_condition(["t.a", "t.b"], [None, "x"]) == (
+        "(t.a IS NOT NULL) OR (t.a IS NULL AND t.b > 'x')"
+    )
+    assert cucm_sql_keyset_condition(["t.a", "t.b"], ["o'hara", None]) == (
+        "(t.a > 'o''hara') OR (t.a = 'o''hara' AND t.b IS NOT NULL)"
+    )
+
+
+def test_keyset_condition_follows_the_order(items_db):
+    ordered = fetch(items_db, ITEMS_QUERY.render(condition="1 = 1"))
+    for index, row in enumerate(ordered):
+        after = [row["name"], row["extra"], row["pkid"]]
+        sql_query = ITEMS_QUERY.render(condition=cucm_sql_keyset_condition(list(ITEMS_QUERY.order_by), after))
+        assert fetch(items_db, sql_query) == ordered[index + 1:]
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 4, len(ITEMS)])
+def test_keyset_pages_cover_the_search_once(items_db, page_size):
+    page_query = ITEMS_QUERY.render_page(condition="1 = 1")
+    ordered = fetch(items_db, ITEMS_QUERY.render(condition="1 = 1"))
+
+    rows, cursor = [], None
+    while True:
+        after = cucm_sql_page_cursor_keys(page_query=page_query, cursor=cursor) if cursor else None
+        sql_query = ITEMS_QUERY.render_page(condition="1 = 1", after=after)
+        page = fetch(items_db, f"{sql_query}\n LIMIT {page_size + 1}")
+        keys = []
+        for row in page[:page_size]:
+            keys = [row.pop(column) for column in list(row) if column.startswith(CUCM_SQL_PAGE_KEY_PREFIX)]
+            rows.append(row)
+        if len(page) <= page_size:
+            break
+        cursor = cucm_sql_page_cursor(page_query=page_query, keys=keys)
+
+    assert rows == ordered
+
+
+def test_page_cursor_round_trip():
+    page_query = ITEMS_QUERY.render_page(condition="t.name LIKE 'a%'")
+    keys = ["alpha", None, "p02"]
+    assert cucm_sql_page_cursor_keys(page_query, cucm_sql_page_cursor(page_query, keys)) == keys
+
+
+def test_page_cursor_of_another_search_is_rejected():
+    cursor = cucm_sql_page_cursor(ITEMS_QUERY.render_page(condition="t.name LIKE 'a%'"), ["alpha", None, "p02"])
+    with pytest.raises(CucmBadRequestError, match="doesn't match"):
+        cucm_sql_page_cursor_keys(ITEMS_QUERY.render_page(condition="t.name LIKE 'b%'"), cursor)
+    with pytest.raises(CucmBadRequestError, match="doesn't match"):
+        cucm_sql_page_cursor_keys(
+            ITEMS_QUERY.render_page(condition="t.name LIKE 'a%'", fields=["pkid"]), cursor
+        )
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "e30=", "WzFd"])
+def test_page_cursor_invalid(cursor):
+    with pytest.raises(CucmBadRequestError):
+        cucm_sql_page_cursor_keys(ITEMS_QUERY.render_page(condition="1 = 1"), cursor)
+
+
+def test_render_page_rejects_keys_of_another_order():
+    with pytest.raises(CucmBadRequestError):
+        ITEMS_QUERY.render_page(condition="1 = 1", after=["alpha", None])
+
+
+########################################################################################################################
+
+
+def joins_of(sql_query: str) -> list[str]:
+    return [line.split()[3] for line in sql_query.splitlines() if line.lstrip().startswith("LEFT JOIN")]
+
+
+def search_condition(**kwargs) -> str:
+    validated_data = CucmSqlSearchDevicesModel(**kwargs)
+    return " AND ".join(
+        item.sql_condition(expression=item.sql_criterion) for item in validated_data.search_items
+    )
+
+
+def test_all_fields_keep_the_column_joins():
+    # tprod is referenced by the "Device Type" criterion only
+    sql_query = CUCM_SQL_SEARCH_DEVICES_QUERY.render(condition=search_condition(criterion="Name", value="SEP"))
+    assert joins_of(sql_query) == [alias for alias in CUCM_SQL_SEARCH_DEVICES_QUERY.joins if alias != "tprod"]
+
+    sql_query = CUCM_SQL_SEARCH_DEVICES_QUERY.render(condition=search_condition(criterion="Device Type", value="88"))
+    assert joins_of(sql_query) == list(CUCM_SQL_SEARCH_DEVICES_QUERY.joins)
+
+
+def test_fields_prune_unreferenced_joins():
+    sql_query = CUCM_SQL_SEARCH_DEVICES_QUERY.render(
+        condition=search_condition(criterion="Name", value="SEP"), fields=["pkid", "name"]
+    )
+    assert joins_of(sql_query) == []
+    # Order expressions of the pruned joins are dropped too
+    assert sql_query.endswith(" ORDER BY d.name")
+
+
+def test_fields_keep_the_join_chain():
+    sql_query = CUCM_SQL_SEARCH_DEVICES_QUERY.render(
+        condition=search_condition(criterion="Name", value="SEP"), fields=["name", "line_partition"]
+    )
+    # rp is joined through np & dnpm
+    assert joins_of(sql_query) == ["dnpm", "np", "rp"]
+    assert sql_query.endswith(" ORDER BY d.name, dnpm.numplanindex")
+
+
+def test_conditions_keep_their_joins():
+    sql_query = CUCM_SQL_SEARCH_DEVICES_QUERY.render(
+        condition=search_condition(
+            criterion="Name",
+            value="SEP",
+            fields=["pkid", "name"],
+            conditions=[{"criterion": "Device Pool", "value": "HQ"}, {"criterion": "User ID", "value": "alice"}],
+        ),
+        fields=["pkid", "name"],
+    )
+    assert joins_of(sql_query) == ["dp", "eu"]
+    assert "LOWER(dp.name) LIKE '%hq%'" in sql_query
+    assert "LOWER(eu.userid) LIKE '%alice%'" in sql_query
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(CucmBadRequestError, match="Unknown fields"):
+        CUCM_SQL_SEARCH_DEVICES_QUERY.render(condition="1 = 1", fields=["pkid", "nope"])